@@ -0,0 +1,176 @@
+""" Buzzer fairness and arbitration under load: hundreds of simulated contestants on one machine.
+
+Each contestant gets a fixed one-way network delay each way (plus a little jitter) and a
+reaction time per clue. A round is judged correct when the server's winner is the
+contestant who really reacted first; the uncompensated first-to-arrive winner is shown
+for comparison. A few contestants buzz early each round and must be locked out, and one
+sends its press for the next clue ahead of time, which must be locked out too.
+
+The service runs in its own process, as it would on the host's computer, so the simulated
+contestants sharing one interpreter can't hold up its timestamps. Reading hundreds of open
+messages on one loop still delays some contestants by a few ms that a real device wouldn't
+see, so a round also counts as close when the winner reacted within that of the fastest.
+
+Run from the project root:  python -m benchmarks.bench_buzzer [contestants] [rounds]
+"""
+import sys
+import json
+import time
+import random
+import asyncio
+import statistics
+import multiprocessing
+from buzzer import BuzzerService, LOCKOUT_SECONDS, EARLY_TOLERANCE
+from message_server import encode_line
+
+CONTESTANTS = 300
+ROUNDS = 20
+ONE_WAY_DELAY_MS = (0, 40)
+JITTER_MS = 1
+REACTION_MS = (80, 400)
+EARLY_FRACTION = 0.05
+# Early contestants buzz this long before the clue opens, then press again quickly,
+# which must still fall inside their lockout
+EARLY_LEAD_MS = 60
+EARLY_REACTION_MS = (20, 60)
+CLOSE_MS = 5
+
+
+class SimulatedContestant:
+    def __init__(self, name, rng):
+        self.name = name
+        self.rng = rng
+        self.up = rng.uniform(*ONE_WAY_DELAY_MS) / 1000
+        self.down = rng.uniform(*ONE_WAY_DELAY_MS) / 1000
+        self.reaction = 0.0
+        self.early = False
+        self.writer = None
+        self.listener = None
+        self.next_send = 0.0
+        self.results = None
+
+    async def connect(self, port):
+        reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+        self.send({"type": "hello", "name": self.name})
+        self.listener = asyncio.get_running_loop().create_task(self.listen(reader))
+
+    def jitter(self):
+        return self.rng.uniform(0, JITTER_MS) / 1000
+
+    def send(self, message, delay=0.0):
+        # Messages on one link stay in order, as they would over TCP
+        loop = asyncio.get_running_loop()
+        self.next_send = max(self.next_send, loop.time() + delay + self.up + self.jitter())
+        loop.call_at(self.next_send, self.write, encode_line(message))
+
+    def write(self, data):
+        if not self.writer.is_closing():
+            self.writer.write(data)
+
+    async def listen(self, reader):
+        loop = asyncio.get_running_loop()
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            loop.call_later(self.down + self.jitter(), self.handle, json.loads(line))
+
+    def handle(self, message):
+        if message["type"] == "ping":
+            self.send({"type": "pong", "t": message["t"]})
+        elif message["type"] == "open":
+            self.send({"type": "buzz", "clue": message["clue"]}, self.reaction)
+        elif message["type"] == "result" and self.results is not None:
+            self.results.put_nowait(message)
+
+    def buzz_early(self, clue=None):
+        self.send({"type": "buzz", "clue": clue})
+
+
+def serve(commands):
+    """ The service's process: runs commands from the bench until told to stop. """
+    service = BuzzerService(0, "127.0.0.1")
+    commands.send(service.start())
+    while True:
+        command, *args = commands.recv()
+        if command == "stop":
+            break
+        getattr(service, command)(*args)
+    service.stop()
+
+
+async def run(contestant_count, rounds):
+    rng = random.Random(23)
+    commands, child = multiprocessing.Pipe()
+    process = multiprocessing.Process(target=serve, args=(child,), daemon=True)
+    process.start()
+    port = commands.recv()
+
+    contestants = [SimulatedContestant(f"sim-{i:03d}", rng) for i in range(contestant_count)]
+    results = contestants[0].results = asyncio.Queue()
+    await asyncio.gather(*(contestant.connect(port) for contestant in contestants))
+    # Let every contestant answer a few pings so its round trip is known
+    await asyncio.sleep(3.2)
+
+    correct = close = first_arrival_correct = locked_out = ahead_locked_out = 0
+    late_ms, behind_ms, first_arrival_behind_ms = [], [], []
+    for clue in range(1, rounds + 1):
+        for contestant in contestants:
+            contestant.early = rng.random() < EARLY_FRACTION
+            contestant.reaction = rng.uniform(*(EARLY_REACTION_MS if contestant.early else REACTION_MS)) / 1000
+        for contestant in contestants:
+            if contestant.early:
+                contestant.buzz_early()
+        await asyncio.sleep(EARLY_LEAD_MS / 1000 + max(ONE_WAY_DELAY_MS) / 1000)
+        # One contestant guesses the next clue number and presses just as it opens. A press
+        # landing within EARLY_TOLERANCE of when the open could have reached them looks
+        # like a very fast reaction, so the guesser is one whose open takes longer than that
+        guesser = rng.choice([contestant for contestant in contestants
+                              if not contestant.early and contestant.down > 2 * EARLY_TOLERANCE])
+        guesser.early = True
+        commands.send(("open", clue))
+        guesser.buzz_early(clue)
+
+        result = await asyncio.wait_for(results.get(), 5)
+        fair = [contestant for contestant in contestants if not contestant.early]
+        fastest = min(fair, key=lambda contestant: contestant.reaction)
+        first_to_arrive = min(fair, key=lambda contestant: contestant.down + contestant.reaction + contestant.up)
+        winner = next(contestant for contestant in contestants if contestant.name == result["winner"])
+
+        correct += winner is fastest
+        behind_ms.append((winner.reaction - fastest.reaction) * 1000)
+        close += behind_ms[-1] <= CLOSE_MS
+        first_arrival_correct += first_to_arrive is fastest
+        first_arrival_behind_ms.append((first_to_arrive.reaction - fastest.reaction) * 1000)
+        locked_out += not winner.early
+        ahead_locked_out += winner is not guesser
+        late_ms.append(result["late_ms"])
+
+        # Let the rest of the presses land before the next clue
+        await asyncio.sleep((max(REACTION_MS) + 2 * max(ONE_WAY_DELAY_MS)) / 1000)
+        commands.send(("close",))
+        await asyncio.sleep(LOCKOUT_SECONDS)
+
+    commands.send(("stop",))
+    process.join()
+    late_ms.sort()
+    print(f"{contestant_count} contestants, {rounds} clues, one-way delays {ONE_WAY_DELAY_MS[0]}-{ONE_WAY_DELAY_MS[1]} ms")
+    print(f"  fastest reaction won:           {correct}/{rounds} exactly, {close}/{rounds} within {CLOSE_MS} ms; "
+          f"winner on average {statistics.mean(behind_ms):.2f} ms slower than the fastest")
+    print(f"  without compensation:           {first_arrival_correct}/{rounds}, winner on average "
+          f"{statistics.mean(first_arrival_behind_ms):.2f} ms slower than the fastest")
+    print(f"  early buzzers kept out:         {locked_out}/{rounds}")
+    print(f"  presses sent ahead kept out:    {ahead_locked_out}/{rounds}")
+    print(f"  arbitration after the deadline: median {statistics.median(late_ms):.2f} ms, max {late_ms[-1]:.2f} ms")
+
+
+def main():
+    contestant_count = int(sys.argv[1]) if len(sys.argv) > 1 else CONTESTANTS
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else ROUNDS
+    started = time.perf_counter()
+    asyncio.run(run(contestant_count, rounds))
+    print(f"  total {time.perf_counter() - started:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+""" Clue search latency over a synthetic library of 1,000,000 clues.
+
+Run from the project root:  python -m benchmarks.bench_clue_index [clue count]
+"""
+import os
+import sys
+import time
+import random
+import tempfile
+from clue_index import ClueIndex
+
+CLUE_COUNT = 1_000_000
+CLUES_PER_BOARD = 30
+WORDS = ("river capital opera sitcom tequila president ocean island novel painter king queen "
+         "planet mountain desert jazz poet empire bridge canal volcano symphony senator treaty "
+         "glacier harbor monarch comet fossil pharaoh").split()
+QUERIES = ["tequila", "teq", "tequi", "river capital", "opera house", "pharaoh fossil comet", "zzzz", "s"]
+
+
+class NoCatalog:
+    """ The benchmark fills the index directly, so nothing is ever recorded. """
+
+    def add_listener(self, listener):
+        pass
+
+
+def fill(index, count):
+    rng = random.Random(11)
+    for board in range(count // CLUES_PER_BOARD):
+        categories = [" ".join(rng.sample(WORDS, 2)).upper() for _ in range(6)]
+        clues = [
+            ("board", i // 6, i % 6, categories[i % 6], " ".join(rng.choices(WORDS, k=12)) + f" {board}")
+            for i in range(CLUES_PER_BOARD)
+        ]
+        index.store("boards", f"/library/boards/board_{board:06d}.csv", 0.0, clues)
+    index.conn.commit()
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else CLUE_COUNT
+    with tempfile.TemporaryDirectory() as folder:
+        index = ClueIndex(os.path.join(folder, "clues.sqlite3"), catalog=NoCatalog())
+        started = time.perf_counter()
+        fill(index, count)
+        print(f"Indexed {index.clue_count()} clues in {time.perf_counter() - started:.1f} s")
+
+        print("Query -> top results, best of 5:")
+        for query in QUERIES:
+            samples = []
+            for _ in range(5):
+                started = time.perf_counter()
+                rows = index.search(query)
+                samples.append((time.perf_counter() - started) * 1000)
+            print(f"  {query!r:<24} {len(rows):4d} rows {min(samples):8.2f} ms")
+        index.conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+""" Click-to-clue image latency with and without the round prefetcher.
+
+Run from the project root:  QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_clue_latency
+"""
+import os
+import sys
+import time
+from PySide6.QtWidgets import QApplication, QLabel
+from PySide6.QtCore import Qt, QCoreApplication
+from PySide6.QtGui import QPixmap
+from ui.image_prefetch import ImagePrefetcher, IMAGE_EXTENSIONS
+from ui.media_cache import MediaCache, media_key
+from util import get_resource_path
+
+GAME_PATH = get_resource_path("data/games/07-13-2016")
+
+
+def sample_images():
+    images = []
+    for root, _, files in os.walk(GAME_PATH):
+        images += [os.path.join(root, f) for f in files if f.lower().endswith(IMAGE_EXTENSIONS)]
+    return sorted(images)
+
+
+def main():
+    app = QApplication(sys.argv)
+    label = QLabel()
+    images = sample_images()
+
+    print("Decode on click (old display_question path):")
+    for path in images:
+        started = time.perf_counter()
+        label.setPixmap(QPixmap(path).scaledToWidth(400, Qt.SmoothTransformation))
+        print(f"  {os.path.basename(path):<50} {(time.perf_counter() - started) * 1000:8.2f} ms")
+
+    prefetcher = ImagePrefetcher(MediaCache())
+    started = time.perf_counter()
+    prefetcher.prefetch([(media_key(path, 400), path) for path in images])
+    while not prefetcher.is_idle():
+        QCoreApplication.processEvents()
+    print(f"\nPrefetched {len(images)} images in the background in {(time.perf_counter() - started) * 1000:.2f} ms")
+
+    print("Swap in prefetched pixmap on click:")
+    for path in images:
+        started = time.perf_counter()
+        label.setPixmap(prefetcher.take(media_key(path, 400)))
+        print(f"  {os.path.basename(path):<50} {(time.perf_counter() - started) * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
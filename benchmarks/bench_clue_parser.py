@@ -0,0 +1,52 @@
+""" Compare clue_parser against the old eval() + regex path on a 10k-clue corpus.
+
+Run from the project root:  python -m benchmarks.bench_clue_parser
+"""
+import re
+import csv
+import random
+import timeit
+from clue_parser import parse_cell
+from util import get_resource_path
+
+CORPUS_SIZE = 10_000
+
+
+def legacy_parse(val):
+    # What PlayGamePage.load_game and display_question used to do for every clue
+    try:
+        q = eval(val) if val.strip().startswith('{') else {"question": val}
+    except:
+        q = {"question": val}
+    raw_text = q.get("question", "")
+    media = None
+    media_match = re.search(r"\[media:(.+?)\]", raw_text)
+    if media_match:
+        media = media_match.group(1)
+        raw_text = re.sub(r"\[media:.+?\]", "", raw_text).strip()
+    return raw_text, media
+
+
+def build_corpus():
+    with open(get_resource_path("data/games/07-13-2016/jeopardy.csv"), newline='', encoding='utf-8') as f:
+        cells = [cell for row in list(csv.reader(f))[1:] for cell in row]
+
+    rng = random.Random(0)
+    corpus = []
+    for i in range(CORPUS_SIZE):
+        cell = rng.choice(cells)
+        if i % 10 == 0:
+            cell = repr({"question": cell, "points": 400})
+        corpus.append(cell)
+    return corpus
+
+
+def main():
+    corpus = build_corpus()
+    for name, parse in [("eval + regex", legacy_parse), ("clue_parser", parse_cell)]:
+        best = min(timeit.repeat(lambda: [parse(cell) for cell in corpus], number=1, repeat=5))
+        print(f"{name:>14}: {best * 1000:8.2f} ms for {len(corpus)} clues")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+""" Final Jeopardy intake at audience scale: thousands of synthetic phone clients.
+
+Every client joins, wagers while the category is up (some wagers are out of range on
+purpose) and answers while the question is up, with some answers sent after the
+deadline. Reports acknowledgement latency, whether every entry was judged correctly
+and how long the batched writes took to reach SQLite.
+
+Run from the project root:  python -m benchmarks.bench_final_intake [clients]
+"""
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import sqlite3
+import tempfile
+import statistics
+from final_intake import IntakeService, IntakeStore
+from message_server import encode_line
+
+CLIENTS = 3000
+WAGER_WINDOW = 1.5
+RESPONSE_SECONDS = 2.0
+INVALID_WAGER_FRACTION = 0.1
+ANSWERS = ["What is the Nile?", "the nile", "What is the Amazon?", "Mississippi", "what is the yangtze"]
+
+
+class PhoneClient:
+    def __init__(self, name, score, rng):
+        self.name = name
+        self.score = score
+        self.rng = rng
+        self.writer = None
+        self.sent = {}  # kind -> time sent
+        self.latencies = []
+        self.outcomes = {}  # kind -> "accepted" or "rejected"
+        self.expected_wager = None
+        self.welcomed = asyncio.Event()
+
+    async def connect(self, port):
+        reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+        self.writer.write(encode_line({"type": "hello", "name": self.name}))
+        asyncio.get_running_loop().create_task(self.listen(reader))
+
+    async def listen(self, reader):
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            message = json.loads(line)
+            kind = message.get("type")
+            if kind == "welcome":
+                self.welcomed.set()
+            elif kind in ("accepted", "rejected") and message.get("kind") in self.sent:
+                self.latencies.append(time.monotonic() - self.sent[message["kind"]])
+                self.outcomes[message["kind"]] = kind
+
+    def send(self, kind, message):
+        self.sent[kind] = time.monotonic()
+        self.writer.write(encode_line(message))
+
+    async def wager(self):
+        await asyncio.sleep(self.rng.uniform(0, WAGER_WINDOW * 0.8))
+        limit = max(self.score, 0)
+        if self.rng.random() < INVALID_WAGER_FRACTION:
+            amount = self.rng.choice([limit + 1, -100, "all of it"])
+            self.expected_wager = "rejected"
+        else:
+            amount = self.rng.randint(0, limit)
+            self.expected_wager = "accepted"
+        self.send("wager", {"type": "wager", "amount": amount})
+
+    async def respond(self):
+        await asyncio.sleep(self.rng.uniform(0, RESPONSE_SECONDS * 1.25))
+        self.send("response", {"type": "response", "text": self.rng.choice(ANSWERS)})
+
+
+async def run(client_count, db_path):
+    rng = random.Random(24)
+    loop = asyncio.get_running_loop()
+    tallies = []
+    clients = [PhoneClient(f"phone-{i:05d}", rng.randint(-2000, 30000), rng) for i in range(client_count)]
+    service = IntakeService(
+        0, "127.0.0.1", standings={client.name: client.score for client in clients},
+        on_tally=lambda tally: loop.call_soon_threadsafe(tallies.append, tally), store=IntakeStore(db_path),
+    )
+    port = service.start()
+
+    started = time.perf_counter()
+    for start in range(0, client_count, 500):
+        await asyncio.gather(*(client.connect(port) for client in clients[start:start + 500]))
+    await asyncio.gather(*(client.welcomed.wait() for client in clients))
+    print(f"{client_count} clients joined in {time.perf_counter() - started:.2f} s")
+
+    service.open_wagers("RIVERS")
+    await asyncio.sleep(0.05)
+    await asyncio.gather(*(client.wager() for client in clients))
+    await asyncio.sleep(WAGER_WINDOW * 0.2)
+
+    service.open_responses("It's the longest river in Africa", RESPONSE_SECONDS)
+    await asyncio.sleep(0.05)
+    # Same process, same monotonic clock: judge every response against the server's own deadline
+    deadline = service.server.deadline
+    await asyncio.gather(*(client.respond() for client in clients))
+    await asyncio.sleep(0.5)
+
+    accepted = sum(outcome == "accepted" for client in clients for outcome in client.outcomes.values())
+    flushed = time.perf_counter()
+    while not tallies or tallies[-1]["stored"] < accepted:
+        if time.perf_counter() - flushed > 10:
+            break
+        await asyncio.sleep(0.01)
+    service.stop()
+
+    misjudged_wagers = sum(client.outcomes.get("wager") != client.expected_wager for client in clients)
+    late = [client for client in clients if client.sent["response"] > deadline]
+    late_accepted = sum(client.outcomes.get("response") == "accepted" for client in late)
+    # Sent in time but still on its way (or queued behind other clients) at the cut
+    in_transit = [
+        (deadline - client.sent["response"]) * 1000 for client in clients
+        if client.sent["response"] <= deadline and client.outcomes.get("response") == "rejected"
+    ]
+    unanswered = sum(len(client.outcomes) < len(client.sent) for client in clients)
+    latencies = sorted(latency * 1000 for client in clients for latency in client.latencies)
+
+    conn = sqlite3.connect(db_path)
+    wagers, responses = conn.execute("SELECT COUNT(wager), COUNT(response) FROM entries").fetchone()
+    conn.close()
+    accepted_wagers = sum(client.outcomes.get("wager") == "accepted" for client in clients)
+    accepted_responses = sum(client.outcomes.get("response") == "accepted" for client in clients)
+    final = tallies[-1]
+
+    print(f"  acknowledgements: median {statistics.median(latencies):.2f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)]:.2f} ms, max {latencies[-1]:.2f} ms")
+    print(f"  wagers misjudged: {misjudged_wagers}, late responses accepted: {late_accepted}/{len(late)}, "
+          f"unanswered: {unanswered}")
+    print(f"  responses cut off in transit: {len(in_transit)}"
+          + (f", sent at most {max(in_transit):.1f} ms before the deadline" if in_transit else ""))
+    print(f"  stored: {wagers}/{accepted_wagers} wagers, {responses}/{accepted_responses} responses")
+    print(f"  tally: {len(tallies)} updates, top answers {final['top'][:3]}")
+
+
+def main():
+    client_count = int(sys.argv[1]) if len(sys.argv) > 1 else CLIENTS
+    with tempfile.TemporaryDirectory() as folder:
+        asyncio.run(run(client_count, os.path.join(folder, "final_intake.sqlite3")))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+""" Picker responsiveness: loading and filtering a LibraryModel of 100,000 synthetic entries.
+
+The filter is timed on a model no view is attached to, so that figure is the filter alone.
+The same keystrokes are then applied to a model shown in a QListView, and the view's
+reset (the rest of apply_filter there) and the layout and paint that follow are reported
+separately.
+
+Run from the project root:  QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_library_filter
+"""
+import sys
+import time
+import random
+from PySide6.QtWidgets import QApplication, QListView
+from ui.library_list import LibraryModel
+
+ENTRY_COUNT = 100_000
+WORDS = ["history", "science", "potent", "potables", "rivers", "world", "capitals", "opera",
+         "sports", "before", "after", "rhyme", "time", "literature", "presidents", "animals"]
+# Typed one character at a time, then erased, then a second word, then a typo that
+# matches nothing (the filter has to scan every entry)
+KEYSTROKES = ["p", "po", "pot", "pota", "potab", "pota", "pot", "po", "p", "", "r", "ri", "riv", "rivx"]
+
+
+def synthetic_entries(count):
+    rng = random.Random(7)
+    entries = []
+    for i in range(count):
+        name = f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{i:06d}.csv"
+        categories = [" ".join(rng.sample(WORDS, 2)).title() for _ in range(6)]
+        entries.append((f"/library/boards/{name}", name, categories))
+    return entries
+
+
+def main():
+    app = QApplication(sys.argv)
+    entries = synthetic_entries(ENTRY_COUNT)
+
+    # The filter alone: nothing is listening to the model's reset signals
+    bare = LibraryModel()
+    started = time.perf_counter()
+    bare.set_entries(entries)
+    load_ms = (time.perf_counter() - started) * 1000
+    filter_ms = []
+    for text in KEYSTROKES:
+        started = time.perf_counter()
+        bare.apply_filter(text)
+        filter_ms.append((time.perf_counter() - started) * 1000)
+
+    model = LibraryModel()
+    view = QListView()
+    view.setUniformItemSizes(True)
+    view.setModel(model)
+    view.resize(600, 800)
+    view.show()
+
+    model.set_entries(entries)
+    started = time.perf_counter()
+    app.processEvents()
+    view.grab()
+    print(f"Load {ENTRY_COUNT} entries: {load_ms:8.2f} ms, first paint {(time.perf_counter() - started) * 1000:8.2f} ms")
+
+    print("Keystroke -> filter, view reset, layout and paint:")
+    for text, filtered in zip(KEYSTROKES, filter_ms):
+        started = time.perf_counter()
+        model.apply_filter(text)
+        reset = (time.perf_counter() - started) * 1000 - filtered
+        started = time.perf_counter()
+        app.processEvents()
+        view.grab()
+        painted = (time.perf_counter() - started) * 1000
+        print(f"  {text!r:<10} {model.rowCount():4d} rows loaded  "
+              f"filter {filtered:7.2f} ms  reset {max(reset, 0):7.2f} ms  paint {painted:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+""" Round-start time: rebuilding the board widgets vs. reusing one BoardView.
+
+Run from the project root:  QT_QPA_PLATFORM=offscreen python -m benchmarks.bench_round_start
+"""
+import sys
+import time
+from PySide6.QtWidgets import QApplication, QWidget, QGridLayout, QLabel, QPushButton
+from PySide6.QtCore import Qt
+from game_cache import parse_game
+from ui.board_view import BoardView, BOARD_STYLESHEET
+from util import get_resource_path
+
+GAME_PATH = get_resource_path("data/games/07-13-2016")
+ROUND_STARTS = 50
+
+
+def legacy_build(board_layout, board):
+    """ The old build_board: drop every cell, then create and style 36 new ones. """
+    for i in reversed(range(board_layout.count())):
+        widget = board_layout.itemAt(i).widget()
+        if widget:
+            widget.setParent(None)
+
+    for col, category in enumerate(board.categories):
+        label = QLabel(category)
+        label.setAlignment(Qt.AlignCenter)
+        label.setWordWrap(True)
+        label.setFixedSize(160, 80)
+        label.setStyleSheet("""
+            font-size: 18px;
+            color: white;
+            padding: 6px;
+            border: 2px solid #ffffff;
+            background-color: #000099;
+        """)
+        board_layout.addWidget(label, 0, col)
+
+    for row in range(board.rows):
+        for col in range(board.cols):
+            if board.clue(row, col) is not None:
+                btn = QPushButton(f"${board.values[row]}")
+                btn.setFixedSize(160, 80)
+                btn.setStyleSheet("""
+                    QPushButton {
+                        background-color: #0000cc;
+                        color: gold;
+                        font-size: 20px;
+                        font-weight: bold;
+                        border: 2px solid white;
+                    }
+                    QPushButton:hover {
+                        background-color: #0000ff;
+                    }
+                    QPushButton:disabled {
+                        background-color: #222;
+                        color: #888;
+                        border: 2px solid gray;
+                    }
+                """)
+                board_layout.addWidget(btn, row + 1, col)
+            else:
+                spacer = QLabel("")
+                spacer.setFixedSize(160, 80)
+                board_layout.addWidget(spacer, row + 1, col)
+
+
+def time_round_starts(widget, start_round, rounds):
+    widget.show()
+    samples = []
+    for i in range(ROUND_STARTS):
+        board = rounds[i % len(rounds)]
+        started = time.perf_counter()
+        start_round(board)
+        # Include polish, layout and one paint, which is where restyling costs show up
+        QApplication.processEvents()
+        widget.grab()
+        samples.append((time.perf_counter() - started) * 1000)
+    widget.hide()
+    samples.sort()
+    return sum(samples) / len(samples), samples[len(samples) // 2], samples[-1]
+
+
+def main():
+    app = QApplication(sys.argv)
+    round_names, round_data, _ = parse_game(GAME_PATH)
+    rounds = [round_data[name] for name in round_names if name != "final"]
+
+    legacy = QWidget()
+    legacy.setStyleSheet("background-color: #060CE9;")
+    legacy_layout = QGridLayout(legacy)
+
+    def legacy_start(board):
+        legacy_build(legacy_layout, board)
+
+    view = BoardView()
+    view.setStyleSheet("QWidget { background-color: #060CE9; }" + BOARD_STYLESHEET)
+
+    print(f"{ROUND_STARTS} round starts, mean / median / max:")
+    for name, widget, start_round in (("Rebuild every cell", legacy, legacy_start), ("Reuse BoardView", view, view.show_round)):
+        mean, median, worst = time_round_starts(widget, start_round, rounds)
+        print(f"  {name:<20} {mean:8.2f} ms {median:8.2f} ms {worst:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
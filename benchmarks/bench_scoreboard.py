@@ -0,0 +1,148 @@
+""" Scoreboard fan-out: a fast-forwarded game mirrored to a thousand lobby displays.
+
+The publisher plays the sample game's rounds much faster than any host would (every
+pick publishes the used cell, the clue, the return to the board and a score change),
+while some displays join part-way through and start from a snapshot. Every display
+must end up with exactly the server's state. Reports how many events were coalesced
+into each frame, bytes sent per display and publish-to-display latency.
+
+Run from the project root:  python -m benchmarks.bench_scoreboard [displays]
+"""
+import sys
+import json
+import time
+import random
+import asyncio
+import statistics
+from game_cache import parse_game
+from scoreboard import ScoreboardService, round_event
+from message_server import encode_line
+from util import get_resource_path
+
+DISPLAYS = 1000
+LATE_FRACTION = 0.2
+PICKS_PER_SECOND = 60
+GAME_PATH = get_resource_path("data/games/07-13-2016")
+
+
+class Display:
+    def __init__(self):
+        self.round = None
+        self.used = set()
+        self.clue = None
+        self.scores = {}
+        self.received_bytes = 0
+        self.messages = 0
+        self.latencies = []
+        self.probe_times = None
+        self.writer = None
+        self.listener = None  # keeps the task alive; the loop only holds it weakly
+        self.ready = asyncio.Event()
+
+    async def connect(self, port, probe_times):
+        self.probe_times = probe_times
+        reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+        self.writer.write(encode_line({"type": "hello"}))
+        self.listener = asyncio.get_running_loop().create_task(self.listen(reader))
+
+    async def listen(self, reader):
+        while True:
+            line = await reader.readline()
+            if not line:
+                return
+            self.received_bytes += len(line)
+            self.messages += 1
+            self.apply(json.loads(line))
+            self.ready.set()
+
+    def apply(self, message):
+        if "round" in message:
+            self.round = message["round"]
+            self.used = set()
+        if "used" in message:
+            self.used.update(message["used"])
+        if "clue" in message:
+            self.clue = message["clue"]
+        if "scores" in message:
+            self.scores.update(message["scores"])
+            probe = message["scores"].get("probe")
+            if probe is not None and message["type"] == "delta":
+                self.latencies.append(time.monotonic() - self.probe_times[probe])
+
+
+async def run(display_count):
+    rng = random.Random(25)
+    rounds, round_data, _ = parse_game(GAME_PATH)
+    service = ScoreboardService(0, "127.0.0.1")
+    port = service.start()
+    probe_times = {}
+
+    displays = [Display() for _ in range(display_count)]
+    late = displays[:int(display_count * LATE_FRACTION)]
+    early = displays[len(late):]
+    for start in range(0, len(early), 500):
+        await asyncio.gather(*(display.connect(port, probe_times) for display in early[start:start + 500]))
+    await asyncio.gather(*(display.ready.wait() for display in early))
+
+    events = 0
+    started = time.perf_counter()
+    scores = {"Alice": 0, "Bob": 0, "Carol": 0}
+    for round_name in rounds:
+        if round_name == "final":
+            service.publish({"round": round_event(round_name, None)})
+            events += 1
+            continue
+        board = round_data[round_name]
+        service.publish({"round": round_event(round_name, board)})
+        events += 1
+        picks = [i for i in range(len(board)) if board.has_clue(i)]
+        rng.shuffle(picks)
+        for number, index in enumerate(picks):
+            clue = board.clues[index]
+            player = rng.choice(list(scores))
+            scores[player] += board.value(index) * rng.choice((1, -1))
+            probe = len(probe_times)
+            probe_times[probe] = time.monotonic()
+            service.publish({"used": [index]})
+            service.publish({"clue": {"index": index, "text": clue.text, "value": board.value(index)}})
+            service.publish({"clue": None})
+            service.publish({"scores": {player: scores[player], "probe": probe}})
+            events += 4
+            # Late displays join part-way through the first round
+            if round_name == rounds[0] and number == len(picks) // 2:
+                joining = asyncio.get_running_loop().create_task(join_late(late, port, probe_times))
+            await asyncio.sleep(1 / PICKS_PER_SECOND)
+    elapsed = time.perf_counter() - started
+
+    await joining
+    await asyncio.gather(*(display.ready.wait() for display in late))
+    await asyncio.sleep(0.5)
+    server = service.server
+    frames = server.frames
+    expected = (server.round, server.used, server.clue, server.scores)
+    service.stop()
+    for display in displays:
+        display.writer.close()
+    await asyncio.gather(*(display.listener for display in displays), return_exceptions=True)
+
+    mismatched = sum((display.round, display.used, display.clue, display.scores) != expected for display in displays)
+    latencies = sorted(latency * 1000 for display in displays for latency in display.latencies)
+    per_display = statistics.mean(display.received_bytes for display in displays)
+    print(f"{display_count} displays ({len(late)} joined late), {events} events in {elapsed:.1f} s")
+    print(f"  frames sent: {frames} ({events / frames:.1f} events per frame), "
+          f"{per_display / 1024:.1f} KiB per display")
+    print(f"  publish to display: median {statistics.median(latencies):.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)]:.1f} ms")
+    print(f"  displays out of sync at the end: {mismatched}")
+
+
+async def join_late(late, port, probe_times):
+    await asyncio.gather(*(display.connect(port, probe_times) for display in late))
+
+
+def main():
+    asyncio.run(run(int(sys.argv[1]) if len(sys.argv) > 1 else DISPLAYS))
+
+
+if __name__ == "__main__":
+    main()
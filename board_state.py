@@ -0,0 +1,137 @@
+from clue_parser import parse_rows
+
+DEFAULT_ROWS = 5
+DEFAULT_COLUMNS = 6
+MAX_ROWS = 15
+MAX_COLUMNS = 20
+
+# Boards whose value ladder isn't the standard $200 steps store it in a
+# leading row, e.g. "#values,100,300,500"; standard boards are written
+# exactly as before. Dimensions come from the category row and row count.
+VALUES_MARKER = "#values"
+
+
+def default_values(rows=DEFAULT_ROWS, multiplier=1):
+    return [(row + 1) * 200 * multiplier for row in range(rows)]
+
+
+class BoardState:
+    """ One round's board as flat per-cell arrays indexed by row * cols + col.
+
+    clues holds a Clue (or None for an empty cell) and used whether it has been
+    played. Columns are addressed by position, so two categories may share a name.
+    """
+
+    __slots__ = ("rows", "cols", "categories", "values", "clues", "used")
+
+    def __init__(self, categories, rows=DEFAULT_ROWS, values=None):
+        self.rows = rows
+        self.cols = len(categories)
+        self.categories = list(categories)
+        self.values = list(values) if values is not None else default_values(rows)
+        size = rows * self.cols
+        self.clues = [None] * size
+        self.used = bytearray(size)
+
+    @classmethod
+    def from_rows(cls, categories, clue_rows, values=None):
+        """ Build a board from parsed CSV rows; cells past the end of a short row stay empty. """
+        board = cls(categories, len(clue_rows), values)
+        for row, clues in enumerate(clue_rows):
+            for col, clue in enumerate(clues[:board.cols]):
+                board.clues[row * board.cols + col] = clue
+        return board
+
+    # Used flags belong to one playthrough, so they aren't pickled with the clues
+    def __getstate__(self):
+        return (self.rows, self.categories, self.values, self.clues)
+
+    def __setstate__(self, state):
+        self.rows, self.categories, self.values, self.clues = state
+        self.cols = len(self.categories)
+        self.used = bytearray(len(self.clues))
+
+    def __len__(self):
+        return len(self.clues)
+
+    def index(self, row, col):
+        return row * self.cols + col
+
+    def position(self, index):
+        """ (row, col) of a cell index. """
+        return divmod(index, self.cols)
+
+    def clue(self, row, col):
+        return self.clues[row * self.cols + col]
+
+    def value(self, index):
+        return self.values[index // self.cols]
+
+    def has_clue(self, index):
+        return self.clues[index] is not None
+
+    def clue_count(self):
+        return len(self.clues) - self.clues.count(None)
+
+    def available(self):
+        """ Indices of cells with a clue that hasn't been played. """
+        return [i for i, clue in enumerate(self.clues) if clue is not None and not self.used[i]]
+
+    def mark_used(self, index):
+        self.used[index] = 1
+
+    def is_used(self, index):
+        return bool(self.used[index])
+
+    def reset(self):
+        """ Clear the used flags, e.g. when the same game is played again. """
+        self.used = bytearray(len(self.clues))
+
+    def resize(self, rows, cols, category="Category"):
+        """ Change the board's dimensions, keeping every clue that still fits. """
+        clues = [None] * (rows * cols)
+        for row in range(min(rows, self.rows)):
+            for col in range(min(cols, self.cols)):
+                clues[row * cols + col] = self.clues[row * self.cols + col]
+        self.categories = self.categories[:cols] + [category] * (cols - self.cols)
+        self.values = self.values[:rows] + default_values(rows)[self.rows:]
+        self.rows, self.cols = rows, cols
+        self.clues = clues
+        self.used = bytearray(len(clues))
+
+
+def split_values_row(rows):
+    """ Return (value ladder or None, remaining rows) for a board CSV. """
+    if rows and rows[0] and rows[0][0].strip() == VALUES_MARKER:
+        values = []
+        for cell in rows[0][1:]:
+            try:
+                values.append(int(cell))
+            except ValueError:
+                break
+        return values, rows[1:]
+    return None, rows
+
+
+def board_from_rows(rows, multiplier=1):
+    """ Build a BoardState from a board CSV, scaling its values by multiplier (2 for Double Jeopardy). """
+    values, rows = split_values_row(rows)
+    categories, clue_rows = parse_rows(rows)
+    ladder = default_values(len(clue_rows))
+    if values:
+        ladder = values[:len(clue_rows)] + ladder[len(values):]
+    return BoardState.from_rows(categories, clue_rows, [value * multiplier for value in ladder])
+
+
+def board_to_rows(board, cell_text):
+    """ CSV rows for a board; cell_text(clue) gives the text written for each non-empty cell. """
+    rows = []
+    if board.values != default_values(board.rows):
+        rows.append([VALUES_MARKER] + [str(value) for value in board.values])
+    rows.append(list(board.categories))
+    for row in range(board.rows):
+        rows.append([
+            cell_text(clue) if clue is not None else ""
+            for clue in board.clues[row * board.cols:(row + 1) * board.cols]
+        ])
+    return rows
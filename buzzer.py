@@ -0,0 +1,235 @@
+import time
+import random
+import secrets
+import asyncio
+from collections import deque
+from message_server import MessageServer, Service, Encoded
+
+# Remote buzzers. Contestants connect over TCP (one JSON object per line) or a WebSocket:
+#   -> {"type": "hello", "name": "Alice"}        <- {"type": "welcome", "name": "Alice", "token": ..., "open": false}
+#   <- {"type": "ping", "t": ...}                -> {"type": "pong", "t": <the same t>}
+#   <- {"type": "open", "clue": 7}               -> {"type": "buzz", "clue": 7}
+#   <- {"type": "result", "clue": 7, "winner": "Alice", ...}  or  {"type": "closed"}
+# Names are unique, since winners are locked out of a reopened clue by name. Until it says
+# hello a connection plays as "Player N"; the first hello with a name owns it, and coming
+# back after a dropped connection takes the same name and the token from the welcome
+# (the old connection, if still open, is closed). Any other claim gets
+# {"type": "rejected", "reason": ...} and keeps its current name.
+# A buzz is timed when its bytes arrive and moved back by the contestant's measured
+# round trip, so a contestant on a slow link isn't beaten by one on a fast link who
+# reacted later. Buzzing before the clue is open locks that contestant out for
+# LOCKOUT_SECONDS, as on the show. That covers a buzz without the open clue's number
+# and one that arrives sooner than the contestant could have seen the open clue, e.g.
+# a press sent ahead for the next clue number. Only pongs that answer a ping the server
+# sent, and hasn't had answered yet, count towards the round trip. Each contestant is
+# pinged on its own jittered timer rather than all at once, so hundreds of pongs don't
+# queue behind each other and inflate the round trips they measure.
+DEFAULT_PORT = 8765
+PING_INTERVAL = 1.0
+RTT_SAMPLES = 8
+# A contestant's round trip counts for at most this much, so delaying pongs on purpose
+# can't buy more than a fixed head start; it's also the longest the winner can wait on
+MAX_COMPENSATION = 0.1
+LOCKOUT_SECONDS = 0.25
+MAX_NAME_CHARS = 40
+# How far a press may seem to come before the open reached the contestant and still
+# count, to allow for jitter on the link; anything earlier was sent blind
+EARLY_TOLERANCE = 0.005
+# Pings older than this many intervals are no longer answerable
+OUTSTANDING_PINGS = 4
+
+
+class Contestant:
+    __slots__ = ("name", "rtts", "pings", "ping_handle", "opened_at", "locked_until")
+
+    def __init__(self, name):
+        self.name = name
+        self.rtts = deque(maxlen=RTT_SAMPLES)
+        self.pings = deque(maxlen=OUTSTANDING_PINGS)  # times of pings sent and not yet answered
+        self.ping_handle = None
+        self.opened_at = None  # when the current clue's open message was written to this contestant
+        self.locked_until = 0.0
+
+    def rtt(self):
+        """ Best recent round trip: queueing only ever adds delay, so the minimum is the link itself. """
+        return min(min(self.rtts), MAX_COMPENSATION) if self.rtts else 0.0
+
+
+class BuzzerServer(MessageServer):
+    """ Opens and closes buzzing for a clue and picks the fairest winner.
+
+    open() and close() must be called on the server's loop (ServerThread.call does that).
+    on_result(result) is called on the loop once a winner is decided.
+    """
+
+    def __init__(self, on_result=None):
+        super().__init__()
+        self.on_result = on_result
+        self.clue = None
+        self.excluded = set()
+        self.presses = 0
+        self.best = None  # (reaction, arrival order, connection) of the fastest press so far
+        self.seen_by = 0.0  # by when every contestant had seen the open clue, allowing for their trip
+        self.deadline = None
+        self.decide_handle = None
+        self.joined = 0
+        self.tokens = {}  # contestant name -> token of the connection that claimed it
+
+    def ping(self, connection):
+        contestant = connection.state
+        if contestant.ping_handle is not None:
+            contestant.ping_handle.cancel()
+        sent = time.monotonic()
+        contestant.pings.append(sent)
+        connection.send({"type": "ping", "t": sent})
+        contestant.ping_handle = asyncio.get_running_loop().call_later(
+            PING_INTERVAL * random.uniform(0.5, 1.5), self.ping, connection)
+
+    def on_connect(self, connection):
+        self.joined += 1
+        connection.state = Contestant(f"Player {self.joined}")
+        self.tokens[connection.state.name] = secrets.token_urlsafe(16)
+
+    def on_disconnect(self, connection):
+        if connection.state.ping_handle is not None:
+            connection.state.ping_handle.cancel()
+
+    def on_message(self, connection, message, received):
+        kind = message.get("type")
+        if kind == "buzz":
+            self.buzz(connection, message.get("clue"), received)
+        elif kind == "pong":
+            self.pong(connection.state, message.get("t"), received)
+        elif kind == "hello":
+            self.hello(connection, str(message.get("name", "")).strip()[:MAX_NAME_CHARS], message.get("token"))
+
+    def hello(self, connection, name, token):
+        contestant = connection.state
+        if name and name != contestant.name:
+            claimed = self.tokens.get(name)
+            if claimed is None:
+                self.tokens[name] = secrets.token_urlsafe(16)
+            elif token != claimed:
+                connection.send({"type": "rejected", "reason": "That name is already taken."})
+                return
+            for other in list(self.connections):
+                if other is not connection and other.state.name == name:
+                    other.close()
+            contestant.name = name
+        connection.send({
+            "type": "welcome", "name": contestant.name, "token": self.tokens[contestant.name],
+            "open": self.clue is not None,
+        })
+        self.ping(connection)
+        if self.clue is not None and not self.presses:
+            connection.send({"type": "open", "clue": self.clue})
+            contestant.opened_at = time.monotonic()
+            self.seen_by = max(self.seen_by, contestant.opened_at + contestant.rtt())
+
+    def pong(self, contestant, sent, received):
+        # A made-up or replayed t would let a client pick its own round trip
+        if sent not in contestant.pings:
+            return
+        contestant.pings.remove(sent)
+        contestant.rtts.append(received - sent)
+
+    def contestants(self):
+        return [connection.state.name for connection in self.connections]
+
+    def open(self, clue, exclude=()):
+        """ Start taking buzzes for clue. Contestants named in exclude (e.g. a wrong answer) sit it out. """
+        self.cancel_decision()
+        self.clue = clue
+        self.excluded = set(exclude)
+        self.presses = 0
+        self.best = None
+        encoded = Encoded({"type": "open", "clue": clue})
+        self.seen_by = 0.0
+        # Timed per contestant: writing to hundreds of sockets takes long enough to matter
+        for connection in list(self.connections):
+            connection.send_encoded(encoded)
+            contestant = connection.state
+            contestant.opened_at = time.monotonic()
+            self.seen_by = max(self.seen_by, contestant.opened_at + contestant.rtt())
+
+    def close(self):
+        if self.clue is None:
+            return
+        self.cancel_decision()
+        self.clue = None
+        self.broadcast({"type": "closed"})
+
+    def cancel_decision(self):
+        if self.decide_handle is not None:
+            self.decide_handle.cancel()
+            self.decide_handle = None
+        self.deadline = None
+
+    def buzz(self, connection, clue, received):
+        contestant = connection.state
+        rtt = contestant.rtt()
+        pressed = received - rtt / 2
+
+        if self.clue is None or clue != self.clue or contestant.opened_at is None:
+            # Early: the contestant hadn't seen this clue open when they pressed
+            self.lock_out(connection, pressed)
+            return
+        if self.deadline is None and self.presses:
+            return  # already decided
+        if contestant.name in self.excluded or pressed < contestant.locked_until:
+            return
+
+        # Time from the open reaching the contestant to their press reaching us, less the trip
+        reaction = received - contestant.opened_at - rtt
+        if reaction < -EARLY_TOLERANCE:
+            # Sent before the open could have reached them
+            self.lock_out(connection, pressed)
+            return
+        reaction = max(reaction, 0.0)
+        press = (reaction, self.presses, connection)
+        self.presses += 1
+        if self.best is not None and press[:2] >= self.best[:2]:
+            return
+        self.best = press
+
+        # Nobody can still beat the best press once every contestant's compensation has run out
+        deadline = self.seen_by + reaction
+        if self.deadline is None or deadline < self.deadline:
+            self.cancel_decision()
+            self.deadline = deadline
+            loop = asyncio.get_running_loop()
+            self.decide_handle = loop.call_at(loop.time() + max(deadline - time.monotonic(), 0.0), self.decide)
+
+    def lock_out(self, connection, pressed):
+        connection.state.locked_until = pressed + LOCKOUT_SECONDS
+        connection.send({"type": "locked", "seconds": LOCKOUT_SECONDS})
+
+    def decide(self):
+        decided = time.monotonic()
+        self.decide_handle = None
+        reaction, _, connection = self.best
+        result = {
+            "type": "result",
+            "clue": self.clue,
+            "winner": connection.state.name,
+            "reaction_ms": round(reaction * 1000, 1),
+            "presses": self.presses,
+            "late_ms": round((decided - self.deadline) * 1000, 2),
+        }
+        self.deadline = None
+        self.broadcast(result)
+        if self.on_result is not None:
+            self.on_result(result)
+
+
+class BuzzerService(Service):
+    default_port = DEFAULT_PORT
+
+    def __init__(self, port=None, host="0.0.0.0", on_result=None):
+        super().__init__(BuzzerServer(on_result), port, host)
+
+    def open(self, clue, exclude=()):
+        self.call(self.server.open, clue, tuple(exclude))
+
+    def close(self):
+        self.call(self.server.close)
@@ -0,0 +1,221 @@
+import os
+import csv
+import json
+import sqlite3
+from util import get_user_data_path
+from util import get_resource_path
+from media_store import MEDIA_TAG, resolve_media
+from game_pack import GamePack, is_game_pack
+from board_state import split_values_row
+
+# The catalog remembers every board, final and game in the library so the
+# selector pages don't have to list and stat the data folders each time
+# they're shown. A folder is only re-listed when its mtime changes, and only
+# the entries whose own mtime changed are re-read.
+CATALOG_VERSION = 1
+KINDS = ("boards", "finals", "games")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    name TEXT NOT NULL,
+    mtime REAL NOT NULL,
+    categories TEXT NOT NULL,
+    clue_count INTEGER NOT NULL,
+    media_size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_kind_name ON entries (kind, name);
+CREATE INDEX IF NOT EXISTS entries_folder ON entries (folder);
+CREATE TABLE IF NOT EXISTS folders (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL
+);
+"""
+
+
+def source_folders(kind):
+    if kind == "games":
+        return [get_resource_path("data/games"), get_user_data_path("games")]
+    return [get_user_data_path(kind)]
+
+
+def is_entry(kind, path):
+    # Hidden names are saves still being written
+    if os.path.basename(path).startswith("."):
+        return False
+    if kind == "games":
+        return os.path.isdir(path) or is_game_pack(path)
+    return path.endswith(".csv") and os.path.isfile(path)
+
+
+def _read_csv(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return list(csv.reader(f))
+
+
+def _summarize_rows(rows, media_folder):
+    """ Return (categories, clue_count, media_size) for one round's CSV rows. """
+    _, rows = split_values_row(rows)
+    categories = [title.strip() for title in rows[0]] if rows else []
+    clue_count = 0
+    media_size = 0
+    for row in rows[1:]:
+        for cell in row:
+            if not cell.strip():
+                continue
+            clue_count += 1
+            for name in MEDIA_TAG.findall(cell):
+                media_path = resolve_media(name, media_folder)
+                if media_path:
+                    media_size += os.path.getsize(media_path)
+    return categories, clue_count, media_size
+
+
+def entry_rounds(kind, path):
+    """ Yield (round_name, rows, media_folder) for each round of one library entry. A board or final is one round. """
+    if kind != "games":
+        yield kind[:-1], _read_csv(path), os.path.splitext(path)[0]
+        return
+
+    if is_game_pack(path):
+        pack = GamePack(path)
+        try:
+            for round_name in pack.rounds:
+                if pack.has_round(round_name):
+                    yield round_name, pack.round_rows(round_name), None
+        finally:
+            pack.close()
+        return
+
+    order_file = os.path.join(path, "order.csv")
+    if not os.path.exists(order_file):
+        return
+    for row in _read_csv(order_file):
+        if not row:
+            continue
+        round_name = row[0].replace('.csv', '')
+        round_file = os.path.join(path, f"{round_name}.csv")
+        if os.path.exists(round_file):
+            yield round_name, _read_csv(round_file), os.path.join(path, round_name)
+
+
+def summarize(kind, path):
+    """ Read the catalog metadata (categories, clue_count, media_size) for one library entry. """
+    categories, clue_count, media_size = [], 0, 0
+    for _, rows, media_folder in entry_rounds(kind, path):
+        round_categories, round_clues, round_media = _summarize_rows(rows, media_folder)
+        categories += round_categories
+        clue_count += round_clues
+        media_size += round_media
+
+    if kind == "games" and is_game_pack(path):
+        # Pack media lives inside the pack, not in a media folder
+        pack = GamePack(path)
+        try:
+            media_size = sum(span[1] for media in pack.index["media"].values() for span in media.values())
+        finally:
+            pack.close()
+    return categories, clue_count, media_size
+
+
+class LibraryCatalog:
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(get_user_data_path("cache"), "catalog.sqlite3")
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != CATALOG_VERSION:
+            self.conn.executescript("DROP TABLE IF EXISTS entries; DROP TABLE IF EXISTS folders;")
+            self.conn.execute(f"PRAGMA user_version = {CATALOG_VERSION}")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        self.listeners = []
+
+    def sync(self, kind):
+        """ Bring the catalog up to date for one kind, re-reading only folders and entries whose mtime changed. """
+        for folder in source_folders(kind):
+            self._sync_folder(kind, folder)
+        self.conn.commit()
+
+    def _sync_folder(self, kind, folder):
+        try:
+            folder_mtime = os.stat(folder).st_mtime
+        except OSError:
+            self.conn.execute("DELETE FROM entries WHERE kind = ? AND folder = ?", (kind, folder))
+            self.conn.execute("DELETE FROM folders WHERE path = ?", (folder,))
+            return
+
+        row = self.conn.execute("SELECT mtime FROM folders WHERE path = ?", (folder,)).fetchone()
+        if row is not None and row["mtime"] == folder_mtime:
+            return
+
+        known = {
+            entry["path"]: entry["mtime"]
+            for entry in self.conn.execute(
+                "SELECT path, mtime FROM entries WHERE kind = ? AND folder = ?", (kind, folder)
+            )
+        }
+        seen = set()
+        for filename in os.listdir(folder):
+            path = os.path.join(folder, filename)
+            if kind == "finals" and os.path.isdir(path) and not os.path.exists(path + ".csv"):
+                # Older versions of the Create page saved each final in a folder of its own
+                path = os.path.join(path, f"{filename}.csv")
+            if not is_entry(kind, path):
+                continue
+            seen.add(path)
+            if known.get(path) != os.stat(path).st_mtime:
+                self._store(kind, folder, path)
+
+        for path in known.keys() - seen:
+            self.conn.execute("DELETE FROM entries WHERE path = ?", (path,))
+        self.conn.execute(
+            "INSERT OR REPLACE INTO folders (path, mtime) VALUES (?, ?)", (folder, folder_mtime)
+        )
+
+    def _store(self, kind, folder, path):
+        try:
+            mtime = os.stat(path).st_mtime
+            categories, clue_count, media_size = summarize(kind, path)
+        except (OSError, ValueError, UnicodeDecodeError, csv.Error) as e:
+            print(f"Failed to catalog {path}: {e}")
+            categories, clue_count, media_size, mtime = [], 0, 0, 0
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(path, kind, folder, name, mtime, categories, clue_count, media_size) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (path, kind, folder, os.path.basename(path), mtime,
+             json.dumps(categories), clue_count, media_size)
+        )
+
+    def record(self, kind, path):
+        """ Update a single entry right after it has been saved. """
+        self._store(kind, os.path.dirname(path), path)
+        self.conn.commit()
+        for listener in self.listeners:
+            listener(kind, path)
+
+    def add_listener(self, listener):
+        """ Call listener(kind, path) whenever record() updates an entry. """
+        self.listeners.append(listener)
+
+    def entries(self, kind):
+        """ Return the catalog rows for one kind, sorted by name. """
+        self.sync(kind)
+        return self.conn.execute(
+            "SELECT * FROM entries WHERE kind = ? ORDER BY name COLLATE NOCASE", (kind,)
+        ).fetchall()
+
+    def close(self):
+        self.conn.close()
+
+
+_catalog = None
+
+
+def get_catalog():
+    global _catalog
+    if _catalog is None:
+        _catalog = LibraryCatalog()
+    return _catalog
@@ -0,0 +1,223 @@
+import os
+import re
+import csv
+import sys
+import sqlite3
+from util import get_user_data_path
+from clue_parser import parse_cell
+from board_state import split_values_row
+from catalog import KINDS, LibraryCatalog, get_catalog, entry_rounds
+
+# The clue index is an SQLite FTS5 table (an inverted index kept on disk) over
+# the category titles and clue text of every board, final and game. Like the
+# catalog it is brought up to date lazily: sync() only re-reads entries whose
+# catalog mtime differs from the one they were indexed at, and a save
+# reindexes its entry straight away through the catalog's record() listener.
+INDEX_VERSION = 1
+SEARCH_LIMIT = 200
+WORD = re.compile(r"\w+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS indexed (
+    path TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    mtime REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS clues (
+    id INTEGER PRIMARY KEY,
+    path TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    round TEXT NOT NULL,
+    row INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    text TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS clues_path ON clues (path);
+CREATE VIRTUAL TABLE IF NOT EXISTS clue_text USING fts5(
+    category, text, content='clues', content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+CREATE TRIGGER IF NOT EXISTS clues_insert AFTER INSERT ON clues BEGIN
+    INSERT INTO clue_text (rowid, category, text) VALUES (new.id, new.category, new.text);
+END;
+CREATE TRIGGER IF NOT EXISTS clues_delete AFTER DELETE ON clues BEGIN
+    INSERT INTO clue_text (clue_text, rowid, category, text) VALUES ('delete', old.id, old.category, old.text);
+END;
+"""
+
+
+def round_clues(round_name, rows):
+    """ Yield (round, row, col, category, text) for every non-empty clue in one round's CSV rows. """
+    _, rows = split_values_row(rows)
+    if not rows:
+        return
+    categories = [title.strip() for title in rows[0]]
+    for row, cells in enumerate(rows[1:]):
+        for col, cell in enumerate(cells):
+            if not cell.strip():
+                continue
+            text = parse_cell(cell).text
+            category = categories[col] if col < len(categories) else ""
+            if text or category:
+                yield round_name, row, col, category, text
+
+
+def entry_clues(kind, path):
+    for round_name, rows, _ in entry_rounds(kind, path):
+        yield from round_clues(round_name, rows)
+
+
+def match_expression(query, prefix=True):
+    """ Turn free text into an FTS5 query: every word must appear, and with prefix the last one may be a prefix. """
+    words = WORD.findall(query.lower())
+    if not words:
+        return None
+    terms = [f'"{word}"' for word in words]
+    if prefix and len(words[-1]) > 1:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+class ClueIndex:
+    def __init__(self, db_path=None, catalog=None):
+        self.db_path = db_path or os.path.join(get_user_data_path("cache"), "clues.sqlite3")
+        self.catalog = catalog or get_catalog()
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.row_factory = sqlite3.Row
+        if self.conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+            self.conn.executescript(
+                "DROP TABLE IF EXISTS clue_text; DROP TABLE IF EXISTS clues; DROP TABLE IF EXISTS indexed;"
+            )
+            self.conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        self.catalog.add_listener(self.on_recorded)
+
+    def sync(self, kinds=KINDS):
+        """ Reindex the entries added, changed or removed since the last sync. Returns how many were reindexed. """
+        changed = 0
+        for kind in kinds:
+            indexed = {
+                row["path"]: row["mtime"]
+                for row in self.conn.execute("SELECT path, mtime FROM indexed WHERE kind = ?", (kind,))
+            }
+            current = {row["path"]: row["mtime"] for row in self.catalog.entries(kind)}
+            for path in indexed.keys() - current.keys():
+                self._remove(path)
+                changed += 1
+            for path, mtime in current.items():
+                if indexed.get(path) != mtime:
+                    self._reindex(kind, path, mtime)
+                    changed += 1
+        self.conn.commit()
+        return changed
+
+    def update(self, kind, path):
+        """ Reindex one entry right after it has been saved. """
+        self._reindex(kind, path, os.stat(path).st_mtime)
+        self.conn.commit()
+
+    def on_recorded(self, kind, path):
+        try:
+            self.update(kind, path)
+        except OSError as e:
+            print(f"Failed to index {path}: {e}")
+
+    def _remove(self, path):
+        self.conn.execute("DELETE FROM clues WHERE path = ?", (path,))
+        self.conn.execute("DELETE FROM indexed WHERE path = ?", (path,))
+
+    def _reindex(self, kind, path, mtime):
+        self._remove(path)
+        try:
+            clues = list(entry_clues(kind, path))
+        except (OSError, ValueError, UnicodeDecodeError, csv.Error) as e:
+            print(f"Failed to index {path}: {e}")
+            clues = []
+        self.store(kind, path, mtime, clues)
+
+    def store(self, kind, path, mtime, clues):
+        """ Add one entry's (round, row, col, category, text) clues. The caller commits. """
+        self.conn.executemany(
+            "INSERT INTO clues (path, kind, round, row, col, category, text) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            ((path, kind, *clue) for clue in clues)
+        )
+        self.conn.execute("INSERT OR REPLACE INTO indexed (path, kind, mtime) VALUES (?, ?, ?)", (path, kind, mtime))
+
+    def search(self, query, kind=None, limit=SEARCH_LIMIT):
+        """ Clues whose category title or text contains every word of query, exact matches of the last word first. """
+        exact = match_expression(query, prefix=False)
+        if exact is None:
+            return []
+        # Exact terms are cheap even when common, so a prefix match is only expanded
+        # (a merge of every matching term) when there aren't enough exact hits.
+        rows = self._match(exact, kind, limit)
+        expanded = match_expression(query)
+        if len(rows) < limit and expanded != exact:
+            seen = {row["id"] for row in rows}
+            rows += [row for row in self._match(expanded, kind, limit) if row["id"] not in seen][:limit - len(rows)]
+        return rows
+
+    def _match(self, expression, kind, limit):
+        sql = (
+            "SELECT clues.* FROM clue_text JOIN clues ON clues.id = clue_text.rowid "
+            "WHERE clue_text MATCH ?"
+        )
+        params = [expression]
+        if kind is not None:
+            sql += " AND clues.kind = ?"
+            params.append(kind)
+        # Walking the match in rowid order stops after limit rows; ranking would score every match
+        sql += " ORDER BY clue_text.rowid LIMIT ?"
+        params.append(limit)
+        return self.conn.execute(sql, params).fetchall()
+
+    def clue_count(self):
+        return self.conn.execute("SELECT COUNT(*) FROM clues").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
+
+    def rebuild(self):
+        self.conn.execute("DELETE FROM clues")
+        self.conn.execute("DELETE FROM indexed")
+        self.conn.execute("INSERT INTO clue_text (clue_text) VALUES ('rebuild')")
+        self.conn.commit()
+        return self.sync()
+
+
+def sync_library(kinds=KINDS):
+    """ Sync the index through connections of its own, so it can run off the GUI thread. Returns how many entries were reindexed. """
+    catalog = LibraryCatalog()
+    index = ClueIndex(catalog=catalog)
+    try:
+        return index.sync(kinds)
+    finally:
+        index.close()
+        catalog.close()
+
+
+_clue_index = None
+
+
+def get_clue_index():
+    global _clue_index
+    if _clue_index is None:
+        _clue_index = ClueIndex()
+    return _clue_index
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] not in ("sync", "rebuild", "search") or (sys.argv[1] == "search" and len(sys.argv) < 3):
+        print("Usage: python clue_index.py sync|rebuild|search <words...>")
+        sys.exit(1)
+
+    index = get_clue_index()
+    if sys.argv[1] == "search":
+        index.sync()
+        for row in index.search(" ".join(sys.argv[2:])):
+            print(f"{os.path.basename(row['path'])} [{row['round']}] {row['category']}: {row['text']}")
+    else:
+        changed = index.rebuild() if sys.argv[1] == "rebuild" else index.sync()
+        print(f"Indexed {changed} entries, {index.clue_count()} clues")
@@ -0,0 +1,97 @@
+import re
+import ast
+
+# A clue cell is either plain text, optionally carrying [media:...] tags, or a
+# Python-style dict literal such as {'question': '...', 'points': 400}. Flat
+# dicts are matched with one compiled regex; anything else falls back to
+# ast.literal_eval, so no code in a board file ever runs.
+_MEDIA_TAG = re.compile(r"\s*\[media:(.+?)\]\s*")
+_STR = r"""'[^'\\\n]*(?:\\.[^'\\\n]*)*'|"[^"\\\n]*(?:\\.[^"\\\n]*)*\""""
+_SCALAR = rf"{_STR}|-?\d+(?:\.\d+)?(?:[eE][-+]?\d+)?|True|False|None"
+_PAIR = rf"\s*({_STR})\s*:\s*({_SCALAR})\s*"
+_FLAT_DICT = re.compile(rf"\s*\{{(?:{_PAIR}(?:,{_PAIR})*)?\}}\s*")
+_DICT_PAIR = re.compile(_PAIR)
+_CONSTANTS = {"True": True, "False": False, "None": None}
+
+
+class Clue:
+    __slots__ = ("text", "media", "metadata")
+
+    def __init__(self, text, media=None, metadata=None):
+        self.text = text
+        self.media = media
+        self.metadata = metadata
+
+    def __repr__(self):
+        return f"Clue(text={self.text!r}, media={self.media!r}, metadata={self.metadata!r})"
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, Clue)
+            and self.text == other.text
+            and self.media == other.media
+            and self.metadata == other.metadata
+        )
+
+
+def _split_media(text):
+    """ Return (text_without_tags, first_media_name). """
+    if "[media:" not in text:
+        return text.strip(), None
+    match = _MEDIA_TAG.search(text)
+    if match is None:
+        return text.strip(), None
+    return _MEDIA_TAG.sub(" ", text).strip(), match.group(1).strip()
+
+
+def _literal(token):
+    if token[0] in "'\"":
+        return token[1:-1] if "\\" not in token else ast.literal_eval(token)
+    if token in _CONSTANTS:
+        return _CONSTANTS[token]
+    return float(token) if any(c in token for c in ".eE") else int(token)
+
+
+def _parse_flat_dict(cell):
+    """ Fast path for flat {'key': scalar, ...} cells. Returns None for anything it doesn't handle. """
+    if _FLAT_DICT.fullmatch(cell) is None:
+        return None
+    return {_literal(key): _literal(value) for key, value in _DICT_PAIR.findall(cell)}
+
+
+def parse_cell(cell):
+    """ Parse one CSV cell into a Clue. """
+    if "{" in cell and cell.lstrip()[:1] == "{":
+        data = _parse_flat_dict(cell)
+        if data is None:
+            try:
+                data = ast.literal_eval(cell.strip())
+            except (ValueError, SyntaxError, MemoryError, RecursionError):
+                data = None
+        if isinstance(data, dict):
+            metadata = {key: value for key, value in data.items() if key != "question"}
+            text, media = _split_media(str(data.get("question", "")))
+            return Clue(text, media, metadata or None)
+
+    if "[media:" not in cell:
+        return Clue(cell.strip())
+    text, media = _split_media(cell)
+    return Clue(text, media)
+
+
+def format_cell(text, media=None, metadata=None):
+    """ The CSV cell for a clue, the inverse of parse_cell. Clues with metadata are written as a dict literal. """
+    if media:
+        text = f"{text} [media:{media}]"
+    if metadata:
+        return repr({"question": text, **metadata})
+    return text
+
+
+def parse_rows(rows):
+    """ Parse board CSV rows into (categories, clue rows). Clue rows keep the CSV's row-major layout. """
+    if not rows:
+        return [], []
+    categories = [title.strip() for title in rows[0]]
+    return categories, [[parse_cell(cell) for cell in row] for row in rows[1:]]
+
@@ -0,0 +1,438 @@
+import os
+import re
+import csv
+import sys
+import time
+import asyncio
+import sqlite3
+import secrets
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from message_server import MessageServer, Service
+from util import get_user_data_path
+
+# Final Jeopardy wagers and responses from the audience's phones. Phones open the page
+# served at http://<host>:<port>/ (or any client speaks the protocol directly, over a
+# WebSocket or TCP with one JSON object per line):
+#   -> {"type": "hello", "name": "Alice"}   <- {"type": "welcome", "name": ..., "token": ..., "score": 4200, "phase": ...}
+#   <- {"type": "phase", "phase": "wagers", "category": ...}
+#   -> {"type": "wager", "amount": 1000}     <- {"type": "accepted", "kind": "wager", ...} or "rejected"
+#   <- {"type": "phase", "phase": "responses", "question": ..., "seconds": 30}
+#   -> {"type": "response", "text": "..."}
+#   <- {"type": "phase", "phase": "closed"}
+# The first phone to say hello with a name owns it; to come back after a dropped
+# connection, send the same name with the token from the welcome. Any other claim on the
+# name is rejected. Wagers are taken while the category is up and responses while the question is up. A
+# response is checked against the time its bytes arrived, so the deadline holds exactly
+# however busy the server is or however late its timer fires. Entries are kept in memory for validation and the tally, and written to
+# SQLite in batches on a writer thread so the event loop never waits on the disk.
+DEFAULT_PORT = 8766
+RESPONSE_SECONDS = 30
+MAX_RESPONSE_CHARS = 200
+MAX_NAME_CHARS = 40
+FLUSH_INTERVAL = 0.25
+FLUSH_BATCH = 2000
+TALLY_INTERVAL = 0.2
+TOP_RESPONSES = 5
+
+CLOSED = "closed"
+WAGERS = "wagers"
+RESPONSES = "responses"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY,
+    started REAL NOT NULL,
+    category TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    session INTEGER NOT NULL,
+    player TEXT NOT NULL,
+    score INTEGER NOT NULL,
+    wager INTEGER,
+    response TEXT,
+    PRIMARY KEY (session, player)
+);
+"""
+_LEADING_QUESTION = re.compile(r"^((what|who|where|when)\s+(is|are|was|were)\s+)?((an?|the)\s+)?")
+
+
+def read_standings(path):
+    """ Scores by player name from a CSV of name,score rows. """
+    standings = {}
+    with open(path, newline='', encoding='utf-8') as f:
+        for row in csv.reader(f):
+            if len(row) >= 2:
+                try:
+                    standings[row[0].strip()] = int(row[1])
+                except ValueError:
+                    continue
+    return standings
+
+
+def normalize_response(text):
+    """ The form responses are tallied under: "What is the Nile?" and "nile" count together. """
+    text = re.sub(r"[^\w\s]", "", text.lower()).strip()
+    return _LEADING_QUESTION.sub("", text).strip()
+
+
+class IntakeStore:
+    """ The SQLite file behind the intake. Only ever used from the intake's writer thread. """
+
+    def __init__(self, db_path=None):
+        self.db_path = db_path or os.path.join(get_user_data_path("live"), "final_intake.sqlite3")
+        self.conn = None
+
+    def open(self):
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.executescript(_SCHEMA)
+        self.conn.commit()
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM sessions").fetchone()[0]
+
+    def write(self, sessions, wagers, responses):
+        """ Write one batch in one transaction. wagers and responses are (session, player, score, value) rows. """
+        with self.conn:
+            self.conn.executemany("INSERT INTO sessions (id, started, category) VALUES (?, ?, ?)", sessions)
+            self.conn.executemany(
+                "INSERT INTO entries (session, player, score, wager) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (session, player) DO UPDATE SET wager = excluded.wager", wagers
+            )
+            self.conn.executemany(
+                "INSERT INTO entries (session, player, score, response) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (session, player) DO UPDATE SET response = excluded.response", responses
+            )
+        return len(wagers) + len(responses)
+
+    def entries(self, session):
+        return self.conn.execute(
+            "SELECT player, score, wager, response FROM entries WHERE session = ? ORDER BY player", (session,)
+        ).fetchall()
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class Entry:
+    __slots__ = ("score", "wager", "response")
+
+    def __init__(self, score):
+        self.score = score
+        self.wager = None
+        self.response = None
+
+
+class IntakeServer(MessageServer):
+    """ Runs one Final Jeopardy at a time: open_wagers(), then open_responses(), then it closes itself.
+
+    Those methods must be called on the server's loop. on_tally(tally) is called on the
+    loop at most every TALLY_INTERVAL while anything is changing.
+    """
+
+    def __init__(self, store=None, standings=None, on_tally=None):
+        super().__init__()
+        self.store = store or IntakeStore()
+        self.standings = standings or {}
+        self.on_tally = on_tally
+        self.writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="final-intake-store")
+        self.session = 0
+        self.phase = CLOSED
+        self.category = ""
+        self.question = ""
+        self.deadline = None
+        self.cut_handle = None
+        self.entries = {}  # player name -> Entry, for the current session
+        self.tokens = {}  # player name -> token of the phone that claimed it
+        self.answers = Counter()
+        self.total_wagered = 0
+        self.pending = ([], [], [])  # sessions, wagers, responses not yet written
+        self.stored = 0
+        self.flush_handle = None
+        self.tally_handle = None
+        self.changed = False
+
+    async def start(self, host, port):
+        self.session = await asyncio.get_running_loop().run_in_executor(self.writer, self.store.open)
+        return await super().start(host, port)
+
+    def stop(self):
+        # Called once the loop has stopped, so whatever is pending is written here directly
+        if self.writer is None:
+            return
+        if any(self.pending):
+            self.writer.submit(self.store.write, *self.pending)
+            self.pending = ([], [], [])
+        self.writer.submit(self.store.close)
+        self.writer.shutdown(wait=True)
+        self.writer = None
+        super().stop()
+
+    def on_connect(self, connection):
+        connection.state = None  # the player's name once they've said hello
+
+    def on_message(self, connection, message, received):
+        kind = message.get("type")
+        if kind == "hello":
+            self.hello(connection, str(message.get("name", "")).strip()[:MAX_NAME_CHARS], message.get("token"))
+        elif connection.state is None:
+            connection.send({"type": "rejected", "reason": "Say hello with your name first."})
+        elif kind == "wager":
+            self.wager(connection, message.get("amount"))
+        elif kind == "response":
+            self.response(connection, message.get("text"), received)
+
+    def score(self, name):
+        # Players missing from the standings can still answer, for nothing
+        return self.standings.get(name, 0)
+
+    def hello(self, connection, name, token):
+        if not name:
+            connection.send({"type": "rejected", "reason": "A name is required."})
+            return
+        claimed = self.tokens.get(name)
+        if claimed is None:
+            claimed = self.tokens[name] = secrets.token_urlsafe(16)
+        elif token != claimed:
+            connection.send({"type": "rejected", "reason": "That name is already taken."})
+            return
+        connection.state = name
+        entry = self.entries.get(name)
+        connection.send({
+            "type": "welcome", "name": name, "token": claimed, "score": self.score(name), "phase": self.phase,
+            "category": self.category, "question": self.question if self.phase == RESPONSES else "",
+            "seconds": self.seconds_left(), "wager": entry.wager if entry else None,
+        })
+
+    def wager(self, connection, amount):
+        name = connection.state
+        score = self.score(name)
+        if self.phase != WAGERS:
+            reason = "Wagers are closed."
+        elif not isinstance(amount, int) or isinstance(amount, bool):
+            reason = "The wager must be a whole number."
+        elif not 0 <= amount <= max(score, 0):
+            reason = f"The wager must be between $0 and ${max(score, 0)}."
+        else:
+            entry = self.entry(name, score)
+            self.total_wagered += amount - (entry.wager or 0)
+            entry.wager = amount
+            self.pending[1].append((self.session, name, score, amount))
+            self.accepted(connection, "wager", amount)
+            return
+        connection.send({"type": "rejected", "kind": "wager", "reason": reason})
+
+    def response(self, connection, text, received):
+        name = connection.state
+        if self.phase != RESPONSES or received > self.deadline:
+            reason = "Time is up."
+        elif not isinstance(text, str) or not text.strip():
+            reason = "The response is empty."
+        else:
+            text = text.strip()[:MAX_RESPONSE_CHARS]
+            entry = self.entry(name, self.score(name))
+            if entry.response is not None:
+                self.answers[normalize_response(entry.response)] -= 1
+            entry.response = text
+            self.answers[normalize_response(text)] += 1
+            self.pending[2].append((self.session, name, entry.score, text))
+            self.accepted(connection, "response", text)
+            return
+        connection.send({"type": "rejected", "kind": "response", "reason": reason})
+
+    def entry(self, name, score):
+        entry = self.entries.get(name)
+        if entry is None:
+            entry = self.entries[name] = Entry(score)
+        return entry
+
+    def accepted(self, connection, kind, value):
+        connection.send({"type": "accepted", "kind": kind, "value": value})
+        self.changed = True
+        if sum(len(rows) for rows in self.pending) >= FLUSH_BATCH:
+            self.flush()
+        elif self.flush_handle is None:
+            self.flush_handle = asyncio.get_running_loop().call_later(FLUSH_INTERVAL, self.flush)
+
+    def flush(self):
+        if self.flush_handle is not None:
+            self.flush_handle.cancel()
+            self.flush_handle = None
+        if not any(self.pending):
+            return
+        batch, self.pending = self.pending, ([], [], [])
+        future = asyncio.wrap_future(self.writer.submit(self.store.write, *batch))
+        future.add_done_callback(self.flushed)
+
+    def flushed(self, future):
+        if future.exception() is not None:
+            print(f"Failed to store Final Jeopardy entries: {future.exception()}")
+            return
+        self.stored += future.result()
+        self.changed = True
+
+    def seconds_left(self):
+        if self.deadline is None:
+            return None
+        return max(round(self.deadline - time.monotonic(), 1), 0)
+
+    def open_wagers(self, category):
+        """ Start a new Final Jeopardy and take wagers until open_responses(). """
+        self.cancel_cut()
+        self.session += 1
+        self.phase = WAGERS
+        self.category = category
+        self.question = ""
+        self.deadline = None
+        self.entries = {}
+        self.answers = Counter()
+        self.total_wagered = 0
+        self.pending[0].append((self.session, time.time(), category))
+        self.broadcast({"type": "phase", "phase": WAGERS, "category": category})
+        self.start_tally()
+
+    def open_responses(self, question, seconds=RESPONSE_SECONDS):
+        """ Stop taking wagers and take responses for seconds. """
+        self.cancel_cut()
+        self.phase = RESPONSES
+        self.question = question
+        self.deadline = time.monotonic() + seconds
+        self.cut_handle = asyncio.get_running_loop().call_later(seconds, self.close)
+        self.broadcast({"type": "phase", "phase": RESPONSES, "question": question, "seconds": seconds})
+        self.start_tally()
+
+    def close(self):
+        self.cancel_cut()
+        if self.phase == CLOSED:
+            return
+        self.phase = CLOSED
+        self.broadcast({"type": "phase", "phase": CLOSED})
+        self.flush()
+        self.changed = True
+
+    def cancel_cut(self):
+        if self.cut_handle is not None:
+            self.cut_handle.cancel()
+            self.cut_handle = None
+
+    def start_tally(self):
+        self.changed = True
+        if self.tally_handle is None:
+            self.publish_tally()
+
+    def publish_tally(self):
+        if self.changed:
+            self.changed = False
+            if self.on_tally is not None:
+                self.on_tally(self.tally())
+        # Keep ticking while the clock runs or entries are still being written
+        if self.phase != CLOSED or any(self.pending) or self.changed:
+            self.tally_handle = asyncio.get_running_loop().call_later(TALLY_INTERVAL, self.publish_tally)
+        else:
+            self.tally_handle = None
+
+    def tally(self):
+        wagers = sum(entry.wager is not None for entry in self.entries.values())
+        return {
+            "session": self.session,
+            "phase": self.phase,
+            "players": len(self.connections),
+            "wagers": wagers,
+            "total_wagered": self.total_wagered,
+            "responses": sum(self.answers.values()),
+            "top": [(answer, count) for answer, count in self.answers.most_common(TOP_RESPONSES) if count > 0],
+            "stored": self.stored,
+            "seconds": self.seconds_left() if self.phase == RESPONSES else None,
+        }
+
+    def http_page(self, path):
+        return PHONE_PAGE if path in ("/", "/index.html") else None
+
+
+class IntakeService(Service):
+    default_port = DEFAULT_PORT
+
+    def __init__(self, port=None, host="0.0.0.0", standings=None, on_tally=None, store=None):
+        super().__init__(IntakeServer(store, standings, on_tally), port, host)
+
+    def open_wagers(self, category):
+        self.call(self.server.open_wagers, category)
+
+    def open_responses(self, question, seconds=RESPONSE_SECONDS):
+        self.call(self.server.open_responses, question, seconds)
+
+    def close(self):
+        self.call(self.server.close)
+
+
+PHONE_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Final Jeopardy</title>
+<style>
+body { font-family: sans-serif; background: #060CE9; color: white; margin: 0; padding: 16px; }
+input, button { font-size: 20px; width: 100%; box-sizing: border-box; margin: 6px 0; padding: 10px; }
+#status { color: gold; min-height: 1.5em; }
+.hidden { display: none; }
+</style></head>
+<body>
+<h2 id="title">Final Jeopardy</h2>
+<div id="join"><input id="name" placeholder="Your name" maxlength="40"><button onclick="join()">Join</button></div>
+<div id="play" class="hidden">
+  <p id="info"></p>
+  <div id="wager" class="hidden"><input id="amount" type="number" min="0" inputmode="numeric"><button onclick="send({type: 'wager', amount: parseInt(element('amount').value, 10)})">Wager</button></div>
+  <div id="answer" class="hidden"><input id="text" placeholder="What is..."><button onclick="send({type: 'response', text: element('text').value})">Answer</button></div>
+</div>
+<p id="status"></p>
+<script>
+let socket, score = 0, deadline = null;
+function element(id) { return document.getElementById(id); }
+function send(message) { socket.send(JSON.stringify(message)); }
+function show(id, visible) { element(id).classList.toggle("hidden", !visible); }
+function phase(message) {
+  show("wager", message.phase === "wagers");
+  show("answer", message.phase === "responses");
+  deadline = message.phase === "responses" && message.seconds != null ? Date.now() + message.seconds * 1000 : null;
+  const info = element("info");
+  if (message.phase === "wagers") info.textContent = "Category: " + message.category + " (you have $" + score + ")";
+  else if (message.phase === "responses") info.textContent = message.question;
+  else info.textContent = "Waiting for Final Jeopardy...";
+}
+function join() {
+  const name = element("name").value.trim(), status = element("status");
+  if (socket) { socket.onclose = null; socket.close(); }
+  socket = new WebSocket("ws://" + location.host + "/");
+  // The token from an earlier welcome lets this phone take its name back after a reload
+  socket.onopen = () => send({type: "hello", name: name, token: localStorage.getItem("token:" + name)});
+  socket.onclose = () => { status.textContent = "Disconnected."; };
+  socket.onmessage = (event) => {
+    const message = JSON.parse(event.data);
+    if (message.type === "welcome") {
+      localStorage.setItem("token:" + message.name, message.token);
+      score = message.score; show("join", false); show("play", true); status.textContent = ""; phase(message);
+    }
+    else if (message.type === "phase") phase(message);
+    else if (message.type === "accepted") status.textContent = "Got your " + message.kind + ": " + message.value;
+    else if (message.type === "rejected") status.textContent = message.reason;
+  };
+}
+setInterval(() => {
+  if (deadline) element("title").textContent = "Final Jeopardy: " + Math.max(0, Math.ceil((deadline - Date.now()) / 1000)) + "s";
+  else element("title").textContent = "Final Jeopardy";
+}, 250);
+</script>
+</body></html>
+"""
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or not sys.argv[1].isdigit():
+        print("Usage: python final_intake.py <session>")
+        sys.exit(1)
+
+    store = IntakeStore()
+    store.open()
+    for player, score, wager, response in store.entries(int(sys.argv[1])):
+        print(f"{player},{score},{'' if wager is None else wager},{response or ''}")
+    store.close()
@@ -0,0 +1,167 @@
+import os
+import csv
+import sys
+import pickle
+import hashlib
+from util import get_user_data_path
+from clue_parser import parse_cell
+from game_pack import GamePack, is_game_pack
+from board_state import BoardState, board_from_rows
+
+# Parsed games are pickled under JeopardyData/cache/games, one file per game.
+# An entry is only used if the format version matches and every source file
+# still has the mtime and size it had when the entry was written. Hits touch
+# the entry's mtime, so eviction drops the least recently used games first.
+CACHE_VERSION = 2
+CACHE_LIMIT_BYTES = 64 * 1024 * 1024
+
+
+def get_cache_path():
+    return os.path.join(get_user_data_path("cache"), "games")
+
+
+def _entry_path(game_path):
+    key = hashlib.sha1(os.path.abspath(game_path).encode("utf-8")).hexdigest()
+    return os.path.join(get_cache_path(), f"{key}.pickle")
+
+
+def _fingerprint(paths):
+    fingerprint = []
+    for path in paths:
+        st = os.stat(path)
+        fingerprint.append((path, st.st_mtime_ns, st.st_size))
+    return fingerprint
+
+
+def _build_round(round_name, rows):
+    if round_name.lower() == 'final':
+        category = rows[0][0] if rows and rows[0] else "Final Jeopardy"
+        question = rows[1][0] if len(rows) > 1 and rows[1] else "No question provided."
+        return BoardState.from_rows([category], [[parse_cell(question)]], values=[0])
+
+    return board_from_rows(rows, 2 if round_name == "double" else 1)
+
+
+def parse_game(game_path):
+    """ Read a game folder or .jpack file. Returns (rounds, round_data, source_paths). """
+    if is_game_pack(game_path):
+        pack = GamePack(game_path)
+        try:
+            rounds = pack.rounds
+            round_rows = {name: pack.round_rows(name) for name in rounds if pack.has_round(name)}
+        finally:
+            pack.close()
+        sources = [game_path]
+    else:
+        order_file = os.path.join(game_path, "order.csv")
+        if not os.path.exists(order_file):
+            raise FileNotFoundError(f"Missing order.csv in {game_path}")
+
+        with open(order_file, newline='', encoding='utf-8') as f:
+            rounds = [row[0].replace('.csv', '') for row in csv.reader(f) if row]
+
+        sources = [order_file]
+        round_rows = {}
+        for round_name in rounds:
+            round_file = os.path.join(game_path, f"{round_name}.csv")
+            if not os.path.exists(round_file):
+                continue
+            with open(round_file, newline='', encoding='utf-8') as f:
+                round_rows[round_name] = list(csv.reader(f))
+            sources.append(round_file)
+
+    round_data = {name: _build_round(name, rows) for name, rows in round_rows.items()}
+    return rounds, round_data, sources
+
+
+def _read_entry(game_path):
+    entry_path = _entry_path(game_path)
+    try:
+        with open(entry_path, "rb") as f:
+            entry = pickle.load(f)
+        if entry["version"] != CACHE_VERSION:
+            return None
+        if _fingerprint([source[0] for source in entry["sources"]]) != entry["sources"]:
+            return None
+    except Exception:
+        # Missing, stale or unreadable entries are all just misses
+        return None
+    os.utime(entry_path)
+    return entry
+
+
+def _write_entry(game_path, rounds, round_data, sources):
+    entry = {
+        "version": CACHE_VERSION,
+        "sources": _fingerprint(sources),
+        "rounds": rounds,
+        "round_data": round_data,
+    }
+    entry_path = _entry_path(game_path)
+    os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+    tmp_path = entry_path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, entry_path)
+
+
+def evict(limit_bytes=CACHE_LIMIT_BYTES):
+    """ Remove least recently used entries until the cache fits in limit_bytes. """
+    cache_path = get_cache_path()
+    if not os.path.isdir(cache_path):
+        return
+    entries = []
+    for filename in os.listdir(cache_path):
+        path = os.path.join(cache_path, filename)
+        st = os.stat(path)
+        entries.append((st.st_mtime, st.st_size, path))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total <= limit_bytes:
+            break
+        os.remove(path)
+        total -= size
+
+
+def load_game_data(game_path):
+    """ Return (rounds, round_data) for a game, from the cache when its sources haven't changed. """
+    entry = _read_entry(game_path)
+    if entry is not None:
+        return entry["rounds"], entry["round_data"]
+
+    rounds, round_data, sources = parse_game(game_path)
+    try:
+        _write_entry(game_path, rounds, round_data, sources)
+        evict()
+    except OSError as e:
+        print(f"Failed to cache {game_path}: {e}")
+    return rounds, round_data
+
+
+def warm_cache():
+    """ Parse and cache every game in the library. Returns (cached, failed) counts. """
+    from catalog import get_catalog
+
+    cached = failed = 0
+    for entry in get_catalog().entries("games"):
+        try:
+            load_game_data(entry["path"])
+            cached += 1
+        except Exception as e:
+            print(f"Failed to load {entry['path']}: {e}")
+            failed += 1
+    return cached, failed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 2 or sys.argv[1] not in ("warm", "clear"):
+        print("Usage: python game_cache.py warm|clear")
+        sys.exit(1)
+
+    if sys.argv[1] == "warm":
+        cached, failed = warm_cache()
+        print(f"Cached {cached} game(s), {failed} failed")
+    else:
+        evict(0)
+        print("Cleared the parsed-game cache")
@@ -0,0 +1,82 @@
+import random
+
+FINAL_ROUND = "final"
+DAILY_DOUBLES_PER_ROUND = 2
+
+
+class GameEngine:
+    """ The rules of one playthrough with no widgets attached.
+
+    Owns round order, which clues are left, where the daily doubles are and when
+    Final Jeopardy begins. PlayGamePage drives it from clicks; simulate.py drives it
+    from a random number generator. rng defaults to the random module.
+    """
+
+    def __init__(self, rounds, round_data, rng=None):
+        self.rounds = rounds
+        self.round_data = round_data
+        self.rng = rng if rng is not None else random
+        self.round_index = 0
+        self.daily_doubles = []
+        self.questions_remaining = 0
+
+    @property
+    def round_name(self):
+        return self.rounds[self.round_index]
+
+    @property
+    def board(self):
+        return self.round_data[self.round_name]
+
+    def start(self):
+        """ Start the game from its first round. """
+        self.round_index = 0
+        self.begin_round()
+
+    def begin_round(self):
+        self.daily_doubles = []
+        self.board.reset()
+        self.questions_remaining = self.board.clue_count()
+
+    def pick(self, index):
+        """ Play a cell. Returns whether it is a daily double, or None if it was already played. """
+        board = self.board
+        if board.is_used(index):
+            return None
+
+        board.mark_used(index)
+        self.questions_remaining -= 1
+
+        # Placed once the first clue is out, so the opening pick is never a daily double
+        if not self.daily_doubles and self.questions_remaining <= len(board) - 1:
+            self.assign_daily_doubles()
+
+        return index in self.daily_doubles
+
+    def assign_daily_doubles(self):
+        available = self.board.available()
+        self.daily_doubles = self.rng.sample(available, min(DAILY_DOUBLES_PER_ROUND, len(available)))
+
+    def is_round_over(self):
+        return self.questions_remaining == 0
+
+    def next_round(self):
+        """ Name of the round after this one, or None when only Final Jeopardy is left. """
+        if self.round_index + 1 < len(self.rounds):
+            return self.rounds[self.round_index + 1]
+        return None
+
+    def advance(self):
+        """ Move on to the next round. Returns False if that round is Final Jeopardy. """
+        self.round_index += 1
+        self.daily_doubles = []
+        if self.round_name.lower() == FINAL_ROUND:
+            return False
+        self.begin_round()
+        return True
+
+    def final_category(self):
+        return self.round_data[FINAL_ROUND].categories[0]
+
+    def final_question(self):
+        return self.round_data[FINAL_ROUND].clues[0].text
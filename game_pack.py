@@ -0,0 +1,154 @@
+import os
+import csv
+import json
+import mmap
+import shutil
+import struct
+import sys
+from media_store import MEDIA_TAG, resolve_media
+from renditions import RENDITIONS, rendition_name, rendition_path
+
+# A .jpack file is a single-file game: a fixed header (magic + index length),
+# a UTF-8 JSON index, then a data section holding every CSV cell and media blob.
+# All offsets in the index are relative to the start of the data section.
+PACK_EXTENSION = ".jpack"
+PACK_MAGIC = b"JPACK\x00\x01\x00"
+PACK_VERSION = 1
+_HEADER = struct.Struct("<8sI")
+
+
+def is_game_pack(path):
+    return path.lower().endswith(PACK_EXTENSION) and os.path.isfile(path)
+
+
+def write_game_pack(dest_path, rounds):
+    """ Write a .jpack file. `rounds` is a list of (round_name, csv_path, media_folder_or_None) in play order. """
+    index = {"version": PACK_VERSION, "order": [], "rounds": {}, "media": {}}
+    # Chunks are written in the same order their offsets were assigned
+    chunks = []
+    offset = 0
+
+    for round_name, csv_path, media_folder in rounds:
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        spans = []
+        for row in rows:
+            row_spans = []
+            for cell in row:
+                blob = cell.encode("utf-8")
+                chunks.append(blob)
+                row_spans.append([offset, len(blob)])
+                offset += len(blob)
+            spans.append(row_spans)
+
+        index["order"].append(round_name)
+        index["rounds"][round_name] = {"rows": spans}
+        index["media"][round_name] = {}
+
+        # Embed every media file the round's clues reference (and its renditions), whether it
+        # lives in the shared store or a legacy folder
+        for row in rows:
+            for cell in row:
+                for name in MEDIA_TAG.findall(cell):
+                    media_path = resolve_media(name, media_folder)
+                    if media_path is None or name in index["media"][round_name]:
+                        continue
+                    members = [(name, media_path)]
+                    for label, _, _ in RENDITIONS:
+                        members.append((rendition_name(name, label), rendition_path(media_path, label)))
+                    for member, member_path in members:
+                        if not os.path.isfile(member_path):
+                            continue
+                        size = os.path.getsize(member_path)
+                        index["media"][round_name][member] = [offset, size]
+                        chunks.append(member_path)
+                        offset += size
+
+    header = json.dumps(index, separators=(",", ":")).encode("utf-8")
+    tmp_path = dest_path + ".tmp"
+    with open(tmp_path, "wb") as out:
+        out.write(_HEADER.pack(PACK_MAGIC, len(header)))
+        out.write(header)
+        for chunk in chunks:
+            if isinstance(chunk, bytes):
+                out.write(chunk)
+            else:
+                with open(chunk, "rb") as src:
+                    shutil.copyfileobj(src, out)
+    os.replace(tmp_path, dest_path)
+
+
+def pack_game_folder(game_folder, dest_path):
+    """ Convert an existing game folder (order.csv + round CSVs + media subfolders) into a .jpack file. """
+    with open(os.path.join(game_folder, "order.csv"), newline='', encoding='utf-8') as f:
+        round_names = [row[0].replace('.csv', '') for row in csv.reader(f) if row]
+
+    rounds = []
+    for round_name in round_names:
+        csv_path = os.path.join(game_folder, f"{round_name}.csv")
+        if os.path.exists(csv_path):
+            rounds.append((round_name, csv_path, os.path.join(game_folder, round_name)))
+    write_game_pack(dest_path, rounds)
+
+
+class GamePack:
+    """ Read-only view of a .jpack file. Cells and media are sliced out of the mmap only when asked for. """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mmap) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Not a game pack: {path}")
+        magic, index_length = _HEADER.unpack_from(self._mmap, 0)
+        if magic != PACK_MAGIC:
+            self.close()
+            raise ValueError(f"Not a game pack: {path}")
+
+        index_start = _HEADER.size
+        self.index = json.loads(self._mmap[index_start:index_start + index_length].decode("utf-8"))
+        self._data_start = index_start + index_length
+
+    @property
+    def rounds(self):
+        return list(self.index["order"])
+
+    def has_round(self, round_name):
+        return round_name in self.index["rounds"]
+
+    def _read(self, span):
+        start = self._data_start + span[0]
+        return self._mmap[start:start + span[1]]
+
+    def round_rows(self, round_name):
+        """ Return the round's cells as CSV-style rows of strings. """
+        rows = self.index["rounds"][round_name]["rows"]
+        return [[self._read(span).decode("utf-8") for span in row] for row in rows]
+
+    def has_media(self, round_name, filename):
+        return filename in self.index["media"].get(round_name, {})
+
+    def media_bytes(self, round_name, filename):
+        span = self.index["media"].get(round_name, {}).get(filename)
+        if span is None:
+            return None
+        return self._read(span)
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python game_pack.py <game_folder> [output.jpack]")
+        sys.exit(1)
+
+    folder = os.path.normpath(sys.argv[1])
+    output = sys.argv[2] if len(sys.argv) == 3 else folder + PACK_EXTENSION
+    pack_game_folder(folder, output)
+    print(f"Wrote {output}")
@@ -1,9 +1,72 @@
+import time
+STARTED = time.perf_counter()
+
 from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QObject, QEvent, QTimer
+import os
 import sys
+import json
+import multiprocessing
+import tracing
+from ui.buzzers import configure as configure_buzzers
+from ui.final_tally import configure as configure_final_intake
+from ui.scoreboard_feed import configure as configure_scoreboard
 from main_menu import JeopardyApp
 
+IMPORTED = time.perf_counter()
+
+
+class StartupReport(QObject):
+    """ Times startup up to the main window's first paint, then prints the numbers as JSON and quits.
+
+    Enabled with --startup-report [path] or JEOPARDY_STARTUP_REPORT=path ("-" for stdout).
+    """
+
+    def __init__(self, app, window, path, constructed):
+        super().__init__()
+        self.app = app
+        self.path = path
+        self.constructed = constructed
+        window.installEventFilter(self)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and self.path is not None:
+            painted = time.perf_counter()
+            report = {
+                "import_ms": round((IMPORTED - STARTED) * 1000, 1),
+                "construct_ms": round((self.constructed - IMPORTED) * 1000, 1),
+                "first_paint_ms": round((painted - STARTED) * 1000, 1),
+                "multimedia_loaded": "PySide6.QtMultimedia" in sys.modules,
+            }
+            if self.path == "-":
+                print(json.dumps(report))
+            else:
+                with open(self.path, "w", encoding="utf-8") as f:
+                    json.dump(report, f, indent=2)
+            self.path = None
+            QTimer.singleShot(0, self.app.quit)
+        return False
+
+
+def startup_report_path(argv):
+    if "--startup-report" in argv:
+        index = argv.index("--startup-report")
+        return argv[index + 1] if index + 1 < len(argv) and not argv[index + 1].startswith("-") else "-"
+    return os.environ.get("JEOPARDY_STARTUP_REPORT")
+
+
 if __name__ == "__main__":
+    # Renditions are rendered in worker processes, which frozen builds must be able to start
+    multiprocessing.freeze_support()
+    tracing.configure()
     app = QApplication(sys.argv)
-    window = JeopardyApp()
-    window.show()
+    configure_buzzers(sys.argv)
+    configure_final_intake(sys.argv)
+    configure_scoreboard(sys.argv)
+    with tracing.span("startup.main_window"):
+        window = JeopardyApp()
+        window.show()
+    report_path = startup_report_path(sys.argv)
+    if report_path:
+        report = StartupReport(app, window, report_path, time.perf_counter())
     sys.exit(app.exec())
@@ -2,17 +2,10 @@ from PySide6.QtWidgets import (
     QWidget, QPushButton, QVBoxLayout, QLabel, QStackedLayout
 )
 from PySide6.QtCore import Qt
+from tracing import span
 
-# Import the different pages used in the Jeopardy app
-from ui.create_board import CreateBoardPage
-from ui.create_final import CreateFinalPage
-from ui.create_game import CreateGamePage
-from ui.edit_board import EditBoardPage
-from ui.edit_final import EditFinalPage
-from ui.play_game import PlayGamePage
-from ui.edit_board_select import EditBoardSelectPage
-from ui.edit_final_select import EditFinalSelectPage
-from ui.select_game import GameSelectScreen
+# Pages are imported and built the first time they are shown (see page()), so
+# startup only pays for the main menu.
 
 
 class JeopardyApp(QWidget):
@@ -28,40 +21,76 @@ class JeopardyApp(QWidget):
         self.stack = QStackedLayout()
         self.main_layout.addLayout(self.stack)
 
-        # Create pages
+        self.pages = {}
         self.menu_page = self.create_main_menu()
-        self.create_board_page = CreateBoardPage(self.return_to_menu)
-        self.create_final_page = CreateFinalPage(self.return_to_menu)
-        self.edit_board_page = EditBoardPage(self.return_to_menu)
-        self.edit_final_page = EditFinalPage(self.return_to_menu)
-        self.play_game_page = PlayGamePage(self.return_to_menu)
-
-        # Create game page, with file-select callbacks
-        self.create_game_page = CreateGamePage(
+        self.stack.addWidget(self.menu_page)
+
+        self.showMaximized()
+        self.setStyleSheet("background-color: #060CE9;")
+
+    def page(self, name):
+        """ Return the named page, building it and adding it to the stack on first use. """
+        page = self.pages.get(name)
+        if page is None:
+            with span("page.build", page=name):
+                page = getattr(self, f"build_{name}_page")()
+            self.pages[name] = page
+            self.stack.addWidget(page)
+        return page
+
+    def show_page(self, name):
+        with span("page.switch", page=name):
+            page = self.page(name)
+            self.stack.setCurrentWidget(page)
+        return page
+
+    def build_create_board_page(self):
+        from ui.create_board import CreateBoardPage
+        return CreateBoardPage(self.return_to_menu)
+
+    def build_create_final_page(self):
+        from ui.create_final import CreateFinalPage
+        return CreateFinalPage(self.return_to_menu)
+
+    def build_create_game_page(self):
+        from ui.create_game import CreateGamePage
+        return CreateGamePage(
             self.return_to_menu,
             self.show_edit_board_select_for_game,
             self.show_edit_final_select_for_game
         )
 
-        # Create game select screen
-        self.game_select_screen = GameSelectScreen(
+    def build_edit_board_page(self):
+        from ui.edit_board import EditBoardPage
+        return EditBoardPage(self.return_to_menu)
+
+    def build_edit_final_page(self):
+        from ui.edit_final import EditFinalPage
+        return EditFinalPage(self.return_to_menu)
+
+    def build_play_game_page(self):
+        from ui.play_game import PlayGamePage
+        return PlayGamePage(self.return_to_menu)
+
+    def build_clue_search_page(self):
+        from ui.clue_search import ClueSearchPage
+        return ClueSearchPage(self.return_to_menu, self.open_search_result)
+
+    def build_edit_board_select_page(self):
+        from ui.edit_board_select import EditBoardSelectPage
+        return EditBoardSelectPage(self.load_selected_board, self.return_to_menu)
+
+    def build_edit_final_select_page(self):
+        from ui.edit_final_select import EditFinalSelectPage
+        return EditFinalSelectPage(self.load_selected_final, self.return_to_menu)
+
+    def build_game_select_page(self):
+        from ui.select_game import GameSelectScreen
+        return GameSelectScreen(
             load_game_callback=self.load_selected_game,
             return_callback=self.return_to_menu
         )
 
-        # Add static pages to the stack
-        self.stack.addWidget(self.menu_page)
-        self.stack.addWidget(self.create_board_page)
-        self.stack.addWidget(self.create_final_page)
-        self.stack.addWidget(self.create_game_page)
-        self.stack.addWidget(self.edit_board_page)
-        self.stack.addWidget(self.edit_final_page)
-        self.stack.addWidget(self.play_game_page)
-        self.stack.addWidget(self.game_select_screen)
-
-        self.showMaximized()
-        self.setStyleSheet("background-color: #060CE9;")
-
     def create_main_menu(self):
         widget = QWidget()
         layout = QVBoxLayout(widget)
@@ -74,11 +103,12 @@ class JeopardyApp(QWidget):
 
         buttons = {
             "Play Jeopardy Game": self.show_game_select_screen,
-            "Create Jeopardy Board": lambda: self.stack.setCurrentWidget(self.create_board_page),
-            "Create Final Jeopardy Question": lambda: self.stack.setCurrentWidget(self.create_final_page),
-            "Create Jeopardy Game": lambda: self.stack.setCurrentWidget(self.create_game_page),
+            "Create Jeopardy Board": lambda: self.show_page("create_board"),
+            "Create Final Jeopardy Question": lambda: self.show_page("create_final"),
+            "Create Jeopardy Game": lambda: self.show_page("create_game"),
             "Edit Jeopardy Board": self.show_edit_board_select_page,
             "Edit Final Jeopardy Question": self.show_edit_final_select_page,
+            "Search Clues": lambda: self.show_page("clue_search"),
         }
 
         for label, action in buttons.items():
@@ -106,7 +136,8 @@ class JeopardyApp(QWidget):
         return widget
 
     def return_to_menu(self):
-        self.stack.setCurrentWidget(self.menu_page)
+        with span("page.switch", page="menu"):
+            self.stack.setCurrentWidget(self.menu_page)
 
     # ==== Edit Board Selection ====
     def show_edit_board_select_page(self):
@@ -115,27 +146,20 @@ class JeopardyApp(QWidget):
     def show_edit_board_select_for_game(self, set_path_callback):
         def wrapped_callback(path):
             set_path_callback(path)
-            self.stack.setCurrentWidget(self.create_game_page)
+            self.show_page("create_game")
 
         self.load_edit_board_selector(wrapped_callback)
 
     def load_edit_board_selector(self, callback):
-        # Remove old instance
-        for i in range(self.stack.count()):
-            if self.stack.widget(i).__class__.__name__ == "EditBoardSelectPage":
-                old_widget = self.stack.widget(i)
-                self.stack.removeWidget(old_widget)
-                old_widget.deleteLater()
-                break
-
-        new_page = EditBoardSelectPage(callback, self.return_to_menu)
-        self.stack.addWidget(new_page)
-        self.stack.setCurrentWidget(new_page)
+        # The selector is kept between visits; only the action taken on a pick changes
+        self.page("edit_board_select").set_callback(callback)
+        self.show_page("edit_board_select")
 
     def load_selected_board(self, filepath):
-        self.edit_board_page.clear_board()
-        self.edit_board_page.load_board_from_file(filepath)
-        self.stack.setCurrentWidget(self.edit_board_page)
+        page = self.page("edit_board")
+        page.clear_board()
+        page.load_board_from_file(filepath)
+        self.show_page("edit_board")
 
     # ==== Edit Final Selection ====
     def show_edit_final_select_page(self):
@@ -144,31 +168,30 @@ class JeopardyApp(QWidget):
     def show_edit_final_select_for_game(self, set_path_callback):
         def wrapped_callback(path):
             set_path_callback(path)
-            self.stack.setCurrentWidget(self.create_game_page)
+            self.show_page("create_game")
 
         self.load_edit_final_selector(wrapped_callback)
 
     def load_edit_final_selector(self, callback):
-        # Remove old instance
-        for i in range(self.stack.count()):
-            if self.stack.widget(i).__class__.__name__ == "EditFinalSelectPage":
-                old_widget = self.stack.widget(i)
-                self.stack.removeWidget(old_widget)
-                old_widget.deleteLater()
-                break
-
-        new_page = EditFinalSelectPage(callback, self.return_to_menu)
-        self.stack.addWidget(new_page)
-        self.stack.setCurrentWidget(new_page)
+        # The selector is kept between visits; only the action taken on a pick changes
+        self.page("edit_final_select").set_callback(callback)
+        self.show_page("edit_final_select")
 
     def load_selected_final(self, filepath):
-        self.edit_final_page.load_question_from_file(filepath)
-        self.stack.setCurrentWidget(self.edit_final_page)
+        self.page("edit_final").load_question_from_file(filepath)
+        self.show_page("edit_final")
+
+    # ==== Clue Search ====
+    def open_search_result(self, kind, path):
+        if kind == "boards":
+            self.load_selected_board(path)
+        else:
+            self.load_selected_final(path)
 
     # ==== Game Select ====
     def show_game_select_screen(self):
-        self.stack.setCurrentWidget(self.game_select_screen)
+        self.show_page("game_select")
 
     def load_selected_game(self, game_path):
-        self.play_game_page.load_game(game_path)  # Load the selected game data
-        self.stack.setCurrentWidget(self.play_game_page)  # Switch to the game screen
+        self.page("play_game").load_game(game_path)  # Load the selected game data
+        self.show_page("play_game")  # Switch to the game screen
@@ -0,0 +1,98 @@
+import os
+import errno
+
+# Copies media without ever holding a whole file in memory. On Linux a
+# reflink (FICLONE) is tried first, then copy_file_range and sendfile, which
+# keep the data inside the kernel; everything else streams fixed-size chunks.
+CHUNK_SIZE = 1024 * 1024
+_FICLONE = 0x40049409
+_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF}
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class CopyCancelled(Exception):
+    pass
+
+
+def _check_cancel(cancel):
+    if cancel is not None and cancel.is_set():
+        raise CopyCancelled()
+
+
+def _reflink(src, dst, size, progress, cancel):
+    if fcntl is None or not hasattr(fcntl, "ioctl") or not size:
+        return False
+    try:
+        fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        return False
+    progress(size)
+    return True
+
+
+def _copy_file_range(src, dst, size, progress, cancel):
+    if not hasattr(os, "copy_file_range"):
+        return False
+    return _kernel_copy(
+        lambda offset, count: os.copy_file_range(src.fileno(), dst.fileno(), count, offset, offset),
+        size, progress, cancel
+    )
+
+
+def _sendfile(src, dst, size, progress, cancel):
+    if not hasattr(os, "sendfile"):
+        return False
+    return _kernel_copy(
+        lambda offset, count: os.sendfile(dst.fileno(), src.fileno(), offset, count),
+        size, progress, cancel
+    )
+
+
+def _kernel_copy(copy_chunk, size, progress, cancel):
+    copied = 0
+    try:
+        while copied < size:
+            _check_cancel(cancel)
+            count = copy_chunk(copied, min(CHUNK_SIZE, size - copied))
+            if count == 0:
+                break
+            copied += count
+            progress(count)
+    except OSError as e:
+        if e.errno not in _UNSUPPORTED:
+            raise
+        progress(-copied)
+        return False
+    return copied == size
+
+
+def _stream(src, dst, size, progress, cancel):
+    while True:
+        _check_cancel(cancel)
+        chunk = src.read(CHUNK_SIZE)
+        if not chunk:
+            return True
+        dst.write(chunk)
+        progress(len(chunk))
+
+
+def copy_file(src_path, dst_path, progress=None, cancel=None):
+    """ Copy src_path to dst_path using the cheapest method the filesystem supports.
+
+    progress, if given, is called with the number of bytes copied since the last call.
+    cancel is an optional threading.Event; setting it raises CopyCancelled.
+    """
+    progress = progress or (lambda count: None)
+    with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        for method in (_reflink, _copy_file_range, _sendfile, _stream):
+            if method(src, dst, size, progress, cancel):
+                return
+            # Start the next method from a clean slate
+            src.seek(0)
+            dst.seek(0)
+            dst.truncate()
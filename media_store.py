@@ -0,0 +1,188 @@
+import os
+import re
+import sys
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from util import get_user_data_path
+from util import get_resource_path
+from media_copy import CopyCancelled, copy_file
+
+# Media is stored once, named by the SHA-256 of its contents, e.g.
+# JeopardyData/media/3f/3f9a...e1.jpg, and referenced from clue text as
+# [media:3f9a...e1.jpg]. Older boards keep media in a folder next to the CSV;
+# resolve_media() still finds those through the fallback folder.
+MEDIA_TAG = re.compile(r"\[media:(.+?)\]")
+BLOB_NAME = re.compile(r"^[0-9a-f]{64}\.[A-Za-z0-9]+$")
+RENDITION_NAME = re.compile(r"^([0-9a-f]{64})@\w+\.[A-Za-z0-9]+$")
+_CHUNK_SIZE = 1024 * 1024
+
+
+def get_store_path():
+    return get_user_data_path("media")
+
+
+def is_blob_name(name):
+    return bool(BLOB_NAME.match(name))
+
+
+def blob_path(name):
+    return os.path.join(get_store_path(), name[:2], name)
+
+
+def hash_file(path, progress=None, cancel=None):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+            if cancel is not None and cancel.is_set():
+                raise CopyCancelled()
+            digest.update(chunk)
+            if progress:
+                progress(len(chunk))
+    return digest.hexdigest()
+
+
+def store_media(src_path, progress=None, cancel=None):
+    """ Add a file to the media store (if its contents aren't there already) and return its blob name.
+
+    progress is called with byte counts as the file is hashed and then copied. Every
+    file reports twice its size in total, even when the copy is skipped.
+    """
+    name = os.path.basename(src_path)
+    if is_blob_name(name) and os.path.abspath(src_path) == os.path.abspath(blob_path(name)):
+        if progress:
+            progress(2 * os.path.getsize(src_path))
+        return name
+
+    name = hash_file(src_path, progress, cancel) + os.path.splitext(src_path)[1].lower()
+    dest_path = blob_path(name)
+    if not os.path.exists(dest_path):
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        tmp_path = f"{dest_path}.{threading.get_ident()}.tmp"
+        try:
+            copy_file(src_path, tmp_path, progress, cancel)
+            os.replace(tmp_path, dest_path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    elif progress:
+        progress(os.path.getsize(dest_path))
+    return name
+
+
+def store_media_batch(paths, progress=None, cancel=None, max_workers=4):
+    """ Store several files in parallel. Returns ({path: blob_name}, {path: error}). """
+    names = {}
+    errors = {}
+    unique_paths = list(dict.fromkeys(paths))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(store_media, path, progress, cancel): path for path in unique_paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                names[path] = future.result()
+            except CopyCancelled:
+                raise
+            except Exception as e:
+                errors[path] = e
+    return names, errors
+
+
+def resolve_media(name, fallback_folder=None):
+    """ Return the on-disk path for a [media:...] reference, or None if it can't be found. """
+    if is_blob_name(name):
+        path = blob_path(name)
+        if os.path.isfile(path):
+            return path
+    if fallback_folder:
+        path = os.path.join(fallback_folder, name)
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+def store_tagged_media(text, fallback_folder):
+    """ Rewrite every [media:...] tag in text to a store reference, ingesting legacy media files as needed. """
+    def replace(match):
+        path = resolve_media(match.group(1), fallback_folder)
+        if path is None:
+            return match.group(0)
+        return f"[media:{store_media(path)}]"
+
+    return MEDIA_TAG.sub(replace, text)
+
+
+def referenced_media(rows, fallback_folder=None):
+    """ Return the on-disk paths of every media file referenced from CSV rows. """
+    paths = []
+    for row in rows:
+        for cell in row:
+            for name in MEDIA_TAG.findall(cell):
+                path = resolve_media(name, fallback_folder)
+                if path:
+                    paths.append(path)
+    return paths
+
+
+def library_folders():
+    return [
+        get_user_data_path("boards"),
+        get_user_data_path("finals"),
+        get_user_data_path("games"),
+        get_resource_path("data"),
+    ]
+
+
+def reference_counts():
+    """ Count how many clues across every board, final and game reference each stored blob. """
+    counts = {}
+    for folder in library_folders():
+        for root, _, files in os.walk(folder):
+            for filename in files:
+                if not filename.endswith(".csv"):
+                    continue
+                try:
+                    with open(os.path.join(root, filename), encoding="utf-8") as f:
+                        text = f.read()
+                except (OSError, UnicodeDecodeError):
+                    continue
+                for name in MEDIA_TAG.findall(text):
+                    if is_blob_name(name):
+                        counts[name] = counts.get(name, 0) + 1
+    return counts
+
+
+def collect_garbage(dry_run=False):
+    """ Delete blobs that nothing references. Returns (removed_names, bytes_freed). """
+    counts = reference_counts()
+    referenced_hashes = {name.split(".")[0] for name, count in counts.items() if count > 0}
+    removed = []
+    freed = 0
+    for root, _, files in os.walk(get_store_path()):
+        for filename in files:
+            path = os.path.join(root, filename)
+            if counts.get(filename, 0) > 0:
+                continue
+            rendition = RENDITION_NAME.match(filename)
+            if rendition is not None:
+                # Renditions live exactly as long as their original
+                if rendition.group(1) in referenced_hashes:
+                    continue
+            elif not is_blob_name(filename) and not filename.endswith(".tmp"):
+                continue
+            freed += os.path.getsize(path)
+            removed.append(filename)
+            if not dry_run:
+                os.remove(path)
+    return removed, freed
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2 or sys.argv[1] != "gc":
+        print("Usage: python media_store.py gc [--dry-run]")
+        sys.exit(1)
+
+    dry_run = "--dry-run" in sys.argv[2:]
+    removed, freed = collect_garbage(dry_run)
+    action = "Would remove" if dry_run else "Removed"
+    print(f"{action} {len(removed)} unreferenced blob(s), {freed / (1024 * 1024):.1f} MB")
@@ -0,0 +1,334 @@
+import os
+import json
+import time
+import socket
+import base64
+import asyncio
+import hashlib
+import threading
+
+# A small stdlib-only server for the live services (buzzers, final intake, scoreboard).
+# Each message is one JSON object. Clients either connect over plain TCP and send one
+# object per line, or open a WebSocket and send one object per text frame; the server
+# tells them apart by the first bytes. Messages are handled in data_received, with the
+# arrival time taken before anything else is done, so one client's backlog can't delay
+# another client's timestamp.
+MAX_MESSAGE_BYTES = 64 * 1024
+# A client that stops reading is dropped rather than buffered without limit
+MAX_WRITE_BUFFER = 1024 * 1024
+WEBSOCKET_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+
+def requested_port(argv, flag, env_var, default_port=None):
+    """ The port a service was asked for with `flag [port]` in argv or env_var=<port>; default_port for a bare flag.
+
+    Raises ValueError when env_var isn't a port number.
+    """
+    if flag in argv:
+        index = argv.index(flag)
+        return int(argv[index + 1]) if index + 1 < len(argv) and argv[index + 1].isdigit() else default_port
+    port = os.environ.get(env_var)
+    return int(port) if port else default_port
+
+
+def encode_line(message):
+    return json.dumps(message, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def encode_frame(payload, opcode=0x1):
+    """ One unmasked, unfragmented WebSocket frame, as a server sends it. """
+    length = len(payload)
+    if length < 126:
+        header = bytes((0x80 | opcode, length))
+    elif length < 1 << 16:
+        header = bytes((0x80 | opcode, 126)) + length.to_bytes(2, "big")
+    else:
+        header = bytes((0x80 | opcode, 127)) + length.to_bytes(8, "big")
+    return header + payload
+
+
+class Encoded:
+    """ A message encoded at most once per framing, for sending the same thing to many clients. """
+
+    __slots__ = ("message", "line", "frame")
+
+    def __init__(self, message):
+        self.message = message
+        self.line = None
+        self.frame = None
+
+    def for_line(self):
+        if self.line is None:
+            self.line = encode_line(self.message)
+        return self.line
+
+    def for_frame(self):
+        if self.frame is None:
+            self.frame = encode_frame(encode_line(self.message)[:-1])
+        return self.frame
+
+
+class Connection(asyncio.Protocol):
+    """ One client. The owning MessageServer sees on_connect, on_message and on_disconnect. """
+
+    def __init__(self, server):
+        self.server = server
+        self.transport = None
+        self.buffer = bytearray()
+        self.websocket = None  # None until the first bytes say which framing the client uses
+        self.fragments = bytearray()
+        self.closed = False
+        self.state = None  # for the server's per-client data
+
+    def connection_made(self, transport):
+        self.transport = transport
+        sock = transport.get_extra_info("socket")
+        if sock is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.connections.add(self)
+        self.server.on_connect(self)
+
+    def connection_lost(self, exc):
+        self.closed = True
+        if self in self.server.connections:
+            self.server.connections.discard(self)
+            self.server.on_disconnect(self)
+
+    def data_received(self, data):
+        received = time.monotonic()
+        self.buffer += data
+        if self.websocket is None:
+            if len(self.buffer) < 4:
+                return
+            if self.buffer[:4] != b"GET ":
+                self.websocket = False
+            elif not self.handshake():
+                return
+        messages = self.read_frames() if self.websocket else self.read_lines()
+        for payload in messages:
+            try:
+                message = json.loads(payload)
+            except ValueError:
+                continue
+            if isinstance(message, dict):
+                self.server.on_message(self, message, received)
+                if self.closed:
+                    return
+        if len(self.buffer) > MAX_MESSAGE_BYTES:
+            self.close()
+
+    def handshake(self):
+        end = self.buffer.find(b"\r\n\r\n")
+        if end < 0:
+            if len(self.buffer) > MAX_MESSAGE_BYTES:
+                self.close()
+            return False
+        request = bytes(self.buffer[:end]).decode("latin-1").split("\r\n")
+        del self.buffer[:end + 4]
+        headers = {}
+        for line in request[1:]:
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+
+        key = headers.get("sec-websocket-key")
+        if key is None or "websocket" not in headers.get("upgrade", "").lower():
+            page = self.server.http_page(request[0].split(" ")[1] if " " in request[0] else "/")
+            if page is None:
+                self.transport.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+            else:
+                body = page.encode("utf-8")
+                self.transport.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: text/html; charset=utf-8\r\n"
+                    + f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode("ascii") + body
+                )
+            self.close()
+            return False
+
+        accept = base64.b64encode(hashlib.sha1(key.encode("ascii") + WEBSOCKET_GUID).digest())
+        self.transport.write(
+            b"HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept + b"\r\n\r\n"
+        )
+        self.websocket = True
+        return True
+
+    def read_lines(self):
+        messages = []
+        start = 0
+        while True:
+            end = self.buffer.find(b"\n", start)
+            if end < 0:
+                break
+            if end > start:
+                messages.append(bytes(self.buffer[start:end]))
+            start = end + 1
+        del self.buffer[:start]
+        return messages
+
+    def read_frames(self):
+        messages = []
+        buffer = self.buffer
+        while len(buffer) >= 2:
+            opcode = buffer[0] & 0x0F
+            fin = buffer[0] & 0x80
+            masked = buffer[1] & 0x80
+            length = buffer[1] & 0x7F
+            offset = 2
+            if length == 126:
+                if len(buffer) < 4:
+                    break
+                length = int.from_bytes(buffer[2:4], "big")
+                offset = 4
+            elif length == 127:
+                if len(buffer) < 10:
+                    break
+                length = int.from_bytes(buffer[2:10], "big")
+                offset = 10
+            if length > MAX_MESSAGE_BYTES:
+                self.close()
+                break
+            mask_end = offset + (4 if masked else 0)
+            if len(buffer) < mask_end + length:
+                break
+            payload = bytes(buffer[mask_end:mask_end + length])
+            if masked:
+                mask = bytes(buffer[offset:mask_end]) * (length // 4 + 1)
+                payload = (int.from_bytes(payload, "big") ^ int.from_bytes(mask[:length], "big")).to_bytes(length, "big")
+            del buffer[:mask_end + length]
+
+            if opcode == 0x8:
+                self.transport.write(encode_frame(b"", 0x8))
+                self.close()
+                break
+            if opcode == 0x9:
+                self.transport.write(encode_frame(payload, 0xA))
+            elif opcode in (0x0, 0x1, 0x2):
+                self.fragments += payload
+                if fin:
+                    messages.append(bytes(self.fragments))
+                    self.fragments.clear()
+        return messages
+
+    def send(self, message):
+        self.send_encoded(message if isinstance(message, Encoded) else Encoded(message))
+
+    def send_encoded(self, encoded):
+        # Clients speak first, so until then there's no framing to send in
+        if self.closed or self.websocket is None:
+            return
+        self.transport.write(encoded.for_frame() if self.websocket else encoded.for_line())
+        if self.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.close()
+
+    def close(self):
+        if not self.closed:
+            self.closed = True
+            self.transport.close()
+
+
+class MessageServer:
+    """ Base for a service: override the on_* hooks. Every hook runs on the server's event loop. """
+
+    def __init__(self):
+        self.connections = set()
+        self.server = None
+
+    async def start(self, host, port):
+        loop = asyncio.get_running_loop()
+        self.server = await loop.create_server(lambda: Connection(self), host, port, backlog=1024)
+        return self.server.sockets[0].getsockname()[1]
+
+    def stop(self):
+        if self.server is not None:
+            self.server.close()
+        for connection in list(self.connections):
+            connection.close()
+
+    def broadcast(self, message):
+        encoded = Encoded(message)
+        for connection in list(self.connections):
+            connection.send_encoded(encoded)
+
+    def on_connect(self, connection):
+        pass
+
+    def on_message(self, connection, message, received):
+        """ received is the time.monotonic() at which the bytes carrying message arrived. """
+
+    def on_disconnect(self, connection):
+        pass
+
+    def http_page(self, path):
+        """ HTML served to a plain browser request for path, or None for a 404. """
+        return None
+
+
+class ServerThread:
+    """ Runs a MessageServer on its own event loop in a daemon thread, so it never waits on Qt. """
+
+    def __init__(self, server, host="0.0.0.0", port=0):
+        self.server = server
+        self.host = host
+        self.port = port
+        self.loop = None
+        self.thread = None
+
+    def start(self):
+        """ Start listening; returns the bound port. Raises OSError if the port can't be bound. """
+        started = threading.Event()
+        outcome = {}
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            try:
+                outcome["port"] = self.loop.run_until_complete(self.server.start(self.host, self.port))
+            except OSError as e:
+                outcome["error"] = e
+                started.set()
+                self.loop.close()
+                return
+            started.set()
+            self.loop.run_forever()
+            self.server.stop()
+            self.loop.run_until_complete(asyncio.sleep(0))
+            self.loop.close()
+
+        self.thread = threading.Thread(target=run, name=type(self.server).__name__, daemon=True)
+        self.thread.start()
+        started.wait()
+        if "error" in outcome:
+            raise outcome["error"]
+        self.port = outcome["port"]
+        return self.port
+
+    def call(self, func, *args):
+        """ Run func(*args) on the server's loop; safe to call from any thread. """
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(func, *args)
+
+    def stop(self):
+        if self.loop is not None and not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(timeout=2)
+
+
+class Service:
+    """ A MessageServer on its own ServerThread. Subclasses add methods that hand work to the
+    server with call(), so all of them are safe to call from the GUI thread.
+    """
+
+    default_port = 0
+
+    def __init__(self, server, port=None, host="0.0.0.0"):
+        self.server = server
+        self.thread = ServerThread(server, host, self.default_port if port is None else port)
+
+    def start(self):
+        """ Start listening; returns the bound port. Raises OSError if the port can't be bound. """
+        return self.thread.start()
+
+    def call(self, func, *args):
+        self.thread.call(func, *args)
+
+    def stop(self):
+        self.thread.stop()
@@ -0,0 +1,124 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Downscaled copies of an image, written next to the original at save time:
+#   3f9a...e1.jpg -> 3f9a...e1@thumb.jpg, 3f9a...e1@display.jpg, 3f9a...e1@hd.jpg
+# Playback picks the smallest one that still covers the size it needs, so the
+# kiosk PCs decode a 400px JPEG instead of the full-size upload. Renditions with
+# no max height are exactly max width wide; hd only fits a box, so a portrait
+# image's hd can be much narrower than 1920px.
+# (label, max width, max height)
+RENDITIONS = (
+    ("thumb", 160, None),
+    ("display", 400, None),
+    ("hd", 1920, 1080),
+)
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+JPEG_QUALITY = 85
+
+
+def is_renderable(path):
+    return path.lower().endswith(IMAGE_EXTENSIONS) and "@" not in os.path.basename(path)
+
+
+def rendition_name(name, label):
+    base, ext = os.path.splitext(name)
+    if ext.lower() == ".bmp":
+        ext = ".png"
+    return f"{base}@{label}{ext}"
+
+
+def rendition_path(path, label):
+    return os.path.join(os.path.dirname(path), rendition_name(os.path.basename(path), label))
+
+
+def render_file(path):
+    """ Write any missing or outdated renditions for one image. Returns how many were written. """
+    # Imported here so worker processes only pay for QtGui when they actually render
+    from PySide6.QtCore import Qt
+    from PySide6.QtGui import QImage
+
+    source_mtime = os.stat(path).st_mtime
+    todo = []
+    for label, max_width, max_height in RENDITIONS:
+        target = rendition_path(path, label)
+        if not os.path.exists(target) or os.stat(target).st_mtime < source_mtime:
+            todo.append((label, max_width, max_height, target))
+    if not todo:
+        return 0
+
+    image = QImage(path)
+    if image.isNull():
+        return 0
+
+    written = 0
+    for label, max_width, max_height, target in todo:
+        # Never upscale: an image smaller than the rendition is its own best rendition
+        if image.width() <= max_width and (max_height is None or image.height() <= max_height):
+            continue
+        if max_height is None:
+            scaled = image.scaledToWidth(max_width, Qt.SmoothTransformation)
+        else:
+            scaled = image.scaled(max_width, max_height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        tmp_path = f"{target}.{os.getpid()}.tmp"
+        quality = JPEG_QUALITY if target.lower().endswith((".jpg", ".jpeg")) else -1
+        if scaled.save(tmp_path, os.path.splitext(target)[1][1:].upper(), quality):
+            os.replace(tmp_path, target)
+            written += 1
+        elif os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    return written
+
+
+def generate_renditions(paths, max_workers=None):
+    """ Render every image in paths on a process pool. Returns the number of renditions written. """
+    paths = [path for path in dict.fromkeys(paths) if path and is_renderable(path) and os.path.isfile(path)]
+    if not paths:
+        return 0
+    if len(paths) == 1:
+        return render_file(paths[0])
+
+    # spawn, not fork: forking a process that has Qt threads running is not safe
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as executor:
+            return sum(executor.map(render_file, paths))
+    except (OSError, RuntimeError) as e:
+        print(f"Process pool unavailable, rendering inline: {e}")
+        return sum(render_file(path) for path in paths)
+
+
+def image_width(source):
+    """ Width of an image (a path, or its bytes) read from its header, or None if it can't be read. """
+    from PySide6.QtCore import QBuffer, QByteArray, QIODevice
+    from PySide6.QtGui import QImageReader
+
+    if isinstance(source, (bytes, bytearray)):
+        buffer = QBuffer()
+        buffer.setData(QByteArray(source))
+        buffer.open(QIODevice.ReadOnly)
+        size = QImageReader(buffer).size()
+    else:
+        size = QImageReader(source).size()
+    return size.width() if size.isValid() else None
+
+
+def best_rendition(width, exists, name, rendition_width=None):
+    """ Pick the smallest rendition of name at least width pixels wide, falling back to name itself.
+
+    exists(candidate) says whether a rendition is available, so this works for files and game packs alike.
+    rendition_width(candidate) gives the real width of a box-bounded rendition; without it they're passed over.
+    """
+    for label, max_width, max_height in RENDITIONS:
+        if max_width < width:
+            continue
+        candidate = rendition_name(name, label)
+        if not exists(candidate):
+            continue
+        if max_height is None:
+            return candidate
+        actual = rendition_width(candidate) if rendition_width is not None else None
+        if actual is not None and actual >= width:
+            return candidate
+    return name
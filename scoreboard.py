@@ -0,0 +1,169 @@
+import time
+import asyncio
+from message_server import MessageServer, Service
+
+# The live board for lobby screens. Displays open the page served at
+# http://<host>:<port>/ (or connect over a WebSocket or TCP with one JSON object per
+# line and send {"type": "hello"}). A display first gets the whole state, then only
+# what changed, at most once per frame:
+#   <- {"type": "snapshot", "seq": 41, "round": {...}, "used": [0, 7], "clue": null, "scores": {}}
+#   <- {"type": "delta", "seq": 42, "used": [12], "clue": {"index": 12, "text": "..."}}
+# "round" carries the board layout and starts a fresh set of used cells; "used" lists
+# cells played since; "clue" is the clue on screen (null when the board is showing);
+# "scores" maps names to their new scores. Every key in a delta is idempotent, so a
+# display that gets a delta already folded into its snapshot ends up in the same state.
+DEFAULT_PORT = 8767
+FRAME_INTERVAL = 1 / 30
+
+
+class ScoreboardServer(MessageServer):
+    """ Keeps the current board state and fans changes out to every display.
+
+    publish(event) must be called on the server's loop; events published within one
+    frame reach the displays as a single delta.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.seq = 0
+        self.round = None
+        self.used = set()
+        self.clue = None
+        self.scores = {}
+        self.pending = {}
+        self.last_frame = 0.0
+        self.frame_handle = None
+        self.frames = 0
+
+    def on_message(self, connection, message, received):
+        if message.get("type") == "hello":
+            connection.send(self.snapshot())
+
+    def snapshot(self):
+        return {
+            "type": "snapshot", "seq": self.seq, "round": self.round,
+            "used": sorted(self.used), "clue": self.clue, "scores": self.scores,
+        }
+
+    def publish(self, event):
+        pending = self.pending
+        if "round" in event:
+            self.round = event["round"]
+            self.used = set()
+            self.clue = None
+            pending["round"] = self.round
+            pending["clue"] = None
+            pending.pop("used", None)
+        if "used" in event:
+            self.used.update(event["used"])
+            pending.setdefault("used", []).extend(event["used"])
+        if "clue" in event:
+            self.clue = event["clue"]
+            pending["clue"] = self.clue
+        if "scores" in event:
+            self.scores.update(event["scores"])
+            pending.setdefault("scores", {}).update(event["scores"])
+
+        if self.frame_handle is None:
+            # The first change after a quiet spell goes out at once; a burst waits for the next frame
+            loop = asyncio.get_running_loop()
+            delay = max(self.last_frame + FRAME_INTERVAL - time.monotonic(), 0.0)
+            self.frame_handle = loop.call_later(delay, self.send_frame)
+
+    def send_frame(self):
+        self.frame_handle = None
+        self.last_frame = time.monotonic()
+        if not self.pending:
+            return
+        self.seq += 1
+        self.frames += 1
+        delta, self.pending = self.pending, {}
+        delta["type"] = "delta"
+        delta["seq"] = self.seq
+        self.broadcast(delta)
+
+    def http_page(self, path):
+        return DISPLAY_PAGE if path in ("/", "/index.html") else None
+
+
+def round_event(round_name, board):
+    """ The "round" part of an event for a board, or for Final Jeopardy when board is None. """
+    if board is None:
+        return {"name": round_name}
+    return {
+        "name": round_name,
+        "categories": list(board.categories),
+        "values": list(board.values),
+        "cols": board.cols,
+        "clues": [i for i in range(len(board)) if board.has_clue(i)],
+    }
+
+
+class ScoreboardService(Service):
+    default_port = DEFAULT_PORT
+
+    def __init__(self, port=None, host="0.0.0.0"):
+        super().__init__(ScoreboardServer(), port, host)
+
+    def publish(self, event):
+        self.call(self.server.publish, event)
+
+
+DISPLAY_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Jeopardy Board</title>
+<style>
+body { margin: 0; background: #060CE9; color: white; font-family: sans-serif; height: 100vh; display: flex; flex-direction: column; }
+#board { flex: 1; display: grid; gap: 4px; padding: 4px; }
+#board div { display: flex; align-items: center; justify-content: center; text-align: center; background: #0000cc; border: 2px solid white; font-size: 2.2vw; }
+#board .category { background: #000099; font-size: 1.6vw; padding: 4px; }
+#board .value { color: gold; font-weight: bold; }
+#board .empty { background: transparent; border-color: transparent; }
+#clue { position: fixed; inset: 0; background: #060CE9; display: none; align-items: center; justify-content: center; text-align: center; font-size: 4vw; padding: 5vw; }
+#scores { display: flex; justify-content: space-around; font-size: 2vw; padding: 8px; }
+</style></head>
+<body>
+<div id="board"></div><div id="scores"></div><div id="clue"></div>
+<script>
+let state = {round: null, used: new Set(), clue: null, scores: {}};
+function apply(message) {
+  if ("round" in message) { state.round = message.round; state.used = new Set(); }
+  if ("used" in message) message.used.forEach((index) => state.used.add(index));
+  if ("clue" in message) state.clue = message.clue;
+  if ("scores" in message) Object.assign(state.scores, message.scores);
+  render();
+}
+function render() {
+  const board = document.getElementById("board"), round = state.round;
+  board.innerHTML = "";
+  if (round && round.categories) {
+    const clues = new Set(round.clues);
+    board.style.gridTemplateColumns = "repeat(" + round.cols + ", 1fr)";
+    round.categories.forEach((title) => { const cell = document.createElement("div"); cell.className = "category"; cell.textContent = title; board.appendChild(cell); });
+    round.values.forEach((value, row) => {
+      for (let col = 0; col < round.cols; col++) {
+        const index = row * round.cols + col, cell = document.createElement("div");
+        const live = clues.has(index) && !state.used.has(index);
+        cell.className = live ? "value" : "empty";
+        cell.textContent = live ? "$" + value : "";
+        board.appendChild(cell);
+      }
+    });
+  } else if (round) {
+    board.innerHTML = "<div>Final Jeopardy</div>";
+  }
+  const clue = document.getElementById("clue");
+  clue.style.display = state.clue ? "flex" : "none";
+  if (state.clue) clue.textContent = state.clue.daily_double ? "Daily Double!" : (state.clue.text || state.clue.category || "");
+  document.getElementById("scores").textContent = Object.entries(state.scores).map(([name, score]) => name + ": $" + score).join("   ");
+}
+function connect() {
+  const socket = new WebSocket("ws://" + location.host + "/");
+  socket.onopen = () => socket.send(JSON.stringify({type: "hello"}));
+  socket.onmessage = (event) => apply(JSON.parse(event.data));
+  socket.onclose = () => setTimeout(connect, 1000);
+}
+connect();
+</script>
+</body></html>
+"""
@@ -0,0 +1,150 @@
+import os
+import sys
+import time
+import random
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from game_engine import GameEngine, DAILY_DOUBLES_PER_ROUND
+from game_cache import parse_game
+from util import get_resource_path
+
+# Plays games on the headless GameEngine with uniformly random picks, checking the
+# rules after every round and tallying where the daily doubles landed. Run it after
+# touching game_engine.py:  python simulate.py [games] [game folder or .jpack]
+DEFAULT_GAMES = 20_000
+DEFAULT_GAME = get_resource_path("data/games/07-13-2016")
+BATCH_SIZE = 1_000
+
+_game = None  # (rounds, round_data), set once per worker process
+
+
+def _init_worker(rounds, round_data):
+    global _game
+    _game = (rounds, round_data)
+
+
+def play_game(engine, rng, results):
+    """ Play one game to the end, checking the rules as it goes. """
+    engine.start()
+    while True:
+        board = engine.board
+        clue_count = board.clue_count()
+        order = board.available()
+        rng.shuffle(order)
+
+        found = []
+        for pick_number, index in enumerate(order):
+            daily_double = engine.pick(index)
+            if daily_double is None:
+                results["violations"][f"{engine.round_name}: unplayed cell {index} reported as used"] += 1
+            elif daily_double:
+                if pick_number == 0:
+                    results["violations"][f"{engine.round_name}: daily double on the opening pick"] += 1
+                row, col = board.position(index)
+                results["positions"][(engine.round_name, row, col)] += 1
+                results["pick_numbers"][(engine.round_name, pick_number)] += 1
+                found.append(index)
+        results["picks"] += len(order)
+
+        if not engine.is_round_over():
+            results["violations"][f"{engine.round_name}: round not over after every clue was played"] += 1
+        if len(found) != min(DAILY_DOUBLES_PER_ROUND, max(clue_count - 1, 0)):
+            results["violations"][f"{engine.round_name}: {len(found)} daily doubles on {clue_count} clues"] += 1
+        if order and engine.pick(order[0]) is not None:
+            results["violations"][f"{engine.round_name}: a played cell was accepted twice"] += 1
+
+        if engine.next_round() is None or not engine.advance():
+            break
+
+    engine.final_category()
+    engine.final_question()
+    results["games"] += 1
+
+
+def simulate_batch(seed, games):
+    """ Play games random games on the worker's game. Returns the tallies. """
+    rounds, round_data = _game
+    rng = random.Random(seed)
+    engine = GameEngine(rounds, round_data, rng)
+    results = {"games": 0, "picks": 0, "positions": Counter(), "pick_numbers": Counter(), "violations": Counter()}
+    for _ in range(games):
+        play_game(engine, rng, results)
+    return results
+
+
+def merge(totals, results):
+    totals["games"] += results["games"]
+    totals["picks"] += results["picks"]
+    for key in ("positions", "pick_numbers", "violations"):
+        totals[key].update(results[key])
+
+
+def simulate(game_path, games, seed=0, max_workers=None):
+    """ Play games random games of game_path across a process pool. Returns the merged tallies. """
+    rounds, round_data, _ = parse_game(game_path)
+    batches = [(seed + i, min(BATCH_SIZE, games - start)) for i, start in enumerate(range(0, games, BATCH_SIZE))]
+    totals = {"games": 0, "picks": 0, "positions": Counter(), "pick_numbers": Counter(), "violations": Counter()}
+
+    # spawn, not fork, to match the rest of the app's process pools
+    context = multiprocessing.get_context("spawn")
+    try:
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=context,
+                                 initializer=_init_worker, initargs=(rounds, round_data)) as executor:
+            for results in executor.map(simulate_batch, *zip(*batches)):
+                merge(totals, results)
+    except (OSError, RuntimeError) as e:
+        print(f"Process pool unavailable, simulating inline: {e}")
+        _init_worker(rounds, round_data)
+        for batch_seed, count in batches:
+            merge(totals, simulate_batch(batch_seed, count))
+    totals["rounds"], totals["round_data"] = rounds, round_data
+    return totals
+
+
+def print_distribution(totals):
+    round_data = totals["round_data"]
+    placed_rounds = {key[0] for key in totals["positions"]}
+    for round_name in [name for name in totals["rounds"] if name in placed_rounds]:
+        board = round_data[round_name]
+        placed = sum(n for key, n in totals["positions"].items() if key[0] == round_name)
+        print(f"\n{round_name}: {placed} daily doubles over {totals['games']} games")
+
+        by_row = Counter()
+        by_col = Counter()
+        for (name, row, col), n in totals["positions"].items():
+            if name == round_name:
+                by_row[row] += n
+                by_col[col] += n
+        for row in range(board.rows):
+            cells = sum(board.has_clue(board.index(row, col)) for col in range(board.cols))
+            expected = 100 * cells / board.clue_count()
+            print(f"  row {row + 1} (${board.values[row]:>5}) {100 * by_row[row] / placed:6.2f}%  uniform {expected:6.2f}%")
+        print("  by column: " + "  ".join(f"{100 * by_col[col] / placed:5.2f}%" for col in range(board.cols)))
+
+        picks = [(number, n) for (name, number), n in totals["pick_numbers"].items() if name == round_name]
+        mean_pick = sum(number * n for number, n in picks) / placed
+        print(f"  found on average at pick {mean_pick + 1:.1f} of {board.clue_count()}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 3 or (len(sys.argv) > 1 and not sys.argv[1].isdigit()):
+        print("Usage: python simulate.py [games] [game folder or .jpack]")
+        sys.exit(1)
+
+    games = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_GAMES
+    game_path = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_GAME
+
+    started = time.perf_counter()
+    totals = simulate(game_path, games)
+    elapsed = time.perf_counter() - started
+    print(f"Played {totals['games']} games ({totals['picks']} picks) of {os.path.basename(game_path)} "
+          f"in {elapsed:.2f} s: {totals['games'] / elapsed:,.0f} games/s on {os.cpu_count()} CPUs")
+    print_distribution(totals)
+
+    if totals["violations"]:
+        print("\nRule violations:")
+        for message, count in totals["violations"].most_common():
+            print(f"  {count:>8}  {message}")
+        sys.exit(1)
+    print("\nNo rule violations")
@@ -0,0 +1,110 @@
+import os
+import sys
+import json
+import time
+import atexit
+import threading
+import functools
+
+# Named spans written as Chrome trace JSON (open in chrome://tracing or Perfetto).
+# Off unless JEOPARDY_TRACE=<path> is set or the app is started with
+# --trace <path>; when off, span() hands back one shared no-op context so the
+# instrumented hot paths pay a function call and nothing else.
+_events = []
+_lock = threading.Lock()
+_trace_path = None
+_origin = time.perf_counter()
+
+
+class _NullSpan:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("name", "args", "started")
+
+    def __init__(self, name, args):
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        ended = time.perf_counter()
+        event = {
+            "name": self.name,
+            "ph": "X",
+            "ts": (self.started - _origin) * 1e6,
+            "dur": (ended - self.started) * 1e6,
+            "pid": os.getpid(),
+            "tid": threading.get_ident(),
+        }
+        if self.args:
+            event["args"] = self.args
+        with _lock:
+            _events.append(event)
+        return False
+
+
+def is_enabled():
+    return _trace_path is not None
+
+
+def enable(path):
+    """ Start recording spans; they are written to path when the process exits (or on flush()). """
+    global _trace_path
+    if _trace_path is None:
+        atexit.register(flush)
+    _trace_path = path
+
+
+def span(name, **args):
+    """ Context manager timing the enclosed block as one trace event. """
+    if _trace_path is None:
+        return _NULL_SPAN
+    return _Span(name, args)
+
+
+def traced(name):
+    """ Decorator form of span() for whole methods. """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _trace_path is None:
+                return func(*args, **kwargs)
+            with _Span(name, None):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def flush():
+    if _trace_path is None:
+        return
+    with _lock:
+        events = list(_events)
+    try:
+        with open(_trace_path, "w", encoding="utf-8") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+    except OSError as e:
+        print(f"Failed to write trace {_trace_path}: {e}")
+
+
+def configure(argv=None):
+    """ Enable tracing from --trace <path> in argv or the JEOPARDY_TRACE environment variable. """
+    argv = sys.argv if argv is None else argv
+    path = os.environ.get("JEOPARDY_TRACE")
+    if "--trace" in argv:
+        index = argv.index("--trace")
+        path = argv[index + 1] if index + 1 < len(argv) else "jeopardy-trace.json"
+    if path:
+        enable(path)
@@ -0,0 +1,188 @@
+from PySide6.QtWidgets import QTableView, QHeaderView, QStyledItemDelegate, QStyle, QAbstractItemView
+from PySide6.QtCore import Qt, Signal, QAbstractTableModel, QModelIndex
+from PySide6.QtGui import QColor, QFont, QPen
+from ui.text_fit import FitHeaderView
+
+CELL_WIDTH = 160
+CATEGORY_HEIGHT = 80
+BUTTON_HEIGHT = 80
+
+# Cell states reported by BoardModel under CELL_STATE_ROLE
+EMPTY, OPEN, USED, FILLED = range(4)
+CELL_STATE_ROLE = Qt.UserRole + 1
+
+# The table and its category header are styled once for the whole page; the
+# cells themselves are painted by BoardDelegate.
+BOARD_STYLESHEET = """
+    QTableView#board {
+        background-color: #060CE9;
+        border: none;
+    }
+    QTableView#board QHeaderView::section {
+        color: white;
+        padding: 6px;
+        border: 2px solid #ffffff;
+        background-color: #000099;
+    }
+"""
+
+EDITOR_BOARD_STYLESHEET = """
+    QTableView#board QHeaderView::section {
+        background-color: #333333;
+        color: white;
+        border: 2px solid #000;
+        font-weight: bold;
+    }
+    QTableView#board QHeaderView::section:hover {
+        border: 3px solid blue;
+    }
+"""
+
+# state: (fill, text, border, border width), then the same while hovered
+PLAY_CELL_STYLES = {
+    OPEN: (("#0000cc", "gold", "white", 2), ("#0000ff", "gold", "white", 2)),
+    USED: (("#222222", "#888888", "gray", 2), ("#222222", "#888888", "gray", 2)),
+}
+EDIT_CELL_STYLES = {
+    EMPTY: (("#1E90FF", "white", "#000000", 2), ("#1E90FF", "white", "blue", 3)),
+    FILLED: (("#1E90FF", "white", "red", 3), ("#1E90FF", "white", "darkred", 4)),
+}
+
+
+class BoardModel(QAbstractTableModel):
+    """ Table model over a BoardState; category titles are the horizontal header. """
+
+    def __init__(self, editing=False, parent=None):
+        super().__init__(parent)
+        self.editing = editing
+        self.board = None
+        self.titles = []
+
+    def set_board(self, board, titles=None):
+        self.beginResetModel()
+        self.board = board
+        self.titles = list(titles) if titles is not None else None
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self.board is None else self.board.rows
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() or self.board is None else self.board.cols
+
+    def cell_state(self, index):
+        clue = self.board.clues[index]
+        if self.editing:
+            return FILLED if clue is not None and clue.text else EMPTY
+        if clue is None:
+            return EMPTY
+        return USED if self.board.used[index] else OPEN
+
+    def data(self, index, role=Qt.DisplayRole):
+        if self.board is None or not index.isValid():
+            return None
+        cell = index.row() * self.board.cols + index.column()
+        if role == CELL_STATE_ROLE:
+            return self.cell_state(cell)
+        if role == Qt.DisplayRole:
+            if self.editing or self.board.clues[cell] is not None:
+                return f"${self.board.values[index.row()]}"
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or orientation != Qt.Horizontal or self.board is None:
+            return None
+        titles = self.titles if self.titles is not None else self.board.categories
+        return titles[section] if section < len(titles) else None
+
+    def cell_changed(self, cell):
+        index = self.index(*self.board.position(cell))
+        self.dataChanged.emit(index, index)
+
+    def category_changed(self, col, title=None):
+        if self.titles is not None and title is not None:
+            self.titles[col] = title
+        self.headerDataChanged.emit(Qt.Horizontal, col, col)
+
+
+class BoardDelegate(QStyledItemDelegate):
+    """ Paints board cells directly, so only the cells scrolled into view cost anything. """
+
+    def __init__(self, editing=False, parent=None):
+        super().__init__(parent)
+        self.styles = EDIT_CELL_STYLES if editing else PLAY_CELL_STYLES
+        self.font = QFont()
+        self.font.setPixelSize(16 if editing else 20)
+        self.font.setBold(not editing)
+
+    def paint(self, painter, option, index):
+        styles = self.styles.get(index.data(CELL_STATE_ROLE))
+        if styles is None:
+            return
+        fill, text, border, width = styles[1 if option.state & QStyle.State_MouseOver else 0]
+        rect = option.rect
+        painter.save()
+        painter.fillRect(rect, QColor(fill))
+        painter.setPen(QPen(QColor(border), width))
+        painter.drawRect(rect.adjusted(width // 2, width // 2, -(width + 1) // 2, -(width + 1) // 2))
+        painter.setPen(QColor(text))
+        painter.setFont(self.font)
+        painter.drawText(rect, Qt.AlignCenter, index.data(Qt.DisplayRole) or "")
+        painter.restore()
+
+
+class BoardView(QTableView):
+    """ The category/value grid for playing (clue_clicked) or editing (clue_clicked and category_clicked). """
+
+    clue_clicked = Signal(int)  # cell index into the BoardState
+    category_clicked = Signal(int)  # column
+
+    def __init__(self, editing=False, parent=None):
+        super().__init__(parent)
+        self.editing = editing
+        self.setObjectName("board")
+        self.board_model = BoardModel(editing, self)
+        # Category titles are sized to fill their header section instead of wrapping at a fixed size
+        self.setHorizontalHeader(FitHeaderView(parent=self))
+        self.setModel(self.board_model)
+        self.setItemDelegate(BoardDelegate(editing, self))
+
+        self.setSelectionMode(QAbstractItemView.NoSelection)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setFocusPolicy(Qt.NoFocus)
+        self.setShowGrid(False)
+        self.setMouseTracking(True)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.verticalHeader().hide()
+        self.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.verticalHeader().setDefaultSectionSize(BUTTON_HEIGHT)
+        header = self.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Fixed)
+        header.setDefaultSectionSize(CELL_WIDTH)
+        header.setFixedHeight(CATEGORY_HEIGHT)
+        header.setHighlightSections(False)
+        header.setSectionsClickable(editing)
+        header.sectionClicked.connect(self.category_clicked)
+        self.clicked.connect(self.on_clicked)
+
+    @property
+    def board(self):
+        return self.board_model.board
+
+    def show_round(self, board, titles=None):
+        """ Show a BoardState, with optional display titles (e.g. wrapped) in place of its categories. """
+        self.board_model.set_board(board, titles)
+        self.horizontalHeader().fit_titles()
+
+    def on_clicked(self, index):
+        cell = self.board.index(index.row(), index.column())
+        if self.editing or self.board_model.cell_state(cell) == OPEN:
+            self.clue_clicked.emit(cell)
+
+    def refresh_cell(self, cell):
+        self.board_model.cell_changed(cell)
+
+    def refresh_category(self, col, title=None):
+        self.board_model.category_changed(col, title)
+        self.horizontalHeader().viewport().update()
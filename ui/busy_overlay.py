@@ -0,0 +1,81 @@
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton
+from PySide6.QtCore import Qt, QEvent, QTimer
+
+# Quick loads and saves finish before the overlay would appear, so they don't flash it
+SHOW_DELAY_MS = 200
+
+
+class BusyOverlay(QWidget):
+    """ Covers a page while one of its I/O jobs runs, showing the job's label and a Cancel button.
+
+    The rest of the window keeps running; only the covered page stops taking clicks.
+    """
+
+    def __init__(self, parent):
+        super().__init__(parent)
+        self.job = None
+        self.setAttribute(Qt.WA_StyledBackground, True)
+        self.setStyleSheet("""
+            BusyOverlay { background-color: rgba(0, 0, 0, 160); }
+            QLabel { color: white; font-size: 20px; background-color: transparent; }
+            QPushButton {
+                border: 2px solid white;
+                color: white;
+                font-size: 16px;
+                padding: 6px 24px;
+                background-color: transparent;
+            }
+            QPushButton:hover { background-color: #72729c; }
+        """)
+
+        layout = QVBoxLayout(self)
+        layout.addStretch()
+        self.label = QLabel("")
+        self.label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.label)
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.clicked.connect(self.cancel)
+        layout.addWidget(self.cancel_button, 0, Qt.AlignHCenter)
+        layout.addStretch()
+
+        self.show_timer = QTimer(self)
+        self.show_timer.setSingleShot(True)
+        self.show_timer.setInterval(SHOW_DELAY_MS)
+        self.show_timer.timeout.connect(self.reveal)
+        parent.installEventFilter(self)
+        self.hide()
+
+    def track(self, job):
+        """ Show the overlay for job until it finishes, fails or is cancelled. """
+        self.job = job
+        self.label.setText(job.label)
+        self.cancel_button.setEnabled(True)
+        job.finished.connect(self.release)
+        job.failed.connect(self.release)
+        job.cancelled.connect(self.release)
+        self.show_timer.start()
+
+    def reveal(self):
+        if self.job is not None:
+            self.setGeometry(self.parentWidget().rect())
+            self.raise_()
+            self.show()
+
+    def release(self):
+        if self.sender() is not self.job:
+            return
+        self.job = None
+        self.show_timer.stop()
+        self.hide()
+
+    def cancel(self):
+        # The overlay stays up until the job reports back; a running save may still finish
+        if self.job is not None and not self.job.is_cancelled():
+            self.label.setText("Cancelling...")
+            self.cancel_button.setEnabled(False)
+            self.job.cancel()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Resize:
+            self.setGeometry(self.parentWidget().rect())
+        return False
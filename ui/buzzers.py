@@ -0,0 +1,48 @@
+from PySide6.QtCore import QObject, QCoreApplication, Signal
+from ui.live_service import start_service
+
+
+class Buzzers(QObject):
+    """ The buzzer service as seen from the GUI: results arrive as a signal on the GUI thread. """
+
+    buzzed = Signal(object)  # the result dict: clue, winner, reaction_ms, presses
+
+    def __init__(self, port, parent=None):
+        super().__init__(parent)
+        from buzzer import BuzzerService
+        # emit() from the server thread is queued onto the GUI thread for connected slots
+        self.service = BuzzerService(port, on_result=self.buzzed.emit)
+        self.port = self.service.start()
+        self.winners = []  # who has already buzzed in on the open clue
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.service.stop)
+
+    def open(self, clue):
+        self.winners = []
+        self.service.open(clue)
+
+    def reopen(self, clue):
+        """ Open the clue again for everyone who hasn't buzzed in on it yet, e.g. after a wrong answer. """
+        self.service.open(clue, self.winners)
+
+    def record_winner(self, name):
+        self.winners.append(name)
+
+    def close(self):
+        self.service.close()
+
+
+_buzzers = None
+
+
+def configure(argv):
+    """ Start the buzzer service from --buzzers [port] in argv or the JEOPARDY_BUZZERS environment variable. """
+    global _buzzers
+    _buzzers = start_service("Buzzers", argv, "--buzzers", "JEOPARDY_BUZZERS", Buzzers)
+    return _buzzers
+
+
+def get_buzzers():
+    """ The running buzzer service, or None when the app was started without buzzers. """
+    return _buzzers
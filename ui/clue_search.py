@@ -0,0 +1,173 @@
+import os
+from PySide6.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QLineEdit,
+    QComboBox, QTableView, QHeaderView, QAbstractItemView
+)
+from PySide6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from clue_index import get_clue_index, sync_library
+from ui.io_executor import get_io_executor
+from tracing import span
+
+COLUMNS = ("Entry", "Round", "Category", "Clue")
+KIND_FILTERS = {"Everything": None, "Boards": "boards", "Finals": "finals", "Games": "games"}
+
+SEARCH_STYLE = """
+    QLineEdit, QComboBox {
+        border: 2px solid white;
+        color: white;
+        font-size: 16px;
+        padding: 6px;
+        background-color: transparent;
+    }
+    QTableView {
+        border: 2px solid white;
+        color: white;
+        font-size: 14px;
+        gridline-color: #72729c;
+        background-color: transparent;
+    }
+    QHeaderView::section {
+        color: white;
+        font-weight: bold;
+        border: 1px solid #72729c;
+        background-color: #000099;
+    }
+"""
+
+
+class ClueResultsModel(QAbstractTableModel):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows = []
+
+    def set_rows(self, rows):
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self.rows[index.row()]
+        if role == Qt.DisplayRole:
+            return (os.path.basename(row["path"]), row["round"], row["category"], row["text"])[index.column()]
+        if role == Qt.ToolTipRole:
+            return row["path"] if index.column() == 0 else row["text"]
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return None
+
+
+class ClueSearchPage(QWidget):
+    """ Search every clue and category title in the library; double-click a board or final to edit it. """
+
+    def __init__(self, return_to_menu_callback, open_callback):
+        super().__init__()
+        self.return_to_menu_callback = return_to_menu_callback
+        self.open_callback = open_callback
+        self.sync_job = None
+        self.init_ui()
+
+    def init_ui(self):
+        main_layout = QVBoxLayout(self)
+        main_layout.setSpacing(20)
+        self.setStyleSheet(SEARCH_STYLE)
+
+        title = QLabel("Search Clues")
+        title.setAlignment(Qt.AlignCenter)
+        title.setStyleSheet("font-size: 24px; font-weight: bold; color: white;")
+        main_layout.addWidget(title)
+
+        search_bar = QHBoxLayout()
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Words from a clue or category...")
+        self.search_box.setClearButtonEnabled(True)
+        self.search_box.textChanged.connect(self.run_search)
+        search_bar.addWidget(self.search_box, 1)
+        self.kind_box = QComboBox()
+        self.kind_box.addItems(KIND_FILTERS)
+        self.kind_box.currentIndexChanged.connect(self.run_search)
+        search_bar.addWidget(self.kind_box)
+        main_layout.addLayout(search_bar)
+
+        self.results = ClueResultsModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.results)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setWordWrap(False)
+        self.table.verticalHeader().hide()
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(len(COLUMNS) - 1, QHeaderView.Stretch)
+        self.table.doubleClicked.connect(self.open_result)
+        main_layout.addWidget(self.table, 1)
+
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("font-size: 14px; color: white;")
+        main_layout.addWidget(self.status_label)
+
+        back_button = QPushButton("Return to Main Menu")
+        back_button.setFixedHeight(40)
+        back_button.setStyleSheet("""
+            QPushButton {
+                border: 2px solid white;
+                color: white;
+                font-size: 16px;
+                background-color: transparent;
+            }
+            QPushButton:hover {
+                background-color: #72729c;
+            }
+        """)
+        back_button.clicked.connect(self.return_to_menu_callback)
+        main_layout.addWidget(back_button)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.run_search()
+        # Picks up anything changed outside the app; saves made in the app are already indexed
+        if self.sync_job is None:
+            def sync(job):
+                return sync_library()
+
+            self.sync_job = get_io_executor().submit("sync_clue_index", "Updating the clue index...", sync)
+            self.sync_job.finished.connect(self.on_synced)
+            self.sync_job.failed.connect(self.on_sync_failed)
+            self.sync_job.cancelled.connect(self.on_sync_failed)
+
+    def on_synced(self, changed):
+        self.sync_job = None
+        if changed:
+            self.run_search()
+
+    def on_sync_failed(self, error=None):
+        self.sync_job = None
+        if error is not None:
+            print(f"Failed to sync the clue index: {error}")
+
+    def run_search(self):
+        query = self.search_box.text()
+        with span("clue_search.query"):
+            rows = get_clue_index().search(query, KIND_FILTERS[self.kind_box.currentText()])
+        self.results.set_rows(rows)
+        if not query.strip():
+            self.status_label.setText("")
+        elif rows:
+            self.status_label.setText(f"{len(rows)} clue(s) shown. Double-click a board or final to edit it.")
+        else:
+            self.status_label.setText("No clues found.")
+
+    def open_result(self, index):
+        row = self.results.rows[index.row()]
+        if row["kind"] in ("boards", "finals"):
+            self.open_callback(row["kind"], row["path"])
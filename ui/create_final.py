@@ -7,6 +7,12 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from util import get_user_data_path
 from util import get_resource_path
+from ui.media_progress import store_media_with_progress
+from ui.media_cache import preview_pixmap
+from ui.io_executor import get_io_executor
+from ui.busy_overlay import BusyOverlay
+from catalog import get_catalog
+from tracing import traced
 
 
 class FinalQuestionDialog(QDialog):
@@ -23,8 +29,11 @@ class FinalQuestionDialog(QDialog):
         layout.addWidget(self.question_input)
 
         self.media_label = QLabel(self)
+        self.preview_label = QLabel(self)
+        self.preview_label.setAlignment(Qt.AlignCenter)
         self.update_media_label()
         layout.addWidget(self.media_label)
+        layout.addWidget(self.preview_label)
 
         media_buttons = QHBoxLayout()
         attach_button = QPushButton("Attach Media")
@@ -49,6 +58,11 @@ class FinalQuestionDialog(QDialog):
 
     def update_media_label(self):
         self.media_label.setText(f"Attached: {os.path.basename(self.media_path)}" if self.media_path else "No media attached")
+        preview = preview_pixmap(self.media_path) if self.media_path else None
+        if preview is not None:
+            self.preview_label.setPixmap(preview)
+        else:
+            self.preview_label.clear()
 
     def attach_media(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -108,6 +122,7 @@ class CreateFinalPage(QWidget):
         layout.addWidget(self.question_button)
 
         self.setLayout(layout)
+        self.busy = BusyOverlay(self)
 
     def category_style(self):
         return """
@@ -149,6 +164,7 @@ class CreateFinalPage(QWidget):
             preview = self.question[:50] + ("..." if len(self.question) > 50 else "")
             self.question_button.setText(preview or "Enter Final Jeopardy Question")
 
+    @traced("create_final.save_final_question")
     def save_final_question(self):
         if not self.category or not self.question:
             QMessageBox.warning(self, "Incomplete", "Both category and question are required.")
@@ -160,26 +176,30 @@ class CreateFinalPage(QWidget):
 
         final_name = filename.strip()
         save_dir = get_user_data_path("finals")
-        board_folder = os.path.join(save_dir, final_name)
-        os.makedirs(board_folder, exist_ok=True)
-        filepath = os.path.join(board_folder, f"{final_name}.csv")
+        os.makedirs(save_dir, exist_ok=True)
+        filepath = os.path.join(save_dir, f"{final_name}.csv")
 
-        try:
+        media_names = store_media_with_progress(self, [self.media_path])
+        if media_names is None:
+            return
+
+        entry = self.question
+        if self.media_path in media_names:
+            entry += f" [media:{media_names[self.media_path]}]"
+        rows = [[self.category], [entry]]
+
+        def write_final(job):
             with open(filepath, mode="w", newline='', encoding="utf-8") as file:
-                writer = csv.writer(file)
-                entry = self.question
-                if self.media_path:
-                    media_name = os.path.basename(self.media_path)
-                    entry += f" [media:{media_name}]"
-                    dest_path = os.path.join(board_folder, media_name)
-                    if not os.path.exists(dest_path):
-                        with open(self.media_path, "rb") as src, open(dest_path, "wb") as dst:
-                            dst.write(src.read())
-                writer.writerow([self.category])
-                writer.writerow([entry])
-            QMessageBox.information(self, "Saved", f"Final question saved in '{board_folder}'!")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save: {str(e)}")
+                csv.writer(file).writerows(rows)
+
+        def saved():
+            get_catalog().record("finals", filepath)
+            QMessageBox.information(self, "Saved", f"Final question saved as '{final_name}.csv'!")
+
+        job = get_io_executor().submit("save_final", f"Saving {final_name}.csv...", write_final)
+        job.finished.connect(saved)
+        job.failed.connect(lambda e: QMessageBox.critical(self, "Error", f"Failed to save: {str(e)}"))
+        self.busy.track(job)
 
     def confirm_back_to_menu(self):
         confirm = QMessageBox.question(
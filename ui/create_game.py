@@ -1,11 +1,17 @@
 import os
+import csv
 import shutil
 from PySide6.QtWidgets import (
-    QWidget, QLabel, QPushButton, QVBoxLayout, QHBoxLayout, QFileDialog, QMessageBox, QInputDialog
+    QWidget, QPushButton, QVBoxLayout, QHBoxLayout, QMessageBox, QInputDialog
 )
-from PySide6.QtCore import Qt
 from util import get_user_data_path
-from util import get_resource_path
+from game_pack import PACK_EXTENSION, write_game_pack
+from catalog import get_catalog
+from media_store import store_tagged_media, referenced_media
+from renditions import generate_renditions
+from ui.io_executor import get_io_executor
+from ui.busy_overlay import BusyOverlay
+from tracing import traced
 
 class CreateGamePage(QWidget):
     def __init__(self, return_to_menu_callback, edit_board_select_callback, edit_final_select_callback):
@@ -62,6 +68,7 @@ class CreateGamePage(QWidget):
         layout.addStretch()
 
         self.setLayout(layout)
+        self.busy = BusyOverlay(self)
 
     def round_button_style(self):
         return """
@@ -98,6 +105,7 @@ class CreateGamePage(QWidget):
         self.final_path = path
         self.final_button.setText(f"Final Jeopardy\n{os.path.basename(path)}")
 
+    @traced("create_game.save_game")
     def save_game(self):
         if not (self.jeopardy_path and self.double_jeopardy_path and self.final_path):
             QMessageBox.warning(self, "Incomplete", "All three rounds must be selected before saving.")
@@ -107,31 +115,96 @@ class CreateGamePage(QWidget):
         if not ok or not game_name.strip():
             return
 
+        game_format, ok = QInputDialog.getItem(
+            self, "Save Jeopardy Game", "Save as:", ["Game Folder", "Game Pack (.jpack)"], 0, False
+        )
+        if not ok:
+            return
+
         game_name = game_name.strip()
         base_dir = get_user_data_path("games")
-        game_folder = os.path.join(base_dir, game_name)
-        os.makedirs(game_folder, exist_ok=True)
-
-        try:
-            def copy_round(path, dest_name):
-                dest_csv = os.path.join(game_folder, f"{dest_name}.csv")
-                shutil.copy2(path, dest_csv)
-
-                base_name = os.path.splitext(os.path.basename(path))[0]
-                original_subfolder = os.path.join(os.path.dirname(path), base_name)
-                if os.path.exists(original_subfolder) and os.path.isdir(original_subfolder):
-                    dest_subfolder = os.path.join(game_folder, dest_name)
-                    if os.path.exists(dest_subfolder):
-                        shutil.rmtree(dest_subfolder)
-                    shutil.copytree(original_subfolder, dest_subfolder)
 
-            copy_round(self.jeopardy_path, "jeopardy")
-            copy_round(self.double_jeopardy_path, "double")
-            copy_round(self.final_path, "final")
-
-            with open(os.path.join(game_folder, "order.csv"), "w", encoding="utf-8") as f:
-                f.write("jeopardy.csv\ndouble.csv\nfinal.csv\n")
+        if game_format.startswith("Game Pack"):
+            self.save_game_pack(os.path.join(base_dir, f"{game_name}{PACK_EXTENSION}"))
+            return
 
+        game_folder = os.path.join(base_dir, game_name)
+        rounds = [(self.jeopardy_path, "jeopardy"), (self.double_jeopardy_path, "double"), (self.final_path, "final")]
+
+        def copy_round(path, dest_csv):
+            # Media goes through the shared store, so the game only holds references
+            base_name = os.path.splitext(os.path.basename(path))[0]
+            original_subfolder = os.path.join(os.path.dirname(path), base_name)
+            with open(path, newline='', encoding='utf-8') as f:
+                rows = [[store_tagged_media(cell, original_subfolder) for cell in row] for row in csv.reader(f)]
+            with open(dest_csv, "w", newline='', encoding='utf-8') as f:
+                csv.writer(f).writerows(rows)
+            return referenced_media(rows)
+
+        def write_game(job):
+            # The game is built in a hidden folder and swapped in at the end, so a cancelled
+            # or failed save leaves the library as it was
+            staging = os.path.join(base_dir, f".{game_name}.saving")
+            shutil.rmtree(staging, ignore_errors=True)
+            os.makedirs(staging)
+            try:
+                media_paths = []
+                for path, dest_name in rounds:
+                    job.check()
+                    media_paths += copy_round(path, os.path.join(staging, f"{dest_name}.csv"))
+                job.check()
+                generate_renditions(media_paths)
+
+                with open(os.path.join(staging, "order.csv"), "w", encoding="utf-8") as f:
+                    f.write("jeopardy.csv\ndouble.csv\nfinal.csv\n")
+                job.check()
+            except BaseException:
+                shutil.rmtree(staging, ignore_errors=True)
+                raise
+
+            # Past the last check the save always completes
+            replaced = os.path.join(base_dir, f".{game_name}.old")
+            if os.path.exists(game_folder):
+                shutil.rmtree(replaced, ignore_errors=True)
+                os.replace(game_folder, replaced)
+            os.replace(staging, game_folder)
+            shutil.rmtree(replaced, ignore_errors=True)
+
+        def saved():
+            get_catalog().record("games", game_folder)
             QMessageBox.information(self, "Saved", f"Game saved successfully to:\n{game_folder}")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save game:\n{str(e)}")
+
+        job = get_io_executor().submit("save_game", f"Saving {game_name}...", write_game)
+        job.finished.connect(saved)
+        job.failed.connect(lambda e: QMessageBox.critical(self, "Error", f"Failed to save game:\n{str(e)}"))
+        self.busy.track(job)
+
+    @traced("create_game.save_game_pack")
+    def save_game_pack(self, pack_path):
+        def media_folder(path):
+            return os.path.join(os.path.dirname(path), os.path.splitext(os.path.basename(path))[0])
+
+        rounds = [
+            ("jeopardy", self.jeopardy_path, media_folder(self.jeopardy_path)),
+            ("double", self.double_jeopardy_path, media_folder(self.double_jeopardy_path)),
+            ("final", self.final_path, media_folder(self.final_path)),
+        ]
+
+        def write_pack(job):
+            media_paths = []
+            for _, path, folder in rounds:
+                with open(path, newline='', encoding='utf-8') as f:
+                    media_paths += referenced_media(csv.reader(f), folder)
+            job.check()
+            generate_renditions(media_paths)
+            job.check()
+            write_game_pack(pack_path, rounds)
+
+        def saved():
+            get_catalog().record("games", pack_path)
+            QMessageBox.information(self, "Saved", f"Game pack saved successfully to:\n{pack_path}")
+
+        job = get_io_executor().submit("save_game_pack", f"Saving {os.path.basename(pack_path)}...", write_pack)
+        job.finished.connect(saved)
+        job.failed.connect(lambda e: QMessageBox.critical(self, "Error", f"Failed to save game pack:\n{str(e)}"))
+        self.busy.track(job)
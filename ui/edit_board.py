@@ -1,13 +1,22 @@
 import os
 import csv
-import re
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QHBoxLayout, QGridLayout,
+    QWidget, QVBoxLayout, QPushButton, QHBoxLayout,
     QMessageBox, QInputDialog, QDialog, QLineEdit, QLabel, QFileDialog
 )
 from PySide6.QtCore import Qt
 from util import get_user_data_path
 from util import get_resource_path
+from catalog import get_catalog
+from board_state import BoardState, board_from_rows, board_to_rows, DEFAULT_COLUMNS, MAX_COLUMNS, MAX_ROWS
+from ui.board_view import BoardView, EDITOR_BOARD_STYLESHEET
+from ui.media_progress import store_media_with_progress
+from ui.media_cache import preview_pixmap
+from ui.io_executor import get_io_executor
+from ui.busy_overlay import BusyOverlay
+from media_store import resolve_media
+from clue_parser import Clue, format_cell
+from tracing import traced
 
 class QuestionDialog(QDialog):
     def __init__(self, existing_text="", existing_media_path=""):
@@ -24,9 +33,12 @@ class QuestionDialog(QDialog):
         self.layout.addWidget(self.input)
 
         self.media_label = QLabel(self)
+        self.preview_label = QLabel(self)
+        self.preview_label.setAlignment(Qt.AlignCenter)
         self.update_media_label()
 
         self.layout.addWidget(self.media_label)
+        self.layout.addWidget(self.preview_label)
 
         media_buttons_layout = QHBoxLayout()
 
@@ -56,6 +68,12 @@ class QuestionDialog(QDialog):
         else:
             self.media_label.setText("No media attached")
 
+        preview = preview_pixmap(self.media_path) if self.media_path else None
+        if preview is not None:
+            self.preview_label.setPixmap(preview)
+        else:
+            self.preview_label.clear()
+
     def attach_media(self):
         file_path, _ = QFileDialog.getOpenFileName(
             self,
@@ -92,86 +110,65 @@ class EditBoardPage(QWidget):
         back_button.setStyleSheet("QPushButton { border: 2px solid white; } QPushButton:hover { border: 3px solid blue; }")
         back_button.clicked.connect(self.confirm_back_to_menu)
 
+        size_button = QPushButton("Board Size")
+        size_button.setStyleSheet("QPushButton { border: 2px solid white; } QPushButton:hover { border: 3px solid blue; }")
+        size_button.clicked.connect(self.resize_board)
+
+        values_button = QPushButton("Values")
+        values_button.setStyleSheet("QPushButton { border: 2px solid white; } QPushButton:hover { border: 3px solid blue; }")
+        values_button.clicked.connect(self.edit_values)
+
         top_bar.addWidget(save_button)
         top_bar.addSpacing(10)
+        top_bar.addWidget(size_button)
+        top_bar.addWidget(values_button)
+        top_bar.addSpacing(10)
         top_bar.addWidget(back_button)
         self.layout.addLayout(top_bar)
 
-        # Category buttons
-        self.category_layout = QHBoxLayout()
-        self.categories = []
-        for _ in range(6):
-            button = QPushButton("Category")
-            button.setStyleSheet(self.category_style())
-            button.clicked.connect(self.edit_category)
-            button.setFixedHeight(80)
-            self.categories.append(button)
-            self.category_layout.addWidget(button)
-        self.layout.addLayout(self.category_layout)
-
-        # Grid of question buttons
-        self.grid_layout = QGridLayout()
-        self.buttons = []
-        self.questions = [[None for _ in range(6)] for _ in range(5)]
-        self.media_files = [[None for _ in range(6)] for _ in range(5)]
-        value_row = [200, 400, 600, 800, 1000]
-
-        for r in range(5):
-            for c in range(6):
-                button = QPushButton(f"${value_row[r]}")
-                button.setFixedHeight(80)
-                button.setStyleSheet(self.question_style())
-                button.clicked.connect(lambda _, row=r, col=c: self.enter_question(row, col))
-                self.grid_layout.addWidget(button, r, c)
-                self.buttons.append(button)
-
-        self.layout.addLayout(self.grid_layout)
-
-    def category_style(self):
-        return """
-        QPushButton {
-            background-color: #333333;
-            color: white;
-            border: 2px solid #000;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            border: 3px solid blue;
-        }
-        """
-
-    def question_style(self):
-        return """
-        QPushButton {
-            background-color: #1E90FF;
-            color: white;
-            border: 2px solid #000;
-            font-size: 16px;
-        }
-        QPushButton:hover {
-            border: 3px solid blue;
-        }
-        """
-
-    def question_filled_style(self):
-        return """
-        QPushButton {
-            background-color: #1E90FF;
-            color: white;
-            border: 3px solid red;
-            font-size: 16px;
-        }
-        QPushButton:hover {
-            border: 4px solid darkred;
-        }
-        """
-
-    def edit_category(self):
-        sender = self.sender()
-        text, ok = QInputDialog.getText(self, "Edit Category", "Enter category name:", text=sender.text())
+        # Category headers and clue cells, painted by the view
+        self.board = BoardState(["Category"] * DEFAULT_COLUMNS)
+        self.board_view = BoardView(editing=True)
+        self.board_view.setStyleSheet(EDITOR_BOARD_STYLESHEET)
+        self.board_view.category_clicked.connect(self.edit_category)
+        self.board_view.clue_clicked.connect(self.enter_question)
+        self.board_view.show_round(self.board)
+        self.layout.addWidget(self.board_view)
+        self.busy = BusyOverlay(self)
+
+    def edit_category(self, col):
+        text, ok = QInputDialog.getText(self, "Edit Category", "Enter category name:", text=self.board.categories[col])
         if ok and text.strip():
-            sender.setText(text.strip())
+            self.board.categories[col] = text.strip()
+            self.board_view.refresh_category(col)
+
+    def resize_board(self):
+        cols, ok = QInputDialog.getInt(self, "Board Size", "Number of categories:", self.board.cols, 1, MAX_COLUMNS)
+        if not ok:
+            return
+        rows, ok = QInputDialog.getInt(self, "Board Size", "Number of rows:", self.board.rows, 1, MAX_ROWS)
+        if not ok:
+            return
+        self.board.resize(rows, cols)
+        self.board_view.show_round(self.board)
+
+    def edit_values(self):
+        current = ", ".join(str(value) for value in self.board.values)
+        text, ok = QInputDialog.getText(self, "Values", "Dollar value of each row, top to bottom:", text=current)
+        if not ok:
+            return
+        try:
+            values = [int(value.strip().lstrip("$")) for value in text.split(",") if value.strip()]
+        except ValueError:
+            QMessageBox.warning(self, "Invalid Values", "Values must be whole numbers separated by commas.")
+            return
+        if len(values) != self.board.rows:
+            QMessageBox.warning(self, "Invalid Values", f"Enter exactly {self.board.rows} values, one per row.")
+            return
+        self.board.values = values
+        self.board_view.viewport().update()
 
+    @traced("edit_board.save_board")
     def save_board(self):
         filename, ok = QInputDialog.getText(self, "Save Board", "Enter a name for your board (without extension):")
         if not ok or not filename.strip():
@@ -180,40 +177,32 @@ class EditBoardPage(QWidget):
         board_name = filename.strip()
         save_dir = get_user_data_path("boards")
         filepath = os.path.join(save_dir, f"{board_name}.csv")
-        media_folder = os.path.join(save_dir, board_name)
-        os.makedirs(media_folder, exist_ok=True)
 
-        try:
+        media_names = store_media_with_progress(self, [clue.media for clue in self.board.clues if clue])
+        if media_names is None:
+            return
+
+        def cell_text(clue):
+            if not clue.text:
+                return ""
+            # Metadata read from dict-style cells (e.g. points) is written back with the clue
+            return format_cell(clue.text, media_names.get(clue.media), clue.metadata)
+
+        # Rows are taken now so edits made while the file is written don't end up in it
+        rows = board_to_rows(self.board, cell_text)
+
+        def write_board(job):
             with open(filepath, mode="w", newline='', encoding="utf-8") as file:
-                writer = csv.writer(file)
-
-                category_titles = [button.text().strip() for button in self.categories]
-                writer.writerow(category_titles)
-
-                for row_qs, row_media in zip(self.questions, self.media_files):
-                    row_data = []
-                    for q, media in zip(row_qs, row_media):
-                        if q:
-                            entry = q
-                            if media:
-                                media_filename = os.path.basename(media)
-                                entry += f" [media:{media_filename}]"
-                                dest_path = os.path.join(media_folder, media_filename)
-                                if not os.path.exists(dest_path):
-                                    try:
-                                        with open(media, "rb") as src, open(dest_path, "wb") as dst:
-                                            dst.write(src.read())
-                                    except Exception as e:
-                                        print(f"Failed to copy media: {e}")
-                            row_data.append(entry)
-                        else:
-                            row_data.append("")
-                    writer.writerow(row_data)
-
-            QMessageBox.information(self, "Saved", f"Board saved as '{board_name}.csv' with media in '{board_name}/'")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save board: {str(e)}")
+                csv.writer(file).writerows(rows)
+
+        def saved():
+            get_catalog().record("boards", filepath)
+            QMessageBox.information(self, "Saved", f"Board saved as '{board_name}.csv'")
 
+        job = get_io_executor().submit("save_board", f"Saving {board_name}.csv...", write_board)
+        job.finished.connect(saved)
+        job.failed.connect(lambda e: QMessageBox.critical(self, "Error", f"Failed to save board: {str(e)}"))
+        self.busy.track(job)
 
     def confirm_back_to_menu(self):
         confirm = QMessageBox.question(
@@ -227,86 +216,53 @@ class EditBoardPage(QWidget):
             self.return_to_menu_callback()
 
     def clear_board(self):
-        for button in self.categories:
-            button.setText("Category")
-
-        self.questions = [[None for _ in range(6)] for _ in range(5)]
-        self.media_files = [[None for _ in range(6)] for _ in range(5)]
-        value_row = [200, 400, 600, 800, 1000]
-        for i, button in enumerate(self.buttons):
-            r = i // 6
-            button.setText(f"${value_row[r]}")
-            button.setStyleSheet(self.question_style())
-
-    def enter_question(self, row, col):
-        existing_question = self.questions[row][col] or ""
-        existing_media = self.media_files[row][col]
-
-        dialog = QuestionDialog(existing_question, existing_media)
+        self.board = BoardState(["Category"] * DEFAULT_COLUMNS)
+        self.board_view.show_round(self.board)
+
+    def enter_question(self, index):
+        clue = self.board.clues[index]
+        dialog = QuestionDialog(clue.text if clue else "", clue.media if clue else None)
         if dialog.exec():
             question, media_path = dialog.get_data()
-            self.questions[row][col] = question if question else None
-            self.media_files[row][col] = media_path if media_path else None
+            metadata = clue.metadata if clue else None
+            self.board.clues[index] = Clue(question, media_path or None, metadata) if question or media_path else None
 
-            button = self.buttons[row * 6 + col]
-            if question:
-                button.setStyleSheet(self.question_filled_style())
-            else:
-                button.setStyleSheet(self.question_style())
+            self.board_view.refresh_cell(index)
 
     def load_board_from_file(self, filepath):
-        try:
+        """ Read the board on the I/O thread and show it when it arrives. """
+        def read_board(job):
             with open(filepath, mode="r", encoding="utf-8") as file:
-                reader = csv.reader(file)
-                rows = list(reader)
-
-                if len(rows) < 6:
-                    QMessageBox.critical(self, "Error", "Invalid board file: Not enough rows.")
-                    return
-
-                # Determine media folder correctly
-                board_name = os.path.splitext(os.path.basename(filepath))[0]
-                media_folder = os.path.join(os.path.dirname(filepath), board_name)
-
-
-                # Load category titles
-                for idx, title in enumerate(rows[0]):
-                    if idx < len(self.categories):
-                        self.categories[idx].setText(title.strip())
-
-                # Load questions and media references
-                media_pattern = re.compile(r"^(.*?)\s*\[media:(.+?)\]\s*$")
-
-                for r in range(5):
-                    if r + 1 < len(rows):
-                        for c in range(6):
-                            if c < len(rows[r + 1]):
-                                cell_text = rows[r + 1][c].strip()
-
-                                question_text = None
-                                media_path = None
-
-                                if cell_text:
-                                    match = media_pattern.match(cell_text)
-                                    if match:
-                                        question_text = match.group(1).strip()
-                                        media_filename = match.group(2).strip()
-                                        media_path = os.path.join(media_folder, media_filename)
-                                        if not os.path.isfile(media_path):
-                                            media_path = None
-                                    else:
-                                        question_text = cell_text
-
-                                self.questions[r][c] = question_text if question_text else None
-                                self.media_files[r][c] = media_path
-
-                                button = self.buttons[r * 6 + c]
-                                if question_text:
-                                    button.setStyleSheet(self.question_filled_style())
-                                else:
-                                    button.setStyleSheet(self.question_style())
-
+                rows = list(csv.reader(file))
+
+            board = board_from_rows(rows)
+            if not board.cols or not board.rows:
+                raise ValueError("Invalid board file: Not enough rows.")
+
+            # Determine media folder correctly
+            board_name = os.path.splitext(os.path.basename(filepath))[0]
+            media_folder = os.path.join(os.path.dirname(filepath), board_name)
+
+            # The editor keeps attached media as file paths
+            for index, clue in enumerate(board.clues):
+                if clue is None or not clue.text:
+                    board.clues[index] = None
+                elif clue.media:
+                    clue.media = resolve_media(clue.media, media_folder)
+            job.check()
+            return board
+
+        def show_board(board):
+            self.board = board
+            self.board_view.show_round(self.board)
             QMessageBox.information(self, "Loaded", f"Board loaded successfully from '{filepath}'!")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load board: {str(e)}")
+        def cancelled():
+            self.clear_board()
+            self.return_to_menu_callback()
+
+        job = get_io_executor().submit("load_board", f"Loading {os.path.basename(filepath)}...", read_board)
+        job.finished.connect(show_board)
+        job.failed.connect(lambda e: QMessageBox.critical(self, "Error", f"Failed to load board: {str(e)}"))
+        job.cancelled.connect(cancelled)
+        self.busy.track(job)
@@ -1,11 +1,7 @@
-import os
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QLabel, QMessageBox,
-    QScrollArea, QFrame
-)
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
 from PySide6.QtCore import Qt
-from util import get_user_data_path
-from util import get_resource_path
+from ui.library_list import LibraryList
+from tracing import traced
 
 class EditBoardSelectPage(QWidget):
     def __init__(self, load_board_callback, return_to_menu_callback):
@@ -23,45 +19,8 @@ class EditBoardSelectPage(QWidget):
         title.setStyleSheet("font-size: 24px; font-weight: bold;")
         main_layout.addWidget(title)
 
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("border: none;")
-
-        scroll_content = QFrame()
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setSpacing(10)
-
-        boards_dir = get_user_data_path("boards")
-        if not os.path.isdir(boards_dir):
-            QMessageBox.warning(self, "Error", f"Boards directory not found: {boards_dir}")
-            return
-
-        board_files = [f for f in os.listdir(boards_dir) if f.endswith(".csv")]
-
-        if not board_files:
-            label = QLabel("No boards available.")
-            label.setAlignment(Qt.AlignCenter)
-            scroll_layout.addWidget(label)
-        else:
-            for board_file in board_files:
-                button = QPushButton(board_file)
-                button.setFixedHeight(40)
-                button.setStyleSheet("""
-                    QPushButton {
-                        border: 2px solid white;
-                        color: white;
-                        font-size: 16px;
-                        background-color: transparent;
-                    }
-                    QPushButton:hover {
-                        background-color: #72729c;
-                    }
-                """)
-                button.clicked.connect(lambda checked, f=board_file: self.select_board(f))
-                scroll_layout.addWidget(button)
-
-        scroll_area.setWidget(scroll_content)
-        main_layout.addWidget(scroll_area)
+        self.library_list = LibraryList("boards", "No boards available.", self.select_board)
+        main_layout.addWidget(self.library_list)
 
         back_button = QPushButton("Return to Main Menu")
         back_button.setFixedHeight(40)
@@ -79,7 +38,11 @@ class EditBoardSelectPage(QWidget):
         back_button.clicked.connect(self.return_to_menu_callback)
         main_layout.addWidget(back_button)
 
-    def select_board(self, filename):
-        boards_dir = get_user_data_path("boards")
-        filepath = os.path.join(boards_dir, filename)
+    @traced("select_board.refresh")
+    def set_callback(self, load_callback):
+        """ Reuse this page for a different pick, e.g. a round of the game being assembled. """
+        self.load_board_callback = load_callback
+        self.library_list.clear_filter()
+
+    def select_board(self, filepath):
         self.load_board_callback(filepath)
@@ -7,6 +7,14 @@ from PySide6.QtWidgets import (
 from PySide6.QtCore import Qt
 from util import get_user_data_path
 from util import get_resource_path
+from ui.media_progress import store_media_with_progress
+from ui.media_cache import preview_pixmap
+from ui.io_executor import get_io_executor
+from ui.busy_overlay import BusyOverlay
+from catalog import get_catalog
+from media_store import resolve_media
+from clue_parser import parse_cell
+from tracing import traced
 
 class FinalQuestionDialog(QDialog):
     def __init__(self, existing_text="", existing_media=""):
@@ -22,8 +30,11 @@ class FinalQuestionDialog(QDialog):
         layout.addWidget(self.question_input)
 
         self.media_label = QLabel(self)
+        self.preview_label = QLabel(self)
+        self.preview_label.setAlignment(Qt.AlignCenter)
         self.update_media_label()
         layout.addWidget(self.media_label)
+        layout.addWidget(self.preview_label)
 
         media_buttons = QHBoxLayout()
         attach_button = QPushButton("Attach Media")
@@ -48,6 +59,11 @@ class FinalQuestionDialog(QDialog):
 
     def update_media_label(self):
         self.media_label.setText(f"Attached: {os.path.basename(self.media_path)}" if self.media_path else "No media attached")
+        preview = preview_pixmap(self.media_path) if self.media_path else None
+        if preview is not None:
+            self.preview_label.setPixmap(preview)
+        else:
+            self.preview_label.clear()
 
     def attach_media(self):
         path, _ = QFileDialog.getOpenFileName(
@@ -103,6 +119,7 @@ class EditFinalPage(QWidget):
         layout.addWidget(self.question_button)
 
         self.setLayout(layout)
+        self.busy = BusyOverlay(self)
 
     def category_style(self):
         return """
@@ -144,6 +161,7 @@ class EditFinalPage(QWidget):
             preview = self.question[:50] + ("..." if len(self.question) > 50 else "")
             self.question_button.setText(preview or "Enter Final Jeopardy Question")
 
+    @traced("edit_final.save_final_question")
     def save_final_question(self):
         if not self.category or not self.question:
             QMessageBox.warning(self, "Incomplete", "Both category and question are required.")
@@ -160,28 +178,27 @@ class EditFinalPage(QWidget):
         # Save CSV path
         csv_path = os.path.join(save_dir, f"{final_name}.csv")
 
-        # Create dedicated folder for media (named same as file without extension)
-        media_folder = os.path.join(save_dir, final_name)
-        os.makedirs(media_folder, exist_ok=True)
+        media_names = store_media_with_progress(self, [self.media_path])
+        if media_names is None:
+            return
+
+        entry = self.question
+        if self.media_path in media_names:
+            entry += f" [media:{media_names[self.media_path]}]"
+        rows = [[self.category], [entry]]
 
-        try:
+        def write_final(job):
             with open(csv_path, mode="w", newline='', encoding="utf-8") as file:
-                writer = csv.writer(file)
-                entry = self.question
-                if self.media_path:
-                    media_name = os.path.basename(self.media_path)
-                    entry += f" [media:{media_name}]"
-                    dest_path = os.path.join(media_folder, media_name)
-                    if not os.path.exists(dest_path):
-                        with open(self.media_path, "rb") as src, open(dest_path, "wb") as dst:
-                            dst.write(src.read())
-                writer.writerow([self.category])
-                writer.writerow([entry])
+                csv.writer(file).writerows(rows)
 
+        def saved():
+            get_catalog().record("finals", csv_path)
             QMessageBox.information(self, "Saved", f"Final question saved as '{final_name}.csv'!")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to save: {str(e)}")
 
+        job = get_io_executor().submit("save_final", f"Saving {final_name}.csv...", write_final)
+        job.finished.connect(saved)
+        job.failed.connect(lambda e: QMessageBox.critical(self, "Error", f"Failed to save: {str(e)}"))
+        self.busy.track(job)
 
     def confirm_back_to_menu(self):
         confirm = QMessageBox.question(
@@ -195,44 +212,38 @@ class EditFinalPage(QWidget):
 
 
     def load_question_from_file(self, file_path):
+        """ Read the final on the I/O thread and show it when it arrives. """
         self.current_file_path = file_path
-        try:
+
+        def read_final(job):
             with open(file_path, newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-                if len(rows) < 2:
-                    QMessageBox.warning(self, "Invalid File", "The selected file does not contain a valid Final Jeopardy format.")
-                    return
-
-                self.category = rows[0][0].strip()
-                raw_question = rows[1][0].strip()
-
-                # Handle possible media tag
-                media_path = None
-                if "[media:" in raw_question and raw_question.endswith("]"):
-                    try:
-                        question_part, media_tag = raw_question.rsplit(" [media:", 1)
-                        media_filename = media_tag[:-1]  # remove trailing ']'
-
-                        # Look for media in folder named after the file (same name as CSV, no extension)
-                        final_name = os.path.splitext(os.path.basename(file_path))[0]
-                        media_folder = os.path.join(get_user_data_path("finals"), final_name)
-                        possible_media_path = os.path.join(media_folder, media_filename)
-
-                        if os.path.exists(possible_media_path):
-                            media_path = possible_media_path
-
-                        self.question = question_part.strip()
-                    except Exception:
-                        self.question = raw_question  # fallback if media tag fails
-                        media_path = None
-                else:
-                    self.question = raw_question
-                    media_path = None
-
-                self.media_path = media_path
-                self.category_button.setText(self.category)
-                preview = self.question[:50] + ("..." if len(self.question) > 50 else "")
-                self.question_button.setText(preview or "Enter Final Jeopardy Question")
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load file:\n{str(e)}")
+                rows = list(csv.reader(f))
+            if len(rows) < 2:
+                return None
+
+            category = rows[0][0].strip()
+            # Handle possible media tag
+            clue = parse_cell(rows[1][0].strip())
+            media_path = None
+            if clue.media:
+                # Look for media in folder named after the file (same name as CSV, no extension)
+                final_name = os.path.splitext(os.path.basename(file_path))[0]
+                media_folder = os.path.join(get_user_data_path("finals"), final_name)
+                media_path = resolve_media(clue.media, media_folder)
+            job.check()
+            return category, clue.text, media_path
+
+        def show_final(loaded):
+            if loaded is None:
+                QMessageBox.warning(self, "Invalid File", "The selected file does not contain a valid Final Jeopardy format.")
+                return
+            self.category, self.question, self.media_path = loaded
+            self.category_button.setText(self.category)
+            preview = self.question[:50] + ("..." if len(self.question) > 50 else "")
+            self.question_button.setText(preview or "Enter Final Jeopardy Question")
+
+        job = get_io_executor().submit("load_final", f"Loading {os.path.basename(file_path)}...", read_final)
+        job.finished.connect(show_final)
+        job.failed.connect(lambda e: QMessageBox.critical(self, "Error", f"Failed to load file:\n{str(e)}"))
+        job.cancelled.connect(self.return_to_menu_callback)
+        self.busy.track(job)
@@ -1,11 +1,7 @@
-import os
-from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QPushButton, QLabel, QMessageBox,
-    QScrollArea, QFrame
-)
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QPushButton, QLabel
 from PySide6.QtCore import Qt
-from util import get_user_data_path
-from util import get_resource_path
+from ui.library_list import LibraryList
+from tracing import traced
 
 class EditFinalSelectPage(QWidget):
     def __init__(self, load_callback, back_callback):
@@ -23,45 +19,8 @@ class EditFinalSelectPage(QWidget):
         title.setStyleSheet("font-size: 24px; font-weight: bold;")
         main_layout.addWidget(title)
 
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        scroll_area.setStyleSheet("border: none;")
-
-        scroll_content = QFrame()
-        scroll_layout = QVBoxLayout(scroll_content)
-        scroll_layout.setSpacing(10)
-
-        finals_dir = get_user_data_path("finals")
-        if not os.path.isdir(finals_dir):
-            QMessageBox.warning(self, "Error", f"Finals directory not found: {finals_dir}")
-            return
-
-        final_files = [f for f in os.listdir(finals_dir) if f.endswith(".csv")]
-
-        if not final_files:
-            label = QLabel("No final Jeopardy questions available.")
-            label.setAlignment(Qt.AlignCenter)
-            scroll_layout.addWidget(label)
-        else:
-            for final_file in final_files:
-                button = QPushButton(final_file)
-                button.setFixedHeight(40)
-                button.setStyleSheet("""
-                    QPushButton {
-                        border: 2px solid white;
-                        color: white;
-                        font-size: 16px;
-                        background-color: transparent;
-                    }
-                    QPushButton:hover {
-                        background-color: #72729c;
-                    }
-                """)
-                button.clicked.connect(lambda checked, f=final_file: self.select_final(f))
-                scroll_layout.addWidget(button)
-
-        scroll_area.setWidget(scroll_content)
-        main_layout.addWidget(scroll_area)
+        self.library_list = LibraryList("finals", "No final Jeopardy questions available.", self.select_final)
+        main_layout.addWidget(self.library_list)
 
         back_button = QPushButton("Return to Main Menu")
         back_button.setFixedHeight(40)
@@ -79,7 +38,11 @@ class EditFinalSelectPage(QWidget):
         back_button.clicked.connect(self.back_callback)
         main_layout.addWidget(back_button)
 
-    def select_final(self, filename):
-        finals_dir = get_user_data_path("finals")
-        filepath = os.path.join(finals_dir, filename)
+    @traced("select_final.refresh")
+    def set_callback(self, load_callback):
+        """ Reuse this page for a different pick, e.g. a round of the game being assembled. """
+        self.load_callback = load_callback
+        self.library_list.clear_filter()
+
+    def select_final(self, filepath):
         self.load_callback(filepath)
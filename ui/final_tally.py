@@ -0,0 +1,64 @@
+import os
+from PySide6.QtCore import QObject, QCoreApplication, Signal
+from ui.live_service import start_service
+
+
+class FinalIntake(QObject):
+    """ The Final Jeopardy intake service as seen from the GUI: tallies arrive on the GUI thread. """
+
+    tally_changed = Signal(object)  # the tally dict from IntakeServer.tally()
+
+    def __init__(self, port, standings_path=None, parent=None):
+        super().__init__(parent)
+        from final_intake import IntakeService, read_standings
+        standings = read_standings(standings_path) if standings_path else {}
+        self.service = IntakeService(port, standings=standings, on_tally=self.tally_changed.emit)
+        self.port = self.service.start()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.service.stop)
+
+    def open_wagers(self, category):
+        self.service.open_wagers(category)
+
+    def open_responses(self, question):
+        self.service.open_responses(question)
+
+    def close(self):
+        self.service.close()
+
+
+def tally_text(tally):
+    """ The live tally as shown under the Final Jeopardy category or question. """
+    lines = [f"📱 {tally['players']} connected · {tally['wagers']} wagers (${tally['total_wagered']:,})"]
+    if tally["phase"] == "responses":
+        lines.append(f"{tally['responses']} responses · {tally['seconds']:.0f}s left")
+    elif tally["phase"] == "closed" and tally["responses"]:
+        lines.append(f"{tally['responses']} responses")
+        lines += [f"{answer or '(blank)'}: {count}" for answer, count in tally["top"]]
+    return "\n".join(lines)
+
+
+_final_intake = None
+
+
+def configure(argv):
+    """ Start the intake from --final-intake [port] in argv or the JEOPARDY_FINAL_INTAKE environment variable.
+
+    Player scores come from a name,score CSV given with --final-scores <path> or JEOPARDY_FINAL_SCORES.
+    """
+    global _final_intake
+    standings_path = os.environ.get("JEOPARDY_FINAL_SCORES")
+    if "--final-scores" in argv:
+        index = argv.index("--final-scores")
+        standings_path = argv[index + 1] if index + 1 < len(argv) else None
+    _final_intake = start_service(
+        "Final Jeopardy intake", argv, "--final-intake", "JEOPARDY_FINAL_INTAKE",
+        lambda port: FinalIntake(port, standings_path),
+    )
+    return _final_intake
+
+
+def get_final_intake():
+    """ The running intake service, or None when the app was started without it. """
+    return _final_intake
@@ -0,0 +1,84 @@
+from PySide6.QtCore import Qt, QObject, QRunnable, QThreadPool, QCoreApplication, Signal
+from PySide6.QtGui import QImage, QPixmap
+from ui.media_cache import get_media_cache, pixmap_cost
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".bmp")
+
+
+class _DecodeSignals(QObject):
+    decoded = Signal(int, object, QImage)
+
+
+class _DecodeTask(QRunnable):
+    def __init__(self, generation, key, source, ratio, signals):
+        super().__init__()
+        self.generation = generation
+        self.key = key
+        self.source = source
+        self.ratio = ratio
+        self.signals = signals
+
+    def run(self):
+        # QImage (unlike QPixmap) is safe to build off the GUI thread
+        image = QImage()
+        if isinstance(self.source, (bytes, bytearray)):
+            image.loadFromData(self.source)
+        else:
+            image.load(self.source)
+        if not image.isNull() and self.key[2]:
+            image = image.scaledToWidth(self.key[2], Qt.SmoothTransformation)
+        image.setDevicePixelRatio(self.ratio)
+        self.signals.decoded.emit(self.generation, self.key, image)
+
+
+class ImagePrefetcher(QObject):
+    """ Decodes a round's images on a thread pool into the shared media cache ahead of time. """
+
+    def __init__(self, cache=None, parent=None):
+        super().__init__(parent)
+        self.cache = cache or get_media_cache()
+        self.pool = QThreadPool(self)
+        self.signals = _DecodeSignals()
+        self.signals.decoded.connect(self.on_decoded)
+        self.generation = 0
+        self.pending = set()
+        # Let running decodes finish before Qt tears the signal object down at exit
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def prefetch(self, sources, ratio=1.0):
+        """ Start decoding every (media_key, path_or_bytes) pair that isn't cached yet, dropping older requests.
+
+        ratio is the device pixel ratio to decode for, as with MediaCache.pixmap.
+        """
+        self.clear()
+        for key, source in sources:
+            if key in self.cache or key in self.pending:
+                continue
+            self.pending.add(key)
+            self.pool.start(_DecodeTask(self.generation, key, source, ratio, self.signals))
+
+    def on_decoded(self, generation, key, image):
+        if generation != self.generation:
+            return
+        self.pending.discard(key)
+        if not image.isNull():
+            pixmap = QPixmap.fromImage(image)
+            self.cache.put(key, pixmap, pixmap_cost(pixmap))
+
+    def take(self, key):
+        """ Return the decoded pixmap for key, or None if it isn't ready. """
+        return self.cache.get(key)
+
+    def is_idle(self):
+        return not self.pending
+
+    def clear(self):
+        self.generation += 1
+        self.pool.clear()
+        self.pending.clear()
+
+    def shutdown(self):
+        self.clear()
+        self.pool.waitForDone()
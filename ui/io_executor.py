@@ -0,0 +1,134 @@
+import threading
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, QCoreApplication, Signal
+from tracing import span
+
+
+class Cancelled(Exception):
+    """ Raised by a job's function (through IOJob.check) once the job has been cancelled. """
+
+
+class IOJob(QObject):
+    """ One operation submitted to the IOExecutor.
+
+    Exactly one of finished(result), failed(exception) or cancelled() is emitted, always
+    on the GUI thread. cancelled() means the job really stopped: a queued job is taken off
+    the queue, and a running one stops at its next check(). A running job that gets past
+    its last check() still reports finished() or failed(), since its work is done.
+    """
+
+    finished = Signal(object)
+    failed = Signal(object)
+    cancelled = Signal()
+
+    def __init__(self, executor, name, label, func):
+        super().__init__()
+        self.executor = executor
+        self.name = name
+        self.label = label
+        self.func = func
+        self.cancel_event = threading.Event()
+        self.done = False
+
+    def cancel(self):
+        self.executor.cancel(self)
+
+    def is_cancelled(self):
+        return self.cancel_event.is_set()
+
+    def check(self):
+        """ Called from the job's function between steps that are safe to stop at. """
+        if self.cancel_event.is_set():
+            raise Cancelled()
+
+
+class _JobRunner(QRunnable):
+    def __init__(self, job, completed):
+        super().__init__()
+        self.job = job
+        self.completed = completed
+
+    def run(self):
+        result, error = None, None
+        with span(f"io.{self.job.name}"):
+            try:
+                self.job.check()
+                result = self.job.func(self.job)
+            except Exception as e:
+                error = e
+        self.completed.emit(self.job, result, error)
+
+
+class IOExecutor(QObject):
+    """ Runs file loads and saves on a worker thread and reports back through Qt signals.
+
+    Jobs run one at a time in the order they were submitted, so a save always lands
+    before a later load of the same file. busy_changed(True) is emitted when the first
+    job starts and busy_changed(False) once the queue has drained.
+    """
+
+    busy_changed = Signal(bool)
+    _completed = Signal(object, object, object)  # job, result, exception
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.pool = QThreadPool(self)
+        self.pool.setMaxThreadCount(1)
+        self.jobs = {}  # job -> runner, until the job reports back
+        self._completed.connect(self.on_completed)
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.shutdown)
+
+    def submit(self, name, label, func):
+        """ Run func(job) on the I/O thread. label is what a busy indicator shows while it runs. """
+        job = IOJob(self, name, label, func)
+        runner = _JobRunner(job, self._completed)
+        runner.setAutoDelete(False)
+        was_busy = self.is_busy()
+        self.jobs[job] = runner
+        self.pool.start(runner)
+        if not was_busy:
+            self.busy_changed.emit(True)
+        return job
+
+    def cancel(self, job):
+        job.cancel_event.set()
+        runner = self.jobs.get(job)
+        if runner is not None and self.pool.tryTake(runner):
+            self.finish(job, None, Cancelled())
+
+    def on_completed(self, job, result, error):
+        # A job taken off the queue was already reported when it was cancelled
+        if job in self.jobs:
+            self.finish(job, result, error)
+
+    def finish(self, job, result, error):
+        del self.jobs[job]
+        job.done = True
+        if isinstance(error, Cancelled):
+            job.cancelled.emit()
+        elif error is not None:
+            job.failed.emit(error)
+        else:
+            job.finished.emit(result)
+        if not self.jobs:
+            self.busy_changed.emit(False)
+
+    def is_busy(self):
+        return bool(self.jobs)
+
+    def shutdown(self):
+        for job in list(self.jobs):
+            job.cancel_event.set()
+        self.pool.clear()
+        self.pool.waitForDone()
+
+
+_io_executor = None
+
+
+def get_io_executor():
+    global _io_executor
+    if _io_executor is None:
+        _io_executor = IOExecutor()
+    return _io_executor
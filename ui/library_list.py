@@ -0,0 +1,275 @@
+import os
+import json
+import bisect
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QListView, QLabel, QAbstractItemView
+from PySide6.QtCore import Qt, QAbstractListModel, QModelIndex
+from ui.library_monitor import get_library_monitor
+from tracing import span
+
+FETCH_BATCH = 500
+# Joins the per-entry search keys; stripped from queries so a match never spans two entries
+SEPARATOR = "\0"
+PREFIX_END = "\U0010ffff"
+
+LIST_STYLE = """
+    QLineEdit {
+        border: 2px solid white;
+        color: white;
+        font-size: 16px;
+        padding: 6px;
+        background-color: transparent;
+    }
+    QListView {
+        border: none;
+        font-size: 16px;
+        background-color: transparent;
+    }
+    QListView::item {
+        border: 2px solid white;
+        color: white;
+        height: 36px;
+        margin: 5px 0px;
+    }
+    QListView::item:hover {
+        background-color: #72729c;
+    }
+"""
+
+
+def search_key(name, categories):
+    return "\n".join((name, *categories)).lower()
+
+
+def entry_categories(entry):
+    try:
+        return json.loads(entry["categories"])
+    except (TypeError, ValueError, IndexError, KeyError):
+        return []
+
+
+class LibraryModel(QAbstractListModel):
+    """ Library entries sorted by name, filtered by a search string and handed to the view in batches.
+
+    Names starting with the query are one bisect range of the sorted names and are listed
+    first; the remaining substring matches (in names or category titles) are found with
+    str.find over one joined search string, only as far as the view has scrolled.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.keys = []  # sorted (lowercased name, path)
+        self.names = []
+        self.paths = []
+        self.titles = []  # names as displayed
+        self.categories = []
+        self.search = []  # lowercased name and category titles per entry
+        self.blob = None  # search keys joined with SEPARATOR, rebuilt after edits
+        self.starts = []  # offset of each search key in blob
+        self.query = ""
+        self.visible = []  # indices into paths, in display order
+        self.prefix = range(0)
+        self.prefix_next = 0
+        self.cursor = 0
+        self.exhausted = True
+
+    def set_entries(self, entries):
+        """ entries: (path, name, category titles) triples. """
+        rows = sorted((name.lower(), path, name, categories) for path, name, categories in entries)
+        self.keys = [(key, path) for key, path, _, _ in rows]
+        self.names = [key for key, _, _, _ in rows]
+        self.paths = [path for _, path, _, _ in rows]
+        self.titles = [name for _, _, name, _ in rows]
+        self.categories = [categories for _, _, _, categories in rows]
+        self.search = [search_key(key, categories) for key, _, _, categories in rows]
+        self.blob = None
+        self.apply_filter(self.query, force=True)
+
+    def add_entry(self, path, name, categories):
+        key = (name.lower(), path)
+        position = bisect.bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            self.categories[position] = categories
+            self.search[position] = search_key(key[0], categories)
+        else:
+            self.keys.insert(position, key)
+            self.names.insert(position, key[0])
+            self.paths.insert(position, path)
+            self.titles.insert(position, name)
+            self.categories.insert(position, categories)
+            self.search.insert(position, search_key(key[0], categories))
+        self.blob = None
+
+    def remove_entry(self, path):
+        key = (os.path.basename(path).lower(), path)
+        position = bisect.bisect_left(self.keys, key)
+        if position < len(self.keys) and self.keys[position] == key:
+            del self.keys[position], self.names[position], self.paths[position], self.titles[position]
+            del self.categories[position], self.search[position]
+            self.blob = None
+
+    def build_blob(self):
+        self.starts = []
+        offset = 0
+        for key in self.search:
+            self.starts.append(offset)
+            offset += len(key) + 1
+        self.blob = SEPARATOR.join(self.search)
+
+    def apply_filter(self, text, force=False):
+        query = text.strip().lower().replace(SEPARATOR, "")
+        if query == self.query and not force:
+            return
+        if self.blob is None:
+            self.build_blob()
+        self.beginResetModel()
+        self.query = query
+        low = bisect.bisect_left(self.names, query)
+        high = bisect.bisect_left(self.names, query + PREFIX_END, low)
+        self.prefix = range(low, high)
+        self.prefix_next = low
+        self.cursor = 0
+        # With no query every entry is a prefix match
+        self.exhausted = not self.paths
+        self.visible = []
+        self.visible = self.next_matches(FETCH_BATCH)
+        self.endResetModel()
+
+    def next_matches(self, count):
+        """ The next count matches after the ones already visible. """
+        found = []
+        if self.prefix_next < self.prefix.stop:
+            stop = min(self.prefix.stop, self.prefix_next + count)
+            found.extend(range(self.prefix_next, stop))
+            self.prefix_next = stop
+        if not self.query:
+            self.exhausted = self.prefix_next >= self.prefix.stop
+            return found
+
+        blob, starts, query, prefix = self.blob, self.starts, self.query, self.prefix
+        while len(found) < count:
+            position = blob.find(query, self.cursor)
+            if position < 0:
+                self.cursor = len(blob)
+                self.exhausted = self.prefix_next >= prefix.stop
+                break
+            entry = bisect.bisect_right(starts, position) - 1
+            if entry in prefix:
+                # Already listed; skip the whole prefix block
+                entry = prefix.stop - 1
+            else:
+                found.append(entry)
+            self.cursor = starts[entry + 1] if entry + 1 < len(starts) else len(blob)
+        return found
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.visible)
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and not self.exhausted
+
+    def fetchMore(self, parent=QModelIndex()):
+        found = self.next_matches(FETCH_BATCH)
+        if not found:
+            return
+        self.beginInsertRows(QModelIndex(), len(self.visible), len(self.visible) + len(found) - 1)
+        self.visible.extend(found)
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.visible):
+            return None
+        entry = self.visible[index.row()]
+        if role == Qt.DisplayRole:
+            return self.titles[entry]
+        if role == Qt.ToolTipRole:
+            return ", ".join(self.categories[entry]) or None
+        if role == Qt.UserRole:
+            return self.paths[entry]
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignCenter
+        return None
+
+
+class LibraryList(QWidget):
+    """ Filterable list of the library entries of one kind, kept in sync with the shared LibraryMonitor. """
+
+    def __init__(self, kind, empty_text, select_callback, parent=None):
+        super().__init__(parent)
+        self.kind = kind
+        self.select_callback = select_callback
+        self.empty_text = empty_text
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setStyleSheet(LIST_STYLE)
+        self.filter_box = QLineEdit()
+        self.filter_box.setPlaceholderText("Filter by name or category...")
+        self.filter_box.setClearButtonEnabled(True)
+        self.filter_box.textChanged.connect(self.apply_filter)
+        self.filter_box.returnPressed.connect(self.select_first)
+        layout.addWidget(self.filter_box)
+
+        self.model = LibraryModel(self)
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.view.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.view.setMouseTracking(True)
+        self.view.clicked.connect(self.on_activated)
+        layout.addWidget(self.view)
+
+        self.empty_label = QLabel(empty_text)
+        self.empty_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.empty_label, 1)
+
+        monitor = get_library_monitor()
+        with span("library_list.populate", kind=kind):
+            self.model.set_entries([
+                (entry["path"], entry["name"], entry_categories(entry)) for entry in monitor.entries(kind)
+            ])
+        self.update_empty_label()
+        monitor.entries_changed.connect(self.on_entries_changed)
+        monitor.entry_updated.connect(self.on_entry_updated)
+
+    def apply_filter(self, text):
+        with span("library_list.filter", kind=self.kind):
+            self.model.apply_filter(text)
+        self.update_empty_label()
+
+    def clear_filter(self):
+        self.filter_box.clear()
+        self.view.scrollToTop()
+
+    def update_empty_label(self):
+        if not self.model.paths:
+            self.empty_label.setText(self.empty_text)
+        elif not self.model.visible:
+            self.empty_label.setText("No matches.")
+        self.empty_label.setVisible(not self.model.visible)
+        self.view.setVisible(bool(self.model.visible))
+
+    def on_activated(self, index):
+        path = index.data(Qt.UserRole)
+        if path:
+            self.select_callback(path)
+
+    def select_first(self):
+        if self.model.visible:
+            self.on_activated(self.model.index(0, 0))
+
+    def on_entries_changed(self, kind, added, removed):
+        if kind != self.kind:
+            return
+        with span("library_list.apply", kind=kind, added=len(added), removed=len(removed)):
+            rows = get_library_monitor().cache[kind]
+            for path in removed:
+                self.model.remove_entry(path)
+            for path in added:
+                self.model.add_entry(path, rows[path]["name"], entry_categories(rows[path]))
+            self.model.apply_filter(self.model.query, force=True)
+        self.update_empty_label()
+
+    def on_entry_updated(self, kind, path):
+        if kind == self.kind:
+            self.on_entries_changed(kind, [path], [])
@@ -0,0 +1,88 @@
+import os
+from PySide6.QtCore import QObject, QFileSystemWatcher, QTimer, Signal
+from catalog import KINDS, get_catalog, source_folders
+from tracing import span
+
+# Bursts of directory events (a save writes a temp file and then renames it)
+# are folded into one catalog sync per kind.
+SETTLE_MS = 150
+
+
+class LibraryMonitor(QObject):
+    """ In-memory view of the library catalog, kept current by a QFileSystemWatcher on the data folders.
+
+    Selectors read entries() once and then apply the entries_changed diffs, so showing
+    a selector again doesn't rescan or rebuild anything. A rename arrives as one removed
+    and one added path.
+    """
+
+    entries_changed = Signal(str, list, list)  # kind, added paths, removed paths
+    entry_updated = Signal(str, str)  # kind, path whose contents changed
+
+    def __init__(self, catalog=None, parent=None):
+        super().__init__(parent)
+        self.catalog = catalog or get_catalog()
+        self.cache = {}  # kind -> {path: catalog row}
+        self.pending = set()
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.setInterval(SETTLE_MS)
+        self.timer.timeout.connect(self.flush)
+
+        self.watcher = QFileSystemWatcher(self)
+        self.folder_kinds = {}
+        for kind in KINDS:
+            for folder in source_folders(kind):
+                self.folder_kinds.setdefault(os.path.normpath(folder), []).append(kind)
+        self.watcher.addPaths([folder for folder in self.folder_kinds if os.path.isdir(folder)])
+        self.watcher.directoryChanged.connect(self.on_directory_changed)
+        self.catalog.add_listener(self.on_recorded)
+
+    def entries(self, kind):
+        """ Catalog rows for kind, sorted by name. Only the first call per kind touches the catalog. """
+        if kind not in self.cache:
+            self.check(kind)
+        return list(self.cache[kind].values())
+
+    def check(self, kind):
+        """ Re-sync kind with the catalog and emit what changed since the last check. """
+        with span("library.check", kind=kind):
+            rows = {row["path"]: row for row in self.catalog.entries(kind)}
+        old = self.cache.get(kind)
+        self.cache[kind] = rows
+        if old is None:
+            return
+
+        added = [path for path in rows if path not in old]
+        removed = [path for path in old if path not in rows]
+        if added or removed:
+            self.entries_changed.emit(kind, added, removed)
+        for path, row in rows.items():
+            if path in old and row["mtime"] != old[path]["mtime"]:
+                self.entry_updated.emit(kind, path)
+
+    def on_directory_changed(self, folder):
+        self.pending.update(self.folder_kinds.get(os.path.normpath(folder), KINDS))
+        self.timer.start()
+
+    def on_recorded(self, kind, path):
+        # A save that overwrites an existing file leaves its folder's mtime alone
+        if kind in self.cache:
+            self.pending.add(kind)
+            self.timer.start()
+
+    def flush(self):
+        kinds, self.pending = self.pending, set()
+        for kind in kinds:
+            if kind in self.cache:
+                self.check(kind)
+
+
+_library_monitor = None
+
+
+def get_library_monitor():
+    global _library_monitor
+    if _library_monitor is None:
+        _library_monitor = LibraryMonitor()
+    return _library_monitor
@@ -0,0 +1,23 @@
+import os
+
+# The live services (buzzers, final intake, scoreboard) run on asyncio, which takes a
+# noticeable share of cold start to import. Their GUI wrappers import the service
+# modules when they're built, and start_service only builds one once its flag or
+# environment variable was given, so an app started without them never loads asyncio.
+
+
+def start_service(label, argv, flag, env_var, factory):
+    """ Start a live service when flag is in argv or env_var is set; returns it, or None.
+
+    factory(port) builds the GUI's wrapper and starts the service; port is None for the service's default.
+    """
+    if flag not in argv and not os.environ.get(env_var):
+        return None
+    from message_server import requested_port
+    try:
+        service = factory(requested_port(argv, flag, env_var))
+    except (OSError, ValueError) as e:
+        print(f"{label} unavailable: {e}")
+        return None
+    print(f"{label} listening on port {service.port}")
+    return service
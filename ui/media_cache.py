@@ -0,0 +1,196 @@
+import os
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QObject, QTimer, QBuffer, QByteArray
+from PySide6.QtGui import QImageReader, QPixmap
+
+# Decoded media shared by the player and the editors' previews. Entries are
+# keyed by (path, mtime, target width), so an edited file never serves a stale
+# decode, and the least recently used entries are dropped once the decoded
+# size passes the byte budget (JEOPARDY_MEDIA_CACHE_MB, default 256).
+DEFAULT_BUDGET_BYTES = 256 * 1024 * 1024
+PREVIEW_WIDTH = 200
+
+
+def media_key(path, width, member=None):
+    """ Cache key for a file, or for a member (e.g. "round/name.jpg") inside a game pack at path. """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = 0
+    return (path if member is None else f"{path}::{member}", mtime, width)
+
+
+def pixmap_cost(pixmap):
+    return pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+
+
+class AnimatedFrames:
+    """ Every frame of an animated GIF with its display time in milliseconds. """
+
+    def __init__(self, frames, delays):
+        self.frames = frames
+        self.delays = delays
+        self.cost = sum(pixmap_cost(frame) for frame in frames)
+
+
+def decode_pixmap(source, width=None, ratio=1.0):
+    pixmap = QPixmap()
+    if isinstance(source, (bytes, bytearray)):
+        pixmap.loadFromData(source)
+    else:
+        pixmap.load(source)
+    if pixmap.isNull():
+        return None
+    if width:
+        pixmap = pixmap.scaledToWidth(width, Qt.SmoothTransformation)
+    pixmap.setDevicePixelRatio(ratio)
+    return pixmap
+
+
+def decode_animation(source, width=None):
+    if isinstance(source, (bytes, bytearray)):
+        buffer = QBuffer()
+        buffer.setData(QByteArray(source))
+        buffer.open(QBuffer.ReadOnly)
+        reader = QImageReader(buffer)
+    else:
+        buffer = None
+        reader = QImageReader(source)
+
+    frames, delays = [], []
+    while reader.canRead():
+        image = reader.read()
+        if image.isNull():
+            break
+        if width:
+            image = image.scaledToWidth(width, Qt.SmoothTransformation)
+        frames.append(QPixmap.fromImage(image))
+        delays.append(max(reader.nextImageDelay(), 20))
+    if buffer is not None:
+        buffer.close()
+    return AnimatedFrames(frames, delays) if frames else None
+
+
+class MediaCache:
+    def __init__(self, budget_bytes=DEFAULT_BUDGET_BYTES):
+        self.budget_bytes = budget_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key):
+        return key in self.entries
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry[0]
+
+    def put(self, key, value, cost):
+        if key in self.entries:
+            self.total_bytes -= self.entries.pop(key)[1]
+        if cost > self.budget_bytes:
+            return
+        self.entries[key] = (value, cost)
+        self.total_bytes += cost
+        while self.total_bytes > self.budget_bytes:
+            _, (_, evicted_cost) = self.entries.popitem(last=False)
+            self.total_bytes -= evicted_cost
+            self.evictions += 1
+
+    def pixmap(self, key, source, ratio=1.0):
+        """ Return the decoded pixmap for key, decoding source to key's width on a miss.
+
+        source is a path, bytes, or a callable returning either, so hits never have to load it.
+        ratio is the device pixel ratio the pixmap is decoded for; cached pixmaps are shared, so it's set only here.
+        """
+        pixmap = self.get(key)
+        if pixmap is None:
+            pixmap = decode_pixmap(source() if callable(source) else source, key[2], ratio)
+            if pixmap is not None:
+                self.put(key, pixmap, pixmap_cost(pixmap))
+        return pixmap
+
+    def animation(self, key, source):
+        frames = self.get(key)
+        if frames is None:
+            frames = decode_animation(source() if callable(source) else source, key[2])
+            if frames is not None:
+                self.put(key, frames, frames.cost)
+        return frames
+
+    def clear(self):
+        self.entries.clear()
+        self.total_bytes = 0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self.entries),
+            "bytes": self.total_bytes,
+            "budget_bytes": self.budget_bytes,
+        }
+
+
+class FrameAnimator(QObject):
+    """ Plays cached AnimatedFrames on a QLabel, standing in for a per-clue QMovie. """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.next_frame)
+        self.label = None
+        self.frames = None
+        self.index = 0
+
+    def play(self, label, frames):
+        self.stop()
+        self.label = label
+        self.frames = frames
+        self.index = -1
+        self.next_frame()
+
+    def next_frame(self):
+        if self.frames is None:
+            return
+        self.index = (self.index + 1) % len(self.frames.frames)
+        self.label.setPixmap(self.frames.frames[self.index])
+        if len(self.frames.frames) > 1:
+            self.timer.start(self.frames.delays[self.index])
+
+    def stop(self):
+        self.timer.stop()
+        self.label = None
+        self.frames = None
+
+
+_media_cache = None
+
+
+def get_media_cache():
+    global _media_cache
+    if _media_cache is None:
+        budget = os.environ.get("JEOPARDY_MEDIA_CACHE_MB")
+        _media_cache = MediaCache(int(budget) * 1024 * 1024 if budget else DEFAULT_BUDGET_BYTES)
+    return _media_cache
+
+
+def preview_pixmap(path, width=PREVIEW_WIDTH):
+    """ Small preview of an image or the first frame of a GIF for the editors, or None for other media. """
+    ext = os.path.splitext(path)[1].lower()
+    cache = get_media_cache()
+    if ext == ".gif":
+        frames = cache.animation(media_key(path, width), path)
+        return frames.frames[0] if frames else None
+    if ext in (".png", ".jpg", ".jpeg", ".bmp"):
+        return cache.pixmap(media_key(path, width), path)
+    return None
@@ -0,0 +1,74 @@
+import os
+import threading
+from PySide6.QtWidgets import QProgressDialog
+from PySide6.QtCore import Qt, QObject, QEventLoop, Signal
+from media_copy import CopyCancelled
+from media_store import store_media_batch, blob_path
+from renditions import generate_renditions
+
+
+class _CopyWorker(QObject):
+    progressed = Signal(int)
+    finished = Signal()
+
+    def __init__(self, paths, cancel):
+        super().__init__()
+        self.paths = paths
+        self.cancel = cancel
+        self.names = {}
+        self.errors = {}
+        self.cancelled = False
+
+    def run(self):
+        try:
+            self.names, self.errors = store_media_batch(self.paths, self.progressed.emit, self.cancel)
+            if not self.cancel.is_set():
+                generate_renditions([blob_path(name) for name in self.names.values()])
+        except CopyCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.errors = {path: e for path in self.paths}
+        self.finished.emit()
+
+
+def store_media_with_progress(parent, paths):
+    """ Copy attachments into the media store on worker threads while showing a progress dialog,
+    then render their display renditions.
+
+    Returns {path: blob_name} for every file that was stored, or None if the user cancelled.
+    """
+    paths = [path for path in dict.fromkeys(paths) if path]
+    if not paths:
+        return {}
+
+    total = sum(2 * os.path.getsize(path) for path in paths if os.path.exists(path))
+    # QProgressDialog takes an int, so track progress in KB
+    dialog = QProgressDialog("Copying media...", "Cancel", 0, max(total // 1024, 1), parent)
+    dialog.setWindowTitle("Saving")
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(500)
+
+    cancel = threading.Event()
+    worker = _CopyWorker(paths, cancel)
+    done = [0]
+
+    def on_progress(count):
+        done[0] += count
+        dialog.setValue(min(done[0] // 1024, dialog.maximum()))
+
+    loop = QEventLoop()
+    worker.progressed.connect(on_progress)
+    worker.finished.connect(loop.quit)
+    dialog.canceled.connect(cancel.set)
+
+    thread = threading.Thread(target=worker.run, daemon=True)
+    thread.start()
+    loop.exec()
+    thread.join()
+    dialog.close()
+
+    for path, error in worker.errors.items():
+        print(f"Failed to store media {path}: {error}")
+    if worker.cancelled:
+        return None
+    return worker.names
@@ -1,29 +1,56 @@
 import os
-import csv
-import random
-import re
+import time
 from PySide6.QtWidgets import (
-    QWidget, QVBoxLayout, QGridLayout, QPushButton, QLabel,
+    QWidget, QVBoxLayout, QLabel,
     QStackedLayout, QMessageBox, QSizePolicy
 )
-from PySide6.QtCore import Qt, QUrl
-from PySide6.QtGui import QPixmap, QMovie, QKeyEvent
-from PySide6.QtMultimedia import QMediaPlayer
-from PySide6.QtMultimediaWidgets import QVideoWidget
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QKeyEvent
 from util import get_user_data_path
 from util import get_resource_path
+from game_pack import GamePack, is_game_pack
+from media_store import resolve_media
+from game_cache import load_game_data
+from game_engine import GameEngine
+from ui.image_prefetch import ImagePrefetcher, IMAGE_EXTENSIONS
+from ui.media_cache import get_media_cache, media_key, FrameAnimator
+from ui.board_view import BoardView, BOARD_STYLESHEET
+from ui.text_fit import FitLabel
+from ui.player_pool import MediaPlayerPool, AUDIO_EXTENSIONS, VIDEO_EXTENSIONS
+from ui.io_executor import get_io_executor
+from ui.busy_overlay import BusyOverlay
+from ui.buzzers import get_buzzers
+from ui.final_tally import get_final_intake, tally_text
+from ui.scoreboard_feed import get_scoreboard
+from renditions import best_rendition, image_width
+from tracing import traced
 
 class PlayGamePage(QWidget):
     def __init__(self, return_callback):
         super().__init__()
         self.return_callback = return_callback
         self.init_ui()
-        self.current_round_index = 0
-        self.rounds = []
-        self.round_data = {}
-        self.daily_doubles = []
-        self.selected_questions = set()
-        self.questions_remaining = 0
+        self.engine = None
+        self.current_pack = None
+        self.load_job = None
+        # Real widths of box-bounded renditions, read once per game rather than per display
+        self.rendition_widths = {}
+        self.media_cache = get_media_cache()
+        self.image_prefetcher = ImagePrefetcher(self.media_cache, self)
+        self.gif_animator = FrameAnimator(self)
+        # (media name or None, milliseconds from display_question to the clue being shown)
+        self.clue_latencies = []
+        # Remote buzzers, when the app was started with --buzzers; clue_number tags each opening
+        self.buzzers = get_buzzers()
+        self.clue_number = 0
+        if self.buzzers is not None:
+            self.buzzers.buzzed.connect(self.on_buzzed)
+        # Audience wagers and responses for Final Jeopardy, when started with --final-intake
+        self.final_intake = get_final_intake()
+        if self.final_intake is not None:
+            self.final_intake.tally_changed.connect(self.on_final_tally)
+        # Lobby displays mirroring the board, when started with --scoreboard
+        self.scoreboard = get_scoreboard()
 
         self.setFocusPolicy(Qt.StrongFocus)
 
@@ -32,15 +59,13 @@ class PlayGamePage(QWidget):
         self.stack = QStackedLayout()
         self.layout.addLayout(self.stack)
 
-        self.board_widget = QWidget()
-        self.board_layout = QGridLayout(self.board_widget)
+        self.board_widget = BoardView()
+        self.board_widget.clue_clicked.connect(self.show_question)
         self.stack.addWidget(self.board_widget)
 
         self.question_widget = QWidget()
-        self.question_label = QLabel()
-        self.question_label.setAlignment(Qt.AlignCenter)
-        self.question_label.setWordWrap(True)
-        self.question_label.setStyleSheet("font-size: 24px; color: white;")
+        self.question_label = FitLabel(min_px=16)
+        self.question_label.setStyleSheet("color: white;")
         self.question_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
         self.media_label = QLabel("")
         self.media_label.setAlignment(Qt.AlignCenter)
@@ -48,6 +73,10 @@ class PlayGamePage(QWidget):
         question_layout.setAlignment(Qt.AlignCenter)
         question_layout.addWidget(self.question_label)
         question_layout.addWidget(self.media_label)
+        self.buzz_label = QLabel("")
+        self.buzz_label.setAlignment(Qt.AlignCenter)
+        self.buzz_label.setStyleSheet("font-size: 28px; color: gold;")
+        question_layout.addWidget(self.buzz_label)
         self.question_widget.setLayout(question_layout)
         self.stack.addWidget(self.question_widget)
 
@@ -61,29 +90,32 @@ class PlayGamePage(QWidget):
 
         self.final_category_widget = QWidget()
         self.final_category_layout = QVBoxLayout(self.final_category_widget)
-        self.final_category_label = QLabel()
-        self.final_category_label.setAlignment(Qt.AlignCenter)
-        self.final_category_label.setStyleSheet("font-size: 28px; color: cyan;")
+        self.final_category_label = FitLabel(min_px=20, max_px=72)
+        self.final_category_label.setStyleSheet("color: cyan;")
         self.final_category_layout.addWidget(self.final_category_label)
+        self.final_category_tally = QLabel("")
+        self.final_category_tally.setAlignment(Qt.AlignCenter)
+        self.final_category_tally.setStyleSheet("font-size: 20px; color: gold;")
+        self.final_category_layout.addWidget(self.final_category_tally)
         self.stack.addWidget(self.final_category_widget)
 
         self.final_widget = QWidget()
         self.final_layout = QVBoxLayout(self.final_widget)
-        self.final_question_label = QLabel()
-        self.final_question_label.setAlignment(Qt.AlignCenter)
-        self.final_question_label.setWordWrap(True)
-        self.final_question_label.setStyleSheet("font-size: 24px; color: white;")
+        self.final_question_label = FitLabel(min_px=16)
+        self.final_question_label.setStyleSheet("color: white;")
         self.final_layout.addWidget(self.final_question_label)
+        self.final_tally = QLabel("")
+        self.final_tally.setAlignment(Qt.AlignCenter)
+        self.final_tally.setStyleSheet("font-size: 20px; color: gold;")
+        self.final_layout.addWidget(self.final_tally)
         self.stack.addWidget(self.final_widget)
 
-        self.video_player = QMediaPlayer()
-        self.video_widget = QVideoWidget()
-        self.video_player.setVideoOutput(self.video_widget)
-        self.stack.addWidget(self.video_widget)
+        # Created by get_video_widget() when the first video clue plays
+        self.video_widget = None
+        self.player_pool = MediaPlayerPool(parent=self)
 
-        self.audio_player = QMediaPlayer()
-
-        self.setStyleSheet("background-color: #060CE9;")
+        self.setStyleSheet("QWidget { background-color: #060CE9; }" + BOARD_STYLESHEET)
+        self.busy = BusyOverlay(self)
 
     def keyPressEvent(self, event: QKeyEvent):
         if event.key() == Qt.Key_Escape:
@@ -96,165 +128,183 @@ class PlayGamePage(QWidget):
         box.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
         box.setIcon(QMessageBox.Question)
         if box.exec() == QMessageBox.Yes:
+            self.close_buzzers()
+            if self.final_intake is not None:
+                self.final_intake.close()
+            self.player_pool.release_all()
             self.return_callback()
 
     def load_game(self, game_path):
+        """ Read the game on the I/O thread; the first round is shown when it arrives. """
         self.current_game_path = game_path
-        order_file = os.path.join(game_path, "order.csv")
-        if not os.path.exists(order_file):
-            print(f"Missing order.csv in {game_path}")
-            return
-
-        with open(order_file, newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            self.rounds = [row[0].replace('.csv', '') for row in reader if row]
-
-        self.round_data = {}
-        for round_name in self.rounds:
-            round_file = os.path.join(game_path, f"{round_name}.csv")
-            if not os.path.exists(round_file):
-                continue
-            with open(round_file, newline='', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                rows = list(reader)
-                if round_name.lower() == 'final':
-                    category = rows[0][0] if rows and rows[0] else "Final Jeopardy"
-                    question = rows[1][0] if len(rows) > 1 and rows[1] else "No question provided."
-                    self.round_data[round_name] = {
-                        "categories": [category],
-                        "questions": {category: [{"question": question}]}
-                    }
-                else:
-                    categories = rows[0]
-                    questions = {cat: [] for cat in categories}
-                    for row in rows[1:]:
-                        for i, val in enumerate(row):
-                            try:
-                                q = eval(val) if val.strip().startswith('{') else {"question": val}
-                            except:
-                                q = {"question": val}
-                            questions[categories[i]].append(q)
-                    self.round_data[round_name] = {
-                        "categories": categories,
-                        "questions": questions
-                    }
-
-        self.current_round_index = 0
-        self.selected_questions.clear()
-        self.daily_doubles.clear()
-        self.build_board()
-
-    def build_board(self):
-        for i in reversed(range(self.board_layout.count())):
-            widget = self.board_layout.itemAt(i).widget()
-            if widget:
-                widget.setParent(None)
-
-        round_name = self.rounds[self.current_round_index]
-        data = self.round_data[round_name]
-        categories = data['categories']
-        questions = data['questions']
-        self.questions_remaining = sum(len(questions[cat]) for cat in categories)
-
-        fixed_width = 160
-        category_height = 80
-        button_height = 80
-
-        for col, category in enumerate(categories):
-            label = QLabel(self.wrap_text(category, 15))
-            label.setAlignment(Qt.AlignCenter)
-            label.setWordWrap(True)
-            label.setFixedSize(fixed_width, category_height)
-            label.setStyleSheet("""
-                font-size: 18px;
-                color: white;
-                padding: 6px;
-                border: 2px solid #ffffff;
-                background-color: #000099;
-            """)
-            self.board_layout.addWidget(label, 0, col)
-
-        for row in range(5):
-            for col, category in enumerate(categories):
-                q_list = questions.get(category, [])
-                if row < len(q_list):
-                    value = (row + 1) * 200
-                    if self.rounds[self.current_round_index] == "double":
-                        value *= 2
-                    btn = QPushButton(f"${value}")
-                    btn.setFixedSize(fixed_width, button_height)
-                    btn.setStyleSheet("""
-                        QPushButton {
-                            background-color: #0000cc;
-                            color: gold;
-                            font-size: 20px;
-                            font-weight: bold;
-                            border: 2px solid white;
-                        }
-                        QPushButton:hover {
-                            background-color: #0000ff;
-                        }
-                        QPushButton:disabled {
-                            background-color: #222;
-                            color: #888;
-                            border: 2px solid gray;
-                        }
-                    """)
-                    btn.clicked.connect(lambda _, c=category, r=row: self.show_question(c, r))
-                    self.board_layout.addWidget(btn, row + 1, col)
-                else:
-                    spacer = QLabel("")
-                    spacer.setFixedSize(fixed_width, button_height)
-                    self.board_layout.addWidget(spacer, row + 1, col)
-
+        if self.load_job is not None:
+            job, self.load_job = self.load_job, None
+            job.cancel()
+        if self.current_pack is not None:
+            self.current_pack.close()
+            self.current_pack = None
+        self.rendition_widths.clear()
+        self.engine = None
+        self.board_widget.show_round(None)
         self.stack.setCurrentWidget(self.board_widget)
 
-    def wrap_text(self, text, max_chars):
-        if len(text) <= max_chars:
-            return text
+        def read_game(job):
+            rounds, round_data = load_game_data(game_path)
+            job.check()
+            pack = GamePack(game_path) if is_game_pack(game_path) else None
+            return rounds, round_data, pack
 
-        words = text.split()
-        lines = []
-        current_line = ""
+        self.load_job = get_io_executor().submit(
+            "load_game", f"Loading {os.path.basename(game_path)}...", read_game
+        )
+        self.load_job.finished.connect(self.start_game)
+        self.load_job.failed.connect(self.on_load_failed)
+        self.load_job.cancelled.connect(self.on_load_cancelled)
+        self.busy.track(self.load_job)
+
+    @traced("play.load_game")
+    def start_game(self, loaded):
+        if self.sender() is not self.load_job:
+            return
+        self.load_job = None
+        rounds, round_data, self.current_pack = loaded
+        self.engine = GameEngine(rounds, round_data)
+        self.engine.start()
+        self.build_board()
 
-        for word in words:
-            if len(current_line) + len(word) + 1 <= max_chars:
-                if current_line:
-                    current_line += " "
-                current_line += word
-            else:
-                lines.append(current_line)
-                current_line = word
+    def on_load_failed(self, error):
+        if self.sender() is not self.load_job:
+            return
+        self.load_job = None
+        print(f"Failed to load game {self.current_game_path}: {error}")
+        self.return_callback()
 
-        if current_line:
-            lines.append(current_line)
+    def on_load_cancelled(self):
+        if self.sender() is not self.load_job:
+            return
+        self.load_job = None
+        self.return_callback()
 
-        return '\n'.join(lines)
+    @traced("play.build_board")
+    def build_board(self):
+        round_name = self.engine.round_name
+        self.board_widget.show_round(self.engine.board)
+        if self.scoreboard is not None:
+            self.scoreboard.round_started(round_name, self.engine.board)
 
-    def show_question(self, category, index):
-        round_name = self.rounds[self.current_round_index]
-        key = (category, index)
-        question_data = self.round_data[round_name]["questions"][category][index]
+        self.stack.setCurrentWidget(self.board_widget)
+        self.prefetch_round_images(round_name)
+        self.preload_round_media(round_name)
+
+    def prefetch_round_images(self, round_name):
+        width = self.media_display_width()
+        sources = []
+        for clue in self.engine.round_data[round_name].clues:
+            if clue is None or not clue.media or not clue.media.lower().endswith(IMAGE_EXTENSIONS):
+                continue
+            key, source = self.image_source(round_name, clue.media, width)
+            if key is not None and key not in self.media_cache:
+                sources.append((key, source() if callable(source) else source))
+        self.image_prefetcher.prefetch(sources, self.devicePixelRatioF())
+
+    def preload_round_media(self, round_name):
+        # Top rows are usually picked first, so arm players row by row, left to right
+        items = []
+        for clue in self.engine.round_data[round_name].clues:
+            if clue is not None and clue.media and clue.media.lower().endswith(AUDIO_EXTENSIONS + VIDEO_EXTENSIONS):
+                key, source = self.playback_source(round_name, clue.media)
+                if key is not None:
+                    items.append((key, source))
+        self.player_pool.preload(items)
+
+    def playback_source(self, round_name, media):
+        """ Return (pool_key, source) for an audio or video clue, or (None, None) if it can't be found. """
+        if self.current_pack is not None:
+            if not self.current_pack.has_media(round_name, media):
+                return None, None
+            return f"{self.current_pack.path}::{round_name}/{media}", lambda: self.current_pack.media_bytes(round_name, media)
+
+        media_path = resolve_media(media, os.path.join(self.current_game_path, round_name))
+        if media_path is None:
+            return None, None
+        return media_path, media_path
+
+    def get_video_widget(self):
+        if self.video_widget is None:
+            from PySide6.QtMultimediaWidgets import QVideoWidget
+            self.video_widget = QVideoWidget()
+            self.stack.addWidget(self.video_widget)
+        return self.video_widget
+
+    def hide_video(self):
+        if self.video_widget is not None:
+            self.video_widget.hide()
 
-        if key in self.selected_questions:
+    def play_media(self, round_name, media, video):
+        key, source = self.playback_source(round_name, media)
+        video_output = self.get_video_widget() if video else None
+        if video_output is not None:
+            video_output.show()
+        self.player_pool.play(key, source, video_output)
+
+    def media_display_width(self):
+        # Images are shown 400px wide; on high-DPI screens that takes more physical pixels
+        return round(400 * self.devicePixelRatioF())
+
+    def rendition_width(self, name, source):
+        if name not in self.rendition_widths:
+            self.rendition_widths[name] = image_width(source())
+        return self.rendition_widths[name]
+
+    def image_source(self, round_name, media, width):
+        """ Return (cache_key, source) for the smallest rendition of an image clue that covers width. """
+        if self.current_pack is not None:
+            if not self.current_pack.has_media(round_name, media):
+                return None, None
+            member = best_rendition(
+                width, lambda name: self.current_pack.has_media(round_name, name), media,
+                lambda name: self.rendition_width(
+                    f"{round_name}/{name}", lambda: self.current_pack.media_bytes(round_name, name)),
+            )
+            key = media_key(self.current_pack.path, width, f"{round_name}/{member}")
+            return key, lambda: self.current_pack.media_bytes(round_name, member)
+
+        media_path = resolve_media(media, os.path.join(self.current_game_path, round_name))
+        if media_path is None:
+            return None, None
+        folder = os.path.dirname(media_path)
+        source = os.path.join(folder, best_rendition(
+            width, lambda name: os.path.isfile(os.path.join(folder, name)), os.path.basename(media_path),
+            lambda name: self.rendition_width(os.path.join(folder, name), lambda: os.path.join(folder, name)),
+        ))
+        return media_key(source, width), source
+
+    def show_image(self, round_name, media):
+        width = self.media_display_width()
+        key, source = self.image_source(round_name, media, width)
+        pixmap = self.media_cache.pixmap(key, source, self.devicePixelRatioF()) if key is not None else None
+        if pixmap is None:
+            self.media_label.setText(f"⚠️ Media not found: {media}")
             return
+        self.media_label.setPixmap(pixmap)
 
-        self.selected_questions.add(key)
-        self.questions_remaining -= 1
-
-        if not self.daily_doubles and self.questions_remaining <= (
-            len(self.round_data[round_name]["categories"]) * 5 - 1
-        ):
-            self.assign_daily_doubles()
+    def show_question(self, index):
+        daily_double = self.engine.pick(index)
+        if daily_double is None:
+            return
+        if self.scoreboard is not None:
+            self.scoreboard.cell_used(index)
+            if daily_double:
+                self.scoreboard.clue_shown({"index": index, "daily_double": True})
 
-        if key in self.daily_doubles:
+        if daily_double:
             self.transition_label.setText("🎯 Daily Double!")
             self.stack.setCurrentWidget(self.transition_widget)
 
             def proceed():
                 self.transition_widget.mousePressEvent = lambda event: None
                 self.transition_widget.keyPressEvent = lambda event: None
-                self.display_question(category, index)
+                self.display_question(index, daily_double=True)
 
             self.transition_widget.mousePressEvent = lambda event: (
                 proceed() if event.button() == Qt.LeftButton else None
@@ -265,103 +315,149 @@ class PlayGamePage(QWidget):
 
             self.transition_widget.setFocus()
         else:
-            self.display_question(category, index)
-
-    def display_question(self, category, index):
-        round_name = self.rounds[self.current_round_index]
-        question_data = self.round_data[round_name]["questions"][category][index]
-        raw_text = question_data.get("question", "")
-        media = None
-
-        media_match = re.search(r"\[media:(.+?)\]", raw_text)
-        if media_match:
-            media = media_match.group(1)
-            raw_text = re.sub(r"\[media:.+?\]", "", raw_text).strip()
-
-        self.question_label.setText(raw_text)
+            self.display_question(index)
+
+    @traced("play.display_question")
+    def display_question(self, index, daily_double=False):
+        started = time.perf_counter()
+        round_name = self.engine.round_name
+        clue = self.engine.board.clues[index]
+        media = clue.media
+
+        self.question_label.setText(clue.text)
+        if self.scoreboard is not None:
+            self.scoreboard.clue_shown({
+                "index": index, "text": clue.text, "value": self.engine.board.value(index),
+                "category": self.engine.board.categories[index % self.engine.board.cols],
+            })
+        self.gif_animator.stop()
         self.media_label.clear()
         
         # Stop any playing media first
-        self.video_player.stop()
-        self.video_widget.hide()  # hide video widget if visible
-        self.audio_player.stop()
-
-        if media:
-            media_path = os.path.join(self.current_game_path, round_name, media)
-            if os.path.exists(media_path):
+        self.player_pool.stop()
+        self.hide_video()
+
+        if media and self.current_pack is not None:
+            self.display_packed_media(round_name, media)
+        elif media:
+            media_path = resolve_media(media, os.path.join(self.current_game_path, round_name))
+            if media_path:
                 ext = os.path.splitext(media_path)[1].lower()
 
                 if ext in [".png", ".jpg", ".jpeg", ".bmp"]:
-                    pixmap = QPixmap(media_path)
-                    self.media_label.setPixmap(pixmap.scaledToWidth(400, Qt.SmoothTransformation))
+                    self.show_image(round_name, media)
 
                 elif ext == ".gif":
-                    movie = QMovie(media_path)
-                    self.media_label.setMovie(movie)
-                    movie.start()
+                    frames = self.media_cache.animation(media_key(media_path, None), media_path)
+                    if frames is not None:
+                        self.gif_animator.play(self.media_label, frames)
 
-                elif ext in [".mp4", ".mov", ".avi"]:
-                    self.video_player.setSource(QUrl.fromLocalFile(media_path))
-                    self.video_widget.show()
-                    self.video_player.play()
+                elif ext in VIDEO_EXTENSIONS:
+                    self.play_media(round_name, media, video=True)
 
-                elif ext in [".mp3", ".wav"]:
-                    self.audio_player.setSource(QUrl.fromLocalFile(media_path))
-                    self.audio_player.play()  # <-- Make sure this line is here!
+                elif ext in AUDIO_EXTENSIONS:
+                    self.play_media(round_name, media, video=False)
 
                 else:
                     self.media_label.setText(f"⚠️ Unsupported media format: {media}")
             else:
                 self.media_label.setText(f"⚠️ Media not found: {media}")
 
+        # Only the contestant who found a daily double answers it
+        if daily_double:
+            self.buzz_label.clear()
+        else:
+            self.open_buzzers()
+
         self.stack.setCurrentWidget(self.question_widget)
+        self.clue_latencies.append((media, (time.perf_counter() - started) * 1000))
 
         def handle_return():
             self.question_widget.mousePressEvent = lambda event: None
             self.question_widget.keyPressEvent = lambda event: None
-            self.video_player.stop()
-            self.audio_player.stop()
-            self.video_widget.hide()
-            self.return_to_board(category, index)
+            self.gif_animator.stop()
+            self.media_label.clear()
+            self.player_pool.stop()
+            self.hide_video()
+            self.close_buzzers()
+            self.return_to_board(index)
+
+        def key_handler(event):
+            if event.key() in (Qt.Key_Return, Qt.Key_Enter):
+                handle_return()
+            elif event.key() == Qt.Key_Space and not daily_double:
+                self.reopen_buzzers()
 
         self.question_widget.mousePressEvent = lambda event: (
             handle_return() if event.button() == Qt.LeftButton else None
         )
-        self.question_widget.keyPressEvent = lambda event: (
-            handle_return() if event.key() in (Qt.Key_Return, Qt.Key_Enter) else None
-        )
+        self.question_widget.keyPressEvent = key_handler
 
         self.question_widget.setFocus()
 
 
-    def return_to_board(self, category, index):
-        for i in range(self.board_layout.count()):
-            widget = self.board_layout.itemAt(i).widget()
-            if isinstance(widget, QPushButton):
-                row, col = self.board_layout.getItemPosition(i)[:2]
-                cat = self.round_data[self.rounds[self.current_round_index]]["categories"][col]
-                if cat == category and row - 1 == index:
-                    widget.setDisabled(True)
-                    break
+    def open_buzzers(self):
+        if self.buzzers is None:
+            return
+        self.clue_number += 1
+        self.buzz_label.setText("Buzzers open")
+        self.buzzers.open(self.clue_number)
+
+    def reopen_buzzers(self):
+        """ After a wrong answer: let everyone who hasn't buzzed in on this clue try again. """
+        if self.buzzers is None:
+            return
+        self.buzz_label.setText("Buzzers open")
+        self.buzzers.reopen(self.clue_number)
+
+    def close_buzzers(self):
+        if self.buzzers is not None:
+            self.buzzers.close()
+        self.buzz_label.clear()
+
+    def on_buzzed(self, result):
+        if result["clue"] != self.clue_number or self.stack.currentWidget() is not self.question_widget:
+            return
+        self.buzzers.record_winner(result["winner"])
+        self.buzz_label.setText(f"🔔 {result['winner']}")
+
+    def display_packed_media(self, round_name, media):
+        if not self.current_pack.has_media(round_name, media):
+            self.media_label.setText(f"⚠️ Media not found: {media}")
+            return
+
+        ext = os.path.splitext(media)[1].lower()
+        if ext in [".png", ".jpg", ".jpeg", ".bmp"]:
+            self.show_image(round_name, media)
+            return
+
+        if ext == ".gif":
+            key = media_key(self.current_pack.path, None, f"{round_name}/{media}")
+            frames = self.media_cache.animation(key, lambda: self.current_pack.media_bytes(round_name, media))
+            if frames is not None:
+                self.gif_animator.play(self.media_label, frames)
+            return
+
+        if ext not in VIDEO_EXTENSIONS + AUDIO_EXTENSIONS:
+            self.media_label.setText(f"⚠️ Unsupported media format: {media}")
+            return
+
+        self.play_media(round_name, media, video=ext in VIDEO_EXTENSIONS)
+
+    def return_to_board(self, index):
+        self.board_widget.refresh_cell(index)
+        if self.scoreboard is not None:
+            self.scoreboard.clue_closed()
 
         self.stack.setCurrentWidget(self.board_widget)
 
-        if self.questions_remaining == 0:
-            if self.current_round_index + 1 < len(self.rounds):
-                self.transition_to_round(self.rounds[self.current_round_index + 1])
+        if self.engine.is_round_over():
+            next_round = self.engine.next_round()
+            if next_round is not None:
+                self.transition_to_round(next_round)
             else:
                 self.transition_to_final_jeopardy()
 
-    def assign_daily_doubles(self):
-        current_data = self.round_data[self.rounds[self.current_round_index]]
-        keys = [
-            (cat, i)
-            for cat in current_data["questions"]
-            for i in range(len(current_data["questions"][cat]))
-            if (cat, i) not in self.selected_questions
-        ]
-        self.daily_doubles = random.sample(keys, 2)
-
     def transition_to_round(self, next_round):
         self.transition_label.setText(f"{next_round.capitalize()} is beginning!")
         self.stack.setCurrentWidget(self.transition_widget)
@@ -373,17 +469,18 @@ class PlayGamePage(QWidget):
 
 
     def start_round(self, round_name):
-        self.current_round_index += 1
-        self.selected_questions.clear()
-        self.daily_doubles.clear()
-
-        if round_name.lower() == "final":
-            self.transition_to_final_jeopardy()
-        else:
+        self.player_pool.release_all()
+        if self.engine.advance():
             self.build_board()
+        else:
+            self.transition_to_final_jeopardy()
 
 
     def transition_to_final_jeopardy(self):
+        self.image_prefetcher.clear()
+        self.player_pool.release_all()
+        if self.scoreboard is not None:
+            self.scoreboard.round_started("final")
         self.transition_label.setText("Final Jeopardy is beginning!")
         self.stack.setCurrentWidget(self.transition_widget)
 
@@ -391,25 +488,34 @@ class PlayGamePage(QWidget):
 
 
     def show_final_category(self):
-        final_data = self.round_data["final"]
-        category = final_data['categories'][0]
+        category = self.engine.final_category()
         self.final_category_label.setText(f"Final Jeopardy Category:\n{category}")
+        self.final_category_tally.clear()
+        self.final_tally.clear()
+        if self.scoreboard is not None:
+            self.scoreboard.clue_shown({"category": category})
+        if self.final_intake is not None:
+            self.final_intake.open_wagers(category)
         self.stack.setCurrentWidget(self.final_category_widget)
 
         self.wait_for_user_input(self.show_final_question)
 
 
     def show_final_question(self):
-        final_data = self.round_data["final"]
-        category = final_data['categories'][0]
-        question = final_data['questions'][category][0]['question']
+        question = self.engine.final_question()
         self.final_question_label.setText(question)
+        if self.scoreboard is not None:
+            self.scoreboard.clue_shown({"category": self.engine.final_category(), "text": question})
+        if self.final_intake is not None:
+            self.final_intake.open_responses(question)
         self.stack.setCurrentWidget(self.final_widget)
 
         # Add this to allow user input to return to main menu
         def finish():
             self.final_widget.mousePressEvent = lambda event: None
             self.final_widget.keyPressEvent = lambda event: None
+            if self.final_intake is not None:
+                self.final_intake.close()
             self.return_callback()
 
         self.final_widget.mousePressEvent = lambda event: (
@@ -422,6 +528,12 @@ class PlayGamePage(QWidget):
         self.final_widget.setFocus()
 
 
+    def on_final_tally(self, tally):
+        text = tally_text(tally)
+        self.final_category_tally.setText(text)
+        self.final_tally.setText(text)
+
+
     def wait_for_user_input(self, callback):
         def mouse_handler(event):
             if event.button() == Qt.LeftButton:
@@ -0,0 +1,115 @@
+import os
+from collections import OrderedDict
+from PySide6.QtCore import QObject, QUrl, QBuffer, QByteArray, QElapsedTimer
+
+AUDIO_EXTENSIONS = (".mp3", ".wav")
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".avi")
+
+
+class _PooledPlayer:
+    def __init__(self, parent):
+        # Imported on first use: loading the multimedia backend is a large share of cold start
+        from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+        self.player = QMediaPlayer(parent)
+        self.audio_output = QAudioOutput(parent)
+        self.player.setAudioOutput(self.audio_output)
+        self.buffer = None
+        self.key = None
+
+
+class MediaPlayerPool(QObject):
+    """ Keeps QMediaPlayers loaded with the round's upcoming audio and video clues so playback starts at once.
+
+    Clues are armed in the order given to preload(), at most `size` at a time; whenever one is
+    played the next clue in line is loaded in its place.
+    """
+
+    def __init__(self, size=4, parent=None):
+        super().__init__(parent)
+        self.size = size
+        self.idle = []
+        self.armed = OrderedDict()
+        self.queue = []
+        self.active = None
+        self.timer = QElapsedTimer()
+        self.waiting = None
+        # (key, milliseconds from play() to the first position update, was it preloaded)
+        self.start_latencies = []
+
+    def _take_idle(self):
+        if self.idle:
+            return self.idle.pop()
+        pooled = _PooledPlayer(self)
+        pooled.player.positionChanged.connect(lambda position, p=pooled: self.on_position(p, position))
+        return pooled
+
+    def _load(self, pooled, key, source):
+        if callable(source):
+            source = source()
+        pooled.key = key
+        if isinstance(source, (bytes, bytearray)):
+            # The player streams from the device, so it has to live as long as the player holds it
+            pooled.buffer = QBuffer()
+            pooled.buffer.setData(QByteArray(source))
+            pooled.buffer.open(QBuffer.ReadOnly)
+            # The URL only hints the container format to the backend
+            pooled.player.setSourceDevice(pooled.buffer, QUrl(os.path.basename(key)))
+        else:
+            pooled.buffer = None
+            pooled.player.setSource(QUrl.fromLocalFile(source))
+
+    def _release(self, pooled):
+        pooled.player.stop()
+        pooled.player.setVideoOutput(None)
+        pooled.player.setSource(QUrl())
+        pooled.buffer = None
+        pooled.key = None
+        self.idle.append(pooled)
+
+    def _fill(self):
+        while self.queue and len(self.armed) < self.size:
+            key, source = self.queue.pop(0)
+            pooled = self._take_idle()
+            self._load(pooled, key, source)
+            self.armed[key] = pooled
+
+    def preload(self, items):
+        """ Arm players for (key, path_or_bytes_or_callable) items, most likely to be played first. """
+        self.release_all()
+        self.queue = list(items)
+        self._fill()
+
+    def play(self, key, source, video_output=None):
+        self.stop()
+        pooled = self.armed.pop(key, None)
+        preloaded = pooled is not None
+        if pooled is None:
+            self.queue = [item for item in self.queue if item[0] != key]
+            pooled = self._take_idle()
+            self._load(pooled, key, source)
+
+        self.active = pooled
+        pooled.player.setVideoOutput(video_output)
+        self.waiting = (key, preloaded)
+        self.timer.start()
+        pooled.player.play()
+        self._fill()
+
+    def on_position(self, pooled, position):
+        if pooled is self.active and self.waiting is not None and position > 0:
+            key, preloaded = self.waiting
+            self.start_latencies.append((key, self.timer.elapsed(), preloaded))
+            self.waiting = None
+
+    def stop(self):
+        if self.active is not None:
+            self._release(self.active)
+            self.active = None
+        self.waiting = None
+
+    def release_all(self):
+        self.stop()
+        for pooled in self.armed.values():
+            self._release(pooled)
+        self.armed.clear()
+        self.queue = []
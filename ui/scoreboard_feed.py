@@ -0,0 +1,46 @@
+from PySide6.QtCore import QCoreApplication
+from ui.live_service import start_service
+
+
+class ScoreboardFeed:
+    """ What the play page tells the lobby displays. Each call queues one event for the scoreboard thread. """
+
+    def __init__(self, port):
+        from scoreboard import ScoreboardService
+        self.service = ScoreboardService(port)
+        self.port = self.service.start()
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.service.stop)
+
+    def round_started(self, round_name, board=None):
+        """ A new board (or Final Jeopardy, with no board) is up; displays clear their played cells. """
+        from scoreboard import round_event
+        self.service.publish({"round": round_event(round_name, board)})
+
+    def cell_used(self, index):
+        self.service.publish({"used": [index]})
+
+    def clue_shown(self, clue):
+        self.service.publish({"clue": clue})
+
+    def clue_closed(self):
+        self.service.publish({"clue": None})
+
+    def scores_changed(self, scores):
+        self.service.publish({"scores": dict(scores)})
+
+
+_scoreboard = None
+
+
+def configure(argv):
+    """ Start the scoreboard from --scoreboard [port] in argv or the JEOPARDY_SCOREBOARD environment variable. """
+    global _scoreboard
+    _scoreboard = start_service("Scoreboard", argv, "--scoreboard", "JEOPARDY_SCOREBOARD", ScoreboardFeed)
+    return _scoreboard
+
+
+def get_scoreboard():
+    """ The running scoreboard, or None when the app was started without it. """
+    return _scoreboard
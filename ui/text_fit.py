@@ -0,0 +1,124 @@
+from functools import lru_cache
+from PySide6.QtWidgets import QLabel, QHeaderView, QStyle, QStyleOptionHeader
+from PySide6.QtCore import Qt, QRect, QSize
+from PySide6.QtGui import QFont, QFontMetrics, QColor
+
+MIN_PIXEL_SIZE = 10
+MAX_PIXEL_SIZE = 96
+FIT_FLAGS = Qt.AlignCenter | Qt.TextWordWrap
+
+
+@lru_cache(maxsize=4096)
+def _fit_pixel_size(text, font_key, width, height, min_px, max_px):
+    font = QFont()
+    font.fromString(font_key)
+    best = min_px
+    low, high = min_px, max_px
+    while low <= high:
+        size = (low + high) // 2
+        font.setPixelSize(size)
+        rect = QFontMetrics(font).boundingRect(0, 0, width, height, FIT_FLAGS, text)
+        if rect.width() <= width and rect.height() <= height:
+            best = size
+            low = size + 1
+        else:
+            high = size - 1
+    return best
+
+
+def fit_pixel_size(text, font, width, height, min_px=MIN_PIXEL_SIZE, max_px=MAX_PIXEL_SIZE):
+    """ Largest pixel size at which text, word-wrapped, fits in width x height.
+
+    Results are cached by (text, font, rectangle), so refitting a board or a
+    resized window only measures text that hasn't been seen at that size.
+    """
+    if not text or width <= 0 or height <= 0:
+        return min_px
+    return _fit_pixel_size(text, font.toString(), width, height, min_px, max_px)
+
+
+def fitted_font(text, font, width, height, min_px=MIN_PIXEL_SIZE, max_px=MAX_PIXEL_SIZE):
+    fitted = QFont(font)
+    fitted.setPixelSize(fit_pixel_size(text, font, width, height, min_px, max_px))
+    return fitted
+
+
+class FitLabel(QLabel):
+    """ A word-wrapped label whose font grows or shrinks to fill its rectangle. """
+
+    def __init__(self, text="", min_px=MIN_PIXEL_SIZE, max_px=MAX_PIXEL_SIZE, parent=None):
+        super().__init__(text, parent)
+        self.min_px = min_px
+        self.max_px = max_px
+        # Fitting is keyed on this rather than self.font(), which carries the last fitted size
+        self.base_font = QFont(self.font())
+        self.base_font.setPixelSize(max_px)
+        self.setWordWrap(True)
+        self.setAlignment(Qt.AlignCenter)
+
+    def minimumSizeHint(self):
+        # The font follows the label's size, so the label must not grow to fit its font
+        return QSize(1, 1)
+
+    def hasHeightForWidth(self):
+        return False
+
+    def setText(self, text):
+        super().setText(text)
+        self.refit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.refit()
+
+    def refit(self):
+        rect = self.contentsRect()
+        if not self.text() or rect.isEmpty():
+            return
+        size = fit_pixel_size(self.text(), self.base_font, rect.width(), rect.height(), self.min_px, self.max_px)
+        if size != self.font().pixelSize():
+            font = QFont(self.base_font)
+            font.setPixelSize(size)
+            self.setFont(font)
+
+
+class FitHeaderView(QHeaderView):
+    """ Horizontal header that draws each section's title at the largest size that fits the section. """
+
+    def __init__(self, padding=8, max_px=28, parent=None):
+        super().__init__(Qt.Horizontal, parent)
+        self.padding = padding
+        self.max_px = max_px
+        self.text_color = QColor("white")
+
+    def title_rect(self, rect):
+        return rect.adjusted(self.padding, self.padding, -self.padding, -self.padding)
+
+    def fit_titles(self):
+        """ Measure every title up front, e.g. on round start, so painting only hits the cache. """
+        model = self.model()
+        if model is None:
+            return
+        for section in range(model.columnCount()):
+            area = self.title_rect(QRect(0, 0, self.sectionSize(section), self.height()))
+            text = model.headerData(section, Qt.Horizontal)
+            fit_pixel_size(text, self.font(), area.width(), area.height(), MIN_PIXEL_SIZE, self.max_px)
+
+    def paintSection(self, painter, rect, section):
+        if not rect.isValid():
+            return
+        option = QStyleOptionHeader()
+        self.initStyleOption(option)
+        option.rect = rect
+        option.section = section
+        self.style().drawControl(QStyle.CE_HeaderSection, option, painter, self)
+
+        text = self.model().headerData(section, Qt.Horizontal)
+        if not text:
+            return
+        area = self.title_rect(rect)
+        painter.save()
+        painter.setFont(fitted_font(text, self.font(), area.width(), area.height(), MIN_PIXEL_SIZE, self.max_px))
+        painter.setPen(self.text_color)
+        painter.drawText(area, FIT_FLAGS, text)
+        painter.restore()